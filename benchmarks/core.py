@@ -0,0 +1,259 @@
+"""
+Speed of the core board operations on every board size.
+
+Usage: python -m benchmarks.core [--sizes 9 19] [--games 3]
+       [--seed 0] [--min-time 0.2] [--output results.json]
+       [--baseline benchmarks/baseline.json] [--tolerance 0.25]
+
+Every case runs on scripted games (points tried in a fixed order) and on
+random games, and reports operations per second and the p50 and p99
+latency of one operation in microseconds. Each case is repeated for at
+least --min-time seconds. The results are printed as JSON
+or written to --output. With --baseline, the cases are compared to stored
+results, and the exit status is 1 if one of them got slower by more than
+the tolerance.
+"""
+
+from collections.abc import Callable, Iterator
+from functools import partial
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+
+from weiqi import Board, Move, Position, RandomBot, Stone, WeiqiGame
+from weiqi.core.base_board import AVAILABLE_SIZES
+
+OTHER = {Stone.BLACK: Stone.WHITE, Stone.WHITE: Stone.BLACK}
+
+# Operations of a benchmark case, with the setup between them done lazily.
+Operations = Iterator[Callable[[], object]]
+
+
+def scripted_game(size: int) -> list[Move]:
+    """Tries every point once, in a fixed order, with alternating colors."""
+    count = size * size
+    step = next(step for step in (7, 11, 13) if math.gcd(step, count) == 1)
+    board = Board.generate_empty_board(size)
+    moves = []
+    stone = Stone.BLACK
+    for index in range(count):
+        number = index * step % count
+        move = Move(Position(number % size, number // size), stone)
+        try:
+            board.play(move)
+        except ValueError:
+            continue
+        moves.append(move)
+        stone = OTHER[stone]
+    return moves
+
+
+def random_game(size: int, rng: random.Random) -> list[Move]:
+    """Random legal moves, until neither color has one left."""
+    board = Board.generate_empty_board(size)
+    moves: list[Move] = []
+    stone = Stone.BLACK
+    passed = False
+    for _ in range(size * size * 2):
+        positions = board.legal_moves(stone)
+        if positions:
+            move = Move(rng.choice(positions), stone)
+            board.play(move)
+            moves.append(move)
+        elif passed:
+            break
+        passed = not positions
+        stone = OTHER[stone]
+    return moves
+
+
+def place_figure(size: int, game: list[Move]) -> Operations:
+    board = Board.generate_empty_board(size)
+    for move in game:
+        yield partial(board.place_figure, move)
+
+
+def chain_at(size: int, game: list[Move]) -> Operations:
+    board = Board.generate_empty_board(size)
+    for move in game:
+        board.play(move)
+    for position, stone in board.figures.items():
+        if stone is not None:
+            yield partial(board.chain_at, position)
+
+
+def find_territories(size: int, game: list[Move]) -> Operations:
+    # Read after every move, like a display does.
+    board = Board.generate_empty_board(size)
+    for move in game:
+        board.play(move)
+        yield board.find_territories
+
+
+def score(size: int, game: list[Move]) -> Operations:
+    board = Board.generate_empty_board(size)
+    for move in game:
+        board.play(move)
+        yield lambda: board.score
+
+
+def board_init(size: int, game: list[Move]) -> Operations:
+    board = Board.generate_empty_board(size)
+    for number, move in enumerate(game):
+        board.play(move)
+        if number % 10 == 0:
+            figures = dict(board.figures)
+            yield partial(Board, figures)
+
+
+def random_bot_move(size: int, game: list[Move]) -> Operations:
+    # Only the size of the game is used: the bots choose their moves.
+    black = RandomBot(Stone.BLACK)
+    white = RandomBot(Stone.WHITE)
+    weiqi_game = WeiqiGame(
+        Board.generate_empty_board(size), black, white, headless=True
+    )
+    for _ in range(size * size * 2):
+        if weiqi_game.game_status.is_over:
+            return
+        bot = weiqi_game.get_current_player()
+        assert isinstance(bot, RandomBot)
+        yield partial(bot.make_move, weiqi_game)
+
+
+CASES = {
+    "place_figure": place_figure,
+    "chain_at": chain_at,
+    "find_territories": find_territories,
+    "score": score,
+    "board_init": board_init,
+    "random_bot_move": random_bot_move,
+}
+
+
+def measure(
+    case: Callable[[int, list[Move]], Operations],
+    size: int,
+    games: list[list[Move]],
+    min_time: float,
+) -> dict[str, float]:
+    """
+    Times every operation of the case on the games, one by one.
+
+    The games are run again until the operations took ``min_time`` seconds
+    in total. Setting up an operation, like playing the moves before it, is
+    not timed.
+    """
+    latencies: list[int] = []
+    clock = time.perf_counter_ns
+    total = 0
+    while True:
+        for game in games:
+            for operation in case(size, game):
+                start = clock()
+                operation()
+                latencies.append(clock() - start)
+        total = sum(latencies)
+        if total >= min_time * 1e9 or not latencies:
+            break
+    latencies.sort()
+    total = total or 1
+    return {
+        "operations": len(latencies),
+        "ops_per_sec": round(len(latencies) / total * 1e9, 1),
+        "p50_us": round(_percentile(latencies, 0.5) / 1e3, 2),
+        "p99_us": round(_percentile(latencies, 0.99) / 1e3, 2),
+    }
+
+
+def _percentile(values: list[int], fraction: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def run(sizes: list[int], games: int, seed: int, min_time: float) -> dict:
+    results = {}
+    for size in sizes:
+        # Games of a size do not depend on the other sizes run.
+        rng = random.Random(seed * 100 + size)
+        # RandomBot draws from the random module.
+        random.seed(seed * 100 + size)
+        kinds = {
+            "scripted": [scripted_game(size)] * games,
+            "random": [random_game(size, rng) for _ in range(games)],
+        }
+        for name, case in CASES.items():
+            for kind, kind_games in kinds.items():
+                if name == "random_bot_move" and kind == "scripted":
+                    continue
+                key = f"{name}/{kind}/{size}"
+                results[key] = measure(case, size, kind_games, min_time)
+                print(key, results[key]["ops_per_sec"], file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "games": games,
+        "seed": seed,
+        "min_time": min_time,
+        "results": results,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Names of the cases slower than the baseline beyond the tolerance."""
+    regressions = []
+    for key, base in baseline["results"].items():
+        current = results["results"].get(key)
+        if current is None:
+            continue
+        ratio = current["ops_per_sec"] / base["ops_per_sec"]
+        flag = ""
+        if ratio < 1 - tolerance:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<36} {ratio:6.2f}x{flag}", file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=sorted(AVAILABLE_SIZES)
+    )
+    parser.add_argument("--games", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--output")
+    parser.add_argument("--baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+    if not set(args.sizes) <= AVAILABLE_SIZES:
+        parser.error(f"sizes must be in {sorted(AVAILABLE_SIZES)}")
+
+    results = run(args.sizes, args.games, args.seed, args.min_time)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regressions", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Playouts per second of the parallel MCTSBot search by number of workers.
+
+Usage: python -m benchmarks.mcts_workers [--size 9] [--time 2.0]
+       [--max 8]
+"""
+
+import argparse
+import os
+
+from weiqi import Board, MCTSBot, Player, Stone, WeiqiGame
+
+
+def measure(size: int, time_limit: float, workers: int) -> float:
+    with MCTSBot(
+        Stone.WHITE, playouts=None, time_limit=time_limit, workers=workers
+    ) as bot:
+        # The first search also starts the worker processes.
+        for _ in range(2):
+            game = WeiqiGame(
+                Board.generate_empty_board(size),
+                Player(Stone.BLACK),
+                bot,
+                turn=Stone.WHITE,
+            )
+            bot.make_move(game)
+        return bot.last_playouts / time_limit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--time", type=float, default=2.0)
+    parser.add_argument("--max", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    workers = 1
+    base = None
+    while workers <= args.max:
+        rate = measure(args.size, args.time, workers)
+        base = base or rate
+        print(
+            f"workers={workers:<3} playouts/s={rate:9.0f} "
+            f"speedup={rate / base:5.2f}"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ import time
 import sys
 
 from weiqi import WeiqiGame, Board, Player, Stone, Position, BaseBot, RandomBot
+from weiqi.core.geometry import star_points
 
 
 class WeiqiGUI:
@@ -90,28 +91,6 @@ class WeiqiGUI:
 
     def _draw_background(self):
         """Draw the board grid"""
-        STAR_POINTS_MAP = {
-            5: [],
-            6: [],
-            7: [],
-            8: [],
-            9: [(3, 3), (3, 7), (7, 3), (7, 7)],
-            11: [(3, 3), (3, 9), (9, 3), (9, 9), (6, 6)],
-            13: [(4, 4), (4, 10), (10, 4), (10, 10), (7, 7)],
-            15: [(4, 4), (4, 12), (12, 4), (12, 12), (8, 8)],
-            17: [(4, 4), (4, 14), (14, 4), (14, 14), (10, 10)],
-            19: [
-                (4, 4),
-                (4, 16),
-                (16, 4),
-                (16, 16),
-                (10, 10),
-                (4, 10),
-                (10, 4),
-                (10, 16),
-                (16, 10),
-            ],
-        }
         self.screen.fill(self.BOARD_COLOR)
 
         for i in range(self.board_size):
@@ -130,12 +109,14 @@ class WeiqiGUI:
                 2,
             )
 
-        star_points = STAR_POINTS_MAP.get(self.board_size, [])
-        for x, y in star_points:
+        for position in star_points(self.board_size):
             pygame.draw.circle(
                 self.screen,
                 self.LINE_COLOR,
-                (x * self.cell_size, y * self.cell_size),
+                (
+                    (position.x + 1) * self.cell_size,
+                    (position.y + 1) * self.cell_size,
+                ),
                 5,
             )
 
@@ -0,0 +1,110 @@
+import os
+import sys
+import tempfile
+import unittest
+
+from weiqi.arena import play_game
+from weiqi.core.figure import Stone
+from weiqi.core.move import Move
+from weiqi.core.position import Position
+from weiqi.players.bot import RandomBot
+from weiqi.records import (
+    Archive,
+    ArchiveWriter,
+    GameRecord,
+    replay_archive,
+    replay_games,
+    write_archive,
+)
+
+
+def _record(seed: int, size: int = 7) -> GameRecord:
+    result = play_game(RandomBot, RandomBot, size=size, seed=seed)
+    return GameRecord(
+        size=size,
+        komi=6.5,
+        moves=tuple(
+            Move(position, Stone.BLACK if index % 2 == 0 else Stone.WHITE)
+            for index, position in enumerate(result.moves)
+        ),
+        result="B+R" if seed % 2 else None,
+    )
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "games.wqa")
+
+    def test_round_trip(self):
+        records = [_record(seed) for seed in range(4)]
+        records.append(
+            GameRecord(
+                size=9,
+                komi=7,
+                black_stones=(Position(2, 2), Position(6, 6)),
+                white_stones=(Position(4, 4),),
+                moves=(Move(None, Stone.WHITE),),
+                result="0",
+            )
+        )
+        self.assertEqual(write_archive(records, self.path), 5)
+
+        with Archive(self.path) as archive:
+            self.assertEqual(len(archive), 5)
+            self.assertEqual(list(archive.records()), records)
+            game = archive[-1]
+            self.assertEqual((game.index, game.komi, game.result), (4, 7, "0"))
+            if sys.byteorder == "little":
+                self.assertIsInstance(game.moves, memoryview)
+            del game
+            with self.assertRaises(IndexError):
+                archive[5]
+
+    def test_board_and_samples(self):
+        record = _record(1, size=9)
+        write_archive([record], self.path)
+
+        with Archive(self.path) as archive:
+            game = archive[0]
+            self.assertEqual(
+                game.board().to_bytes(), record.to_game().board.to_bytes()
+            )
+            board = record.to_board()
+            for move in record.moves[:10]:
+                board.play(move)
+            self.assertEqual(game.board(10).to_bytes(), board.to_bytes())
+            del game
+
+            samples = archive.sample_positions(20, seed=3)
+            self.assertEqual(samples, archive.sample_positions(20, seed=3))
+            for index, moves in samples:
+                self.assertEqual(index, 0)
+                self.assertLessEqual(moves, len(record.moves))
+
+    def test_replay_archive(self):
+        records = [_record(seed) for seed in range(6)]
+        write_archive(records, self.path)
+
+        results = list(replay_archive(self.path, workers=2, batch_size=4))
+
+        self.assertEqual(
+            sorted(results, key=lambda result: result.index),
+            list(replay_games(records, workers=1)),
+        )
+
+    def test_invalid_data(self):
+        with ArchiveWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.add(GameRecord(size=5, moves=_record(0).moves))
+            with self.assertRaises(ValueError):
+                writer.add(GameRecord(size=5, komi=0.25))
+        with open(self.path, "ab") as file:
+            file.write(b"\0")
+        with self.assertRaises(ValueError):
+            Archive(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
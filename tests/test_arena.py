@@ -0,0 +1,64 @@
+import random
+import unittest
+from functools import partial
+
+from weiqi.arena import play_game, play_games
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.game import WeiqiGame
+from weiqi.players.bot import RandomBot
+from weiqi.players.mcts import MCTSBot
+
+
+class TestArena(unittest.TestCase):
+    def test_headless_game_allows_two_bots(self):
+        game = WeiqiGame(
+            Board.generate_empty_board(9),
+            RandomBot(Stone.BLACK),
+            RandomBot(Stone.WHITE),
+            headless=True,
+        )
+        self.assertTrue(game.headless)
+
+    def test_play_game_is_reproducible(self):
+        first = play_game(RandomBot, RandomBot, size=9, seed=11)
+        second = play_game(RandomBot, RandomBot, size=9, seed=11)
+
+        self.assertEqual(first.moves, second.moves)
+        self.assertEqual(first.winner, second.winner)
+        self.assertEqual(len(first.move_times), first.move_count)
+        self.assertIsNotNone(first.winner)
+        self.assertFalse(first.truncated)
+
+    def test_play_game_keeps_global_random_state(self):
+        random.seed(5)
+        expected = random.random()
+        random.seed(5)
+        play_game(RandomBot, RandomBot, size=5, seed=1)
+
+        self.assertEqual(random.random(), expected)
+
+    def test_move_limit(self):
+        bot = partial(MCTSBot, playouts=20)
+        result = play_game(bot, bot, size=5, seed=3, max_moves=6)
+        again = play_game(bot, bot, size=5, seed=3, max_moves=6)
+
+        self.assertTrue(result.truncated)
+        self.assertEqual(result.move_count, 6)
+        self.assertIsNotNone(result.winner)
+        self.assertEqual(result.moves, again.moves)
+
+    def test_play_games_in_workers(self):
+        results = list(
+            play_games(RandomBot, RandomBot, 4, size=5, seed=2, workers=2)
+        )
+
+        indices = sorted(result.index for result in results)
+        self.assertEqual(indices, [0, 1, 2, 3])
+        result = results[0]
+        replay = play_game(RandomBot, RandomBot, size=5, seed=result.seed)
+        self.assertEqual(replay.moves, result.moves)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.move import Move
+from weiqi.core.position import Position
+
+try:
+    import numpy as np
+
+    from weiqi.core.batch import BoardBatch
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestBoardBatch(unittest.TestCase):
+    def test_place_captures_and_sets_ko(self):
+        batch = BoardBatch.from_boards(
+            [
+                Board(".BW../B.BW./.BW../...../....."),
+                Board("...../...../...../...../....."),
+            ]
+        )
+        captured = batch.place([1 * 5 + 1, -1], Stone.WHITE)
+
+        self.assertEqual(captured.tolist(), [1, 0])
+        self.assertEqual(batch.black_captured.tolist(), [1, 0])
+        self.assertEqual(batch.ko_points.tolist(), [1 * 5 + 2, -1])
+        self.assertFalse(batch.legal_mask(Stone.BLACK)[0, 1, 2])
+        self.assertTrue(batch.legal_mask(Stone.WHITE)[0, 1, 2])
+        board = batch.to_board(0)
+        self.assertEqual(
+            board.state_as_string, ".BW../BW.W./.BW../...../....."
+        )
+        self.assertEqual(board.ko, (Position(2, 1), Stone.BLACK))
+
+    def test_legal_mask_matches_board(self):
+        boards = [
+            Board("B..BB/BBBBB/.B.B./BBBBB/B.B.B"),
+            Board(".W.../WBW../.W.../..BB./.BWWB"),
+        ]
+        batch = BoardBatch.from_boards(boards)
+        for stone in (Stone.BLACK, Stone.WHITE):
+            mask = batch.legal_mask(stone)
+            for board, legal in zip(boards, mask):
+                expected = [
+                    Position(int(x), int(y))
+                    for y, x in zip(*np.nonzero(legal))
+                ]
+                self.assertEqual(board.legal_moves(stone), expected)
+
+    def test_illegal_moves_leave_batch_unchanged(self):
+        batch = BoardBatch.from_boards(
+            [
+                Board("B..BB/BBBBB/.B.B./BBBBB/B.B.B"),
+                Board.generate_empty_board(5),
+            ]
+        )
+        states = batch.states.copy()
+        for moves, message in (
+            ([2 * 5, 0], "suicide"),
+            ([0, 0], "occupied"),
+            ([25, 0], "out of bounds"),
+        ):
+            with self.assertRaisesRegex(ValueError, message):
+                batch.place(moves, Stone.WHITE)
+        self.assertTrue((batch.states == states).all())
+
+    def test_matches_boards_in_random_games(self):
+        rng = np.random.default_rng(7)
+        boards = [Board.generate_empty_board(7) for _ in range(8)]
+        batch = BoardBatch.empty(8, 7)
+        stone = Stone.BLACK
+        for _ in range(120):
+            mask = batch.legal_mask(stone).reshape(8, -1)
+            moves = np.where(
+                mask.any(axis=1), (rng.random(mask.shape) * mask).argmax(1), -1
+            )
+            captured = batch.place(moves, stone)
+            for board, move, count in zip(boards, moves, captured):
+                position = (
+                    None if move < 0 else Position(int(move) % 7, move // 7)
+                )
+                delta = board.play(Move(position, stone))
+                self.assertEqual(len(delta.captured), count)
+            stone = Stone.WHITE if stone == Stone.BLACK else Stone.BLACK
+
+        self.assertEqual(
+            batch.states.tolist(), [board.state_as_matrix for board in boards]
+        )
+        self.assertEqual(
+            batch.score.tolist(),
+            [
+                [board.score[Stone.BLACK], board.score[Stone.WHITE]]
+                for board in boards
+            ],
+        )
+        for board, restored in zip(boards, batch.to_boards()):
+            self.assertEqual(restored.hash, board.hash)
+            self.assertEqual(restored.ko, board.ko)
+
+    def test_dead_chains_are_removed(self):
+        state = [[1, -1, 0, 0, 0], [-1, 0, 0, 0, 0]] + [[0] * 5] * 3
+        batch = BoardBatch([state])
+        self.assertEqual(batch.states[0, 0].tolist(), [0, -1, 0, 0, 0])
+        with self.assertRaises(ValueError):
+            BoardBatch(np.zeros((2, 4, 4)))
+
+    def test_dead_chains_are_counted_as_captured(self):
+        states = [
+            [[1, -1, 0, 0, 0], [-1, 0, 0, 0, 0]] + [[0] * 5] * 3,
+            [[-1, 1, 0, 0, 0], [1, 0, 0, 0, 0]] + [[0] * 5] * 3,
+        ]
+        batch = BoardBatch(states, black_captured=[2, 0])
+        boards = [Board(state) for state in states]
+
+        self.assertEqual(
+            batch.black_captured.tolist(),
+            [boards[0].black_captured + 2, boards[1].black_captured],
+        )
+        self.assertEqual(
+            batch.white_captured.tolist(),
+            [board.white_captured for board in boards],
+        )
+        self.assertEqual(batch.white_captured.tolist(), [0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ from weiqi.core.board import Board
 from weiqi.core.position import Position
 from weiqi.core.figure import Stone
 from weiqi.core.move import Move
+from weiqi.core.delta import Delta
 
 
 class TestBoard(unittest.TestCase):
@@ -329,6 +330,240 @@ class TestBoard(unittest.TestCase):
         board.place_figure(Move(Position(1, 0), Stone.WHITE))
         self.assertEqual(board.black_captured, 1)
 
+    def test_group_touching_move_twice_is_captured_once(self):
+        board = Board("..B../..WB./BWWB./.BB../.....")
+        board.place_figure(Move(Position(1, 1), Stone.BLACK))
+        self.assertEqual(
+            board.state_as_string, "..B../.B.B./B..B./.BB../....."
+        )
+        self.assertEqual(board.white_captured, 3)
+
+    def test_liberties_at_tracks_moves(self):
+        board = Board(".B.../.W.../...../...../.....")
+        self.assertEqual(board.liberties_at(Position(1, 0)), 2)
+        self.assertEqual(board.liberties_at(Position(1, 1)), 3)
+
+        board.place_figure(Move(Position(1, 2), Stone.WHITE))
+        self.assertEqual(board.liberties_at(Position(1, 1)), 5)
+        board.place_figure(Move(Position(0, 0), Stone.WHITE))
+        board.place_figure(Move(Position(2, 0), Stone.WHITE))
+        self.assertIsNone(board.figures[Position(1, 0)])
+        self.assertEqual(board.liberties_at(Position(1, 1)), 6)
+        self.assertEqual(board.liberties_at(Position(0, 0)), 2)
+
+        with self.assertRaises(ValueError):
+            board.liberties_at(Position(4, 4))
+
+    def test_chain_at_returns_merged_group(self):
+        board = Board("...../.B.../...../.B.../.....")
+        board.place_figure(Move(Position(1, 2), Stone.BLACK))
+        group = board.chain_at(Position(1, 3))
+        self.assertEqual(group.figure, Stone.BLACK)
+        self.assertEqual(
+            group.positions, {Position(1, 1), Position(1, 2), Position(1, 3)}
+        )
+        self.assertEqual(len(group.liberties), 8)
+        self.assertEqual(board.liberties_at(Position(1, 1)), 8)
+        self.assertEqual(group, board.chain_at(Position(1, 1)))
+        self.assertEqual(hash(group), hash(board.chain_at(Position(1, 2))))
+
+    def test_play_returns_captured_stones(self):
+        board = Board("B..../W.B../..W../.B.../.....")
+        delta = board.play(Move(Position(1, 0), Stone.WHITE))
+        self.assertEqual(delta.captured, (Position(0, 0),))
+        self.assertEqual(board.black_captured, 1)
+
+        delta = board.play(Move(None, Stone.BLACK))
+        self.assertEqual(delta.captured, ())
+
+    def test_undo_restores_captures(self):
+        state = ".W.../WBW../...../..BB./.BWW."
+        board = Board(state)
+        moves = [
+            Move(Position(1, 2), Stone.WHITE),
+            Move(Position(4, 4), Stone.BLACK),
+            Move(Position(2, 2), Stone.WHITE),
+        ]
+        deltas = [board.play(move) for move in moves]
+        self.assertEqual(
+            board.state_as_string, ".W.../W.W../.WW../..BB./.B..B"
+        )
+
+        for delta in reversed(deltas):
+            board.undo(delta)
+        self.assertEqual(board.state_as_string, state)
+        self.assertEqual(board.white_captured, 0)
+        self.assertEqual(board.black_captured, 0)
+        self.assertEqual(board.liberties_at(Position(1, 1)), 1)
+        self.assertEqual(board.liberties_at(Position(2, 4)), 1)
+
+    def test_undo_splits_merged_chain(self):
+        board = Board("...../.B.B./...../...../.....")
+        delta = board.play(Move(Position(2, 1), Stone.BLACK))
+        self.assertEqual(board.liberties_at(Position(1, 1)), 8)
+        board.undo(delta)
+        self.assertEqual(board.liberties_at(Position(1, 1)), 4)
+        self.assertEqual(
+            board.chain_at(Position(3, 1)).positions, {Position(3, 1)}
+        )
+
+    def test_undo_rejects_foreign_delta(self):
+        board = Board.generate_empty_board(5)
+        delta = board.play(Move(Position(0, 0), Stone.BLACK))
+        board.undo(delta)
+        with self.assertRaises(ValueError):
+            board.undo(delta)
+
+    def test_hash_depends_only_on_position(self):
+        first = Board.generate_empty_board(9)
+        second = Board.generate_empty_board(9)
+        empty_hash = first.hash
+
+        first.place_figure(Move(Position(2, 2), Stone.BLACK))
+        first.place_figure(Move(Position(6, 6), Stone.WHITE))
+        second.place_figure(Move(Position(6, 6), Stone.WHITE))
+        delta = second.play(Move(Position(2, 2), Stone.BLACK))
+        self.assertEqual(first.hash, second.hash)
+        self.assertEqual(first.hash, Board(first.state_as_matrix).hash)
+
+        second.undo(delta)
+        self.assertNotEqual(first.hash, second.hash)
+        second.undo(Delta(Move(Position(6, 6), Stone.WHITE)))
+        self.assertEqual(second.hash, empty_hash)
+
+    def test_hash_follows_captures(self):
+        board = Board("B..../W.B../..W../.B.../.....")
+        board.place_figure(Move(Position(1, 0), Stone.WHITE))
+        expected = Board(".W.../W.B../..W../.B.../.....")
+        self.assertEqual(board.hash, expected.hash)
+
+    def test_snapshot_is_not_changed_by_later_moves(self):
+        board = Board.generate_empty_board(5)
+        board.place_figure(Move(Position(0, 0), Stone.BLACK))
+        snapshot = board.snapshot()
+        self.assertIs(board.snapshot(), snapshot)
+
+        board.place_figure(Move(Position(1, 0), Stone.WHITE))
+        board.place_figure(Move(Position(4, 4), Stone.BLACK))
+        board.place_figure(Move(Position(0, 1), Stone.WHITE))
+        self.assertIsNot(board.snapshot(), snapshot)
+        self.assertEqual(
+            snapshot.state_as_string, "B..../...../...../...../....."
+        )
+        self.assertEqual(snapshot.figures[Position(0, 0)], Stone.BLACK)
+        self.assertEqual(snapshot.liberties_at(Position(0, 0)), 2)
+        self.assertEqual(snapshot.black_captured, 0)
+        self.assertEqual(board.black_captured, 1)
+        self.assertEqual(board.version, snapshot.version + 3)
+
+    def test_snapshot_to_board_is_independent(self):
+        board = Board(".W.../WBW../...../..BB./.BWW.")
+        snapshot = board.snapshot()
+        copy = snapshot.to_board()
+        copy.place_figure(Move(Position(1, 2), Stone.WHITE))
+
+        self.assertEqual(copy.white_captured, 0)
+        self.assertEqual(copy.black_captured, 1)
+        self.assertEqual(board.black_captured, 0)
+        self.assertEqual(snapshot.state_as_string, board.state_as_string)
+        self.assertEqual(snapshot.hash, board.hash)
+        self.assertEqual(snapshot.score, board.score)
+        self.assertFalse(hasattr(snapshot, "place_figure"))
+
+    def test_ko_point_is_not_a_legal_move(self):
+        board = Board(".BW../B.BW./.BW../...../.....")
+        delta = board.play(Move(Position(1, 1), Stone.WHITE))
+        self.assertEqual(board.ko, (Position(2, 1), Stone.BLACK))
+        self.assertNotIn(Position(2, 1), board.legal_moves(Stone.BLACK))
+        self.assertIn(Position(2, 1), board.legal_moves(Stone.WHITE))
+
+        board.play(Move(None, Stone.BLACK))
+        self.assertIsNone(board.ko)
+        self.assertIn(Position(2, 1), board.legal_moves(Stone.BLACK))
+
+        board.undo(delta)
+        self.assertIsNone(board.ko)
+
+    def test_undo_restores_ko(self):
+        board = Board(".BW../B.BW./.BW../...../.....")
+        board.play(Move(Position(1, 1), Stone.WHITE))
+        delta = board.play(Move(Position(4, 4), Stone.BLACK))
+        self.assertIsNone(board.ko)
+        board.undo(delta)
+        self.assertEqual(board.ko, (Position(2, 1), Stone.BLACK))
+        self.assertEqual(board.snapshot().ko, board.ko)
+
+    def test_legal_moves_leave_out_suicide(self):
+        board = Board("B..BB/BBBBB/.B.B./BBBBB/B.B.B")
+        self.assertEqual(
+            board.legal_moves(Stone.WHITE), [Position(1, 0), Position(2, 0)]
+        )
+        self.assertEqual(board.legal_moves_mask(Stone.WHITE), 0b110)
+        self.assertEqual(len(board.legal_moves(Stone.BLACK)), 7)
+        self.assertEqual(
+            board.snapshot().legal_moves(Stone.WHITE),
+            board.legal_moves(Stone.WHITE),
+        )
+
+    def test_bytes_round_trip(self):
+        board = Board(".BW../B.BW./.BW../...../.....", white_captured=3)
+        board.place_figure(Move(Position(1, 1), Stone.WHITE))
+        data = board.to_bytes()
+
+        restored = Board.from_bytes(data)
+
+        self.assertEqual(len(data), 12 + 25)
+        self.assertEqual(restored.state_as_string, board.state_as_string)
+        self.assertEqual(restored.white_captured, 3)
+        self.assertEqual(restored.black_captured, 1)
+        self.assertEqual(restored.ko, board.ko)
+        self.assertEqual(restored.hash, board.hash)
+        self.assertEqual(board.snapshot().to_bytes(), data)
+        for invalid in (data[:5], data[:-1], data[:-1] + b"\x05"):
+            with self.assertRaises(ValueError):
+                Board.from_bytes(invalid)
+
+    def test_score_follows_moves_and_undo(self):
+        state = ".W.../WBW../...../..BB./.BWW."
+        board = Board(state)
+        start_score = board.score
+        moves = [
+            Move(Position(1, 2), Stone.WHITE),
+            Move(Position(4, 4), Stone.BLACK),
+            Move(Position(0, 4), Stone.WHITE),
+            Move(Position(2, 2), Stone.WHITE),
+        ]
+        deltas = []
+        for move in moves:
+            deltas.append(board.play(move))
+            fresh = Board(
+                board.state_as_string,
+                board.white_captured,
+                board.black_captured,
+            )
+            self.assertEqual(board.score, fresh.score)
+            self.assertEqual(
+                board.find_territories(), fresh.find_territories()
+            )
+
+        for delta in reversed(deltas):
+            board.undo(delta)
+        self.assertEqual(board.score, start_score)
+        self.assertEqual(
+            board.find_territories(), Board(state).find_territories()
+        )
+
+    def test_figures_is_read_only_view(self):
+        board = Board.generate_empty_board(5)
+        figures = board.figures
+        board.place_figure(Move(Position(2, 3), Stone.WHITE))
+        self.assertEqual(figures[Position(2, 3)], Stone.WHITE)
+        self.assertEqual(list(figures)[:2], [Position(0, 0), Position(1, 0)])
+        with self.assertRaises(KeyError):
+            figures[Position(5, 0)]
+        with self.assertRaises(TypeError):
+            figures[Position(0, 0)] = Stone.BLACK  # type: ignore[index]
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,14 @@
+import random
 import unittest
+from unittest import mock
 from parameterized import parameterized  # type: ignore[import-untyped]
 
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.game import WeiqiGame
+from weiqi.core.position import Position
 from weiqi.players.bot import RandomBot
+from weiqi.players.player import Player
 
 
 class MyTestCase(unittest.TestCase):
@@ -18,6 +25,18 @@ class MyTestCase(unittest.TestCase):
     def test_calc_field_boars(self, matrix: list[list[int]], expected: float):
         self.assertEqual(RandomBot._calc_field_board(matrix), expected)
 
+    @parameterized.expand([(seed,) for seed in range(10)])
+    def test_random_bot_finds_rare_legal_move(self, seed: int):
+        board = Board("B..BB/BBBBB/.B.B./BBBBB/B.B.B")
+        bot = RandomBot(Stone.WHITE)
+        game = WeiqiGame(board, Player(Stone.BLACK), bot, turn=Stone.WHITE)
+
+        random.seed(seed)
+        with mock.patch("random.random", return_value=0.9):
+            move = bot.make_move(game)
+        self.assertIn(move.position, {Position(1, 0), Position(2, 0)})
+        self.assertEqual(game.move_history.last_move, move)
+
 
 if __name__ == "__main__":
     unittest.main()
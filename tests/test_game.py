@@ -1,6 +1,8 @@
 import unittest
 
-from weiqi.utils.enums import Winner
+from parameterized import parameterized  # type: ignore[import-untyped]
+
+from weiqi.utils.enums import KoRule, Winner
 from weiqi.utils.game_status import GameStatus
 from weiqi.core.position import Position
 from weiqi.exceptions.game import GameOverException
@@ -127,6 +129,20 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(game.move_history[0].position, Position(1, 0))
         self.assertEqual(game.move_history[1].position, Position(0, 1))
 
+    def test_board_is_snapshot_of_current_state(self):
+        board = Board.generate_empty_board(9)
+        player_black = Player(Stone.BLACK)
+        player_white = Player(Stone.WHITE)
+        game = WeiqiGame(board, player_black, player_white)
+
+        snapshot = game.board
+        self.assertIs(game.board, snapshot)
+        player_black.make_move(game, Position(4, 4))
+
+        self.assertIsNone(snapshot.figures[Position(4, 4)])
+        self.assertEqual(game.board.figures[Position(4, 4)], Stone.BLACK)
+        self.assertGreater(game.board.version, snapshot.version)
+
     def test_two_passes_end_game(self):
         string_state = ".W.../..B../B.W../..BB./.B.B."
         board = Board(string_state)
@@ -143,3 +159,97 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(game.game_status.winner, Winner.WHITE)
         self.assertEqual(game.game_status.black_score, 1)
         self.assertEqual(game.game_status.white_score, 6.5)
+
+    def test_resume_after_two_passes(self):
+        black = Player(Stone.BLACK)
+        white = Player(Stone.WHITE)
+        game = WeiqiGame(Board.generate_empty_board(5), black, white)
+        black.make_move(game, None)
+        white.make_move(game, None)
+        game.resume()
+        black.make_move(game, Position(2, 2))
+
+        self.assertFalse(game.game_status.is_over)
+        game.resign(white)
+        with self.assertRaises(GameOverException):
+            game.resume()
+
+    def test_end_by_score(self):
+        board = Board(".W.../..B../B.W../..BB./.B.B.")
+        black = Player(Stone.BLACK)
+        game = WeiqiGame(board, black, Player(Stone.WHITE), komi=0)
+        game.end_by_score()
+
+        self.assertEqual(game.game_status.winner, Winner.BLACK)
+        self.assertEqual(game.game_status.black_score, 1)
+        self.assertEqual(game.game_status.white_score, 0)
+        with self.assertRaises(GameOverException):
+            game.end_by_score()
+
+    @staticmethod
+    def get_ko_game(
+        ko_rule: KoRule | None,
+    ) -> tuple[WeiqiGame, Player, Player]:
+        board = Board(".BW../B.BW./.BW../...../.....")
+        black = Player(Stone.BLACK)
+        white = Player(Stone.WHITE)
+        game = WeiqiGame(board, black, white, Stone.WHITE, ko_rule=ko_rule)
+        return game, black, white
+
+    @parameterized.expand([(KoRule.POSITIONAL,), (KoRule.SITUATIONAL,)])
+    def test_ko_recapture_is_forbidden(self, ko_rule: KoRule):
+        game, black, white = self.get_ko_game(ko_rule)
+        white.make_move(game, Position(1, 1))
+        state = game.board.state_as_string
+
+        with self.assertRaises(ValueError):
+            black.make_move(game, Position(2, 1))
+        self.assertEqual(game.board.state_as_string, state)
+        self.assertEqual(game.board.black_captured, 1)
+        self.assertEqual(game.turn, Stone.BLACK)
+
+        black.make_move(game, Position(4, 4))
+        white.make_move(game, Position(4, 3))
+        black.make_move(game, Position(2, 1))
+        self.assertIsNone(game.board.figures[Position(1, 1)])
+
+    def test_undo_takes_back_moves(self):
+        game, black, white = self.get_ko_game(KoRule.POSITIONAL)
+        state = game.board.state_as_string
+        white.make_move(game, Position(1, 1))
+
+        self.assertEqual(game.undo(), Move(Position(1, 1), Stone.WHITE))
+        self.assertEqual(game.board.state_as_string, state)
+        self.assertEqual(game.board.black_captured, 0)
+        self.assertEqual(game.turn, Stone.WHITE)
+        self.assertEqual(len(game.move_history), 0)
+        # The position after the move may be reached again.
+        white.make_move(game, Position(1, 1))
+        game.undo()
+        self.assertEqual(game.board.state_as_string, state)
+        self.assertEqual(game.turn, Stone.WHITE)
+        with self.assertRaises(ValueError):
+            game.undo()
+
+    def test_undo_reopens_game_ended_by_passes(self):
+        board = Board.generate_empty_board(5)
+        black = Player(Stone.BLACK)
+        white = Player(Stone.WHITE)
+        game = WeiqiGame(board, black, white)
+        black.make_move(game, None)
+        white.make_move(game, None)
+
+        game.undo()
+        self.assertFalse(game.game_status.is_over)
+        white.make_move(game, Position(2, 2))
+        black.resign(game)
+        with self.assertRaises(GameOverException):
+            game.undo()
+
+    def test_ko_rule_can_be_disabled(self):
+        game, black, white = self.get_ko_game(None)
+        white.make_move(game, Position(1, 1))
+        black.make_move(game, Position(2, 1))
+        self.assertEqual(
+            game.board.state_as_string, ".BW../B.BW./.BW../...../....."
+        )
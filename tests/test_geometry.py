@@ -0,0 +1,63 @@
+import unittest
+from array import array
+
+from parameterized import parameterized  # type: ignore[import-untyped]
+
+from weiqi.core.base_board import BORDER
+from weiqi.core.board import Board
+from weiqi.core.geometry import geometry, star_points
+from weiqi.core.position import Position
+
+
+class TestGeometry(unittest.TestCase):
+    def test_tables_of_points(self):
+        tables = geometry(5)
+        corner, edge, center = 8, 10, 24  # (0, 0), (2, 0) and (2, 2).
+
+        self.assertEqual(tables.neighbors[corner], (9, 15))
+        self.assertEqual(len(tables.neighbors[edge]), 3)
+        self.assertEqual(len(tables.neighbors[center]), 4)
+        self.assertEqual(tables.diagonals[corner], (16,))
+        self.assertEqual(tables.neighbors[0], ())
+        self.assertEqual(
+            [tables.edge_distance[point] for point in (0, corner, center)],
+            [-1, 0, 2],
+        )
+
+    def test_tables_are_shared(self):
+        first = Board.generate_empty_board(9)
+        second = Board("/".join(["........."] * 9))
+
+        self.assertIs(geometry(9), geometry(9))
+        self.assertIs(first._neighbors, second._neighbors)
+        self.assertIs(first.snapshot()._neighbors, geometry(9).neighbors)
+
+    @parameterized.expand(
+        [
+            (7, []),
+            (9, [(2, 2), (6, 2), (2, 6), (6, 6), (4, 4)]),
+            (17, [(3, 3), (13, 3), (3, 13), (13, 13), (8, 8)]),
+        ]
+    )
+    def test_star_points(self, size: int, expected: list[tuple[int, int]]):
+        self.assertEqual(
+            star_points(size), tuple(Position(x, y) for x, y in expected)
+        )
+
+    def test_nine_star_points_on_19x19(self):
+        stars = star_points(19)
+        self.assertEqual(len(stars), 9)
+        self.assertIn(Position(9, 3), stars)
+
+    def test_symmetries_keep_the_score(self):
+        board = Board("BB.../B.W../.W.W./...../.....")
+        tables = geometry(5)
+        self.assertEqual(tables.symmetries[0], tuple(range(49)))
+
+        for images in tables.symmetries:
+            self.assertEqual(sorted(images), list(range(49)))
+            points = array("b", [BORDER]) * 49
+            for point, image in enumerate(images):
+                points[image] = board._points[point]
+            transformed = Board._from_points(5, points, 0, 0)
+            self.assertEqual(transformed.score, board.score)
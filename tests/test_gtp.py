@@ -0,0 +1,114 @@
+import io
+import unittest
+from functools import partial
+
+from parameterized import parameterized  # type: ignore[import-untyped]
+
+from weiqi.core.figure import Stone
+from weiqi.core.position import Position
+from weiqi.gtp import GTPEngine
+from weiqi.players.bot import RandomBot
+from weiqi.players.mcts import MCTSBot
+
+
+class TestGTPEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = GTPEngine(RandomBot, size=9)
+
+    def test_play_and_undo(self):
+        handle = self.engine.handle
+        self.assertEqual(handle("1 play black D4"), "=1\n\n")
+        self.assertEqual(handle("play b E5"), "=\n\n")
+        game = self.engine.game
+
+        # White passed before the second black move.
+        self.assertEqual(len(game.move_history), 3)
+        self.assertEqual(game.board.figures[Position(3, 5)], Stone.BLACK)
+        self.assertEqual(handle("undo"), "=\n\n")
+        self.assertEqual(len(game.move_history), 1)
+        self.assertEqual(handle("undo"), "=\n\n")
+        self.assertEqual(handle("2 undo"), "?2 cannot undo\n\n")
+
+    @parameterized.expand(
+        [
+            ("play b Z9", "? invalid coordinate\n\n"),
+            ("play b J10", "? invalid coordinate\n\n"),
+            ("play red D4", "? invalid color\n\n"),
+            ("boardsize 10", "? unacceptable size\n\n"),
+            ("3 frobnicate", "?3 unknown command\n\n"),
+            ("known_command genmove", "= true\n\n"),
+            ("protocol_version # comment", "= 2\n\n"),
+        ]
+    )
+    def test_responses(self, command: str, response: str):
+        self.assertEqual(self.engine.handle(command), response)
+
+    def test_illegal_move(self):
+        handle = self.engine.handle
+        handle("play b D4")
+        self.assertEqual(handle("play w D4"), "? illegal move\n\n")
+        self.assertEqual(len(self.engine.game.move_history), 1)
+
+    def test_pass_out_of_turn(self):
+        handle = self.engine.handle
+        self.assertEqual(handle("play w pass"), "=\n\n")
+        self.assertEqual(handle("play b D4"), "=\n\n")
+
+        # Black passed for white first, the two passes did not end it.
+        game = self.engine.game
+        self.assertFalse(game.game_status.is_over)
+        self.assertEqual(len(game.move_history), 3)
+        self.assertEqual(game.board.figures[Position(3, 5)], Stone.BLACK)
+
+    def test_moves_after_two_passes(self):
+        handle = self.engine.handle
+        handle("play b pass")
+        handle("play w pass")
+        self.assertTrue(self.engine.game.game_status.is_over)
+
+        self.assertEqual(handle("play b D4"), "=\n\n")
+        self.assertEqual(handle("komi 0.5"), "=\n\n")
+        response = handle("genmove w")
+        assert response is not None
+        self.assertNotEqual(response, "= pass\n\n")
+        self.assertEqual(len(self.engine.game.move_history), 4)
+
+        handle("undo")
+        handle("undo")
+        self.assertEqual(len(self.engine.game.move_history), 2)
+
+    def test_genmove_and_final_score(self):
+        handle = self.engine.handle
+        handle("komi 0.5")
+        handle("play b C3")
+        response = handle("genmove w")
+        assert response is not None
+
+        self.assertTrue(response.startswith("= "))
+        self.assertEqual(len(self.engine.game.move_history), 2)
+        self.assertEqual(self.engine.game.komi, 0.5)
+        self.assertIsNone(handle(""))
+        self.assertEqual(handle("final_score"), "= W+0.5\n\n")
+
+    def test_genmove_follows_time_left(self):
+        bot = partial(MCTSBot, playouts=None, time_limit=10.0, seed=1)
+        engine = GTPEngine(bot, size=5)
+        engine.handle("time_settings 30 0 0")
+        engine.handle("time_left b 1 0")
+        engine.handle("genmove b")
+
+        black = engine.game.players[0]
+        assert isinstance(black, MCTSBot)
+        self.assertLess(black.time_limit or 0, 1.0)
+
+    def test_run_until_quit(self):
+        output = io.StringIO()
+        self.engine.run(
+            io.StringIO("boardsize 5\nshowboard\nquit\nname\n"), output
+        )
+
+        lines = output.getvalue().split("\n")
+        self.assertEqual(lines[2:4], ["= ", "   A B C D E"])
+        self.assertEqual(lines[4], " 5 . . . . . 5")
+        self.assertTrue(self.engine.finished)
+        self.assertEqual(output.getvalue().count("="), 3)
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from weiqi.core.figure import Stone
+from weiqi.core.game import WeiqiGame
+from weiqi.core.move import Move
+from weiqi.core.position import Position
+from weiqi.exceptions.game import GameOverException
+from weiqi.hub import GameHub
+from weiqi.players.bot import RandomBot
+from weiqi.utils.enums import KoRule, Winner
+
+
+class _SlowBot(RandomBot):
+    started = threading.Event()
+    proceed = threading.Event()
+
+    def make_move(self, game: WeiqiGame) -> Move:
+        self.started.set()
+        self.proceed.wait(5.0)
+        return super().make_move(game)
+
+
+class TestGameHub(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.hub = GameHub(workers=2, max_active=2, idle_timeout=None)
+        _SlowBot.started = threading.Event()
+        _SlowBot.proceed = threading.Event()
+
+    async def asyncTearDown(self):
+        await self.hub.close()
+
+    async def test_human_against_bot(self):
+        game_id = self.hub.create_game(white=RandomBot, size=5)
+        await self.hub.make_move(game_id, Position(2, 2))
+        move = await self.hub.bot_move(game_id)
+        status, turn = await self.hub.status(game_id)
+
+        self.assertEqual(move.figure, Stone.WHITE)
+        self.assertEqual(turn, Stone.BLACK)
+        self.assertFalse(status.is_over)
+        with self.assertRaises(ValueError):
+            await self.hub.bot_move(game_id)
+
+    async def test_cancelled_bot_move_holds_the_game(self):
+        hub = GameHub(workers=1, max_pending=1, idle_timeout=None)
+        game_id = hub.create_game(black=_SlowBot, size=5)
+        thinking = asyncio.create_task(hub.bot_move(game_id))
+        await asyncio.to_thread(_SlowBot.started.wait, 5.0)
+        thinking.cancel()
+        status = asyncio.create_task(hub.status(game_id))
+        await asyncio.sleep(0.05)
+
+        self.assertFalse(thinking.done())
+        self.assertFalse(status.done())
+        _SlowBot.proceed.set()
+        with self.assertRaises(asyncio.CancelledError):
+            await thinking
+        self.assertEqual((await status)[1], Stone.WHITE)
+        await hub.close()
+
+    async def test_remove_game_during_bot_move(self):
+        hub = GameHub(workers=1, idle_timeout=60.0)
+        game_id = hub.create_game(black=_SlowBot, size=5)
+        other = hub.create_game(size=5)
+        thinking = asyncio.create_task(hub.bot_move(game_id))
+        await asyncio.to_thread(_SlowBot.started.wait, 5.0)
+        hub.remove_game(game_id)
+        _SlowBot.proceed.set()
+        await thinking
+
+        self.assertNotIn(game_id, hub)
+        self.assertEqual(hub.active_count, 1)
+        self.assertEqual(hub.evict_idle(now=1e12), 1)
+        self.assertEqual((await hub.status(other))[1], Stone.BLACK)
+        await hub.close()
+
+    async def test_evicted_games_are_restored(self):
+        first = self.hub.create_game(size=5, komi=0.5, ko_rule=None)
+        await self.hub.make_move(first, Position(1, 1))
+        await self.hub.make_move(first, None)
+        board = (await self.hub.board(first)).state_as_string
+        for _ in range(2):
+            self.hub.create_game(size=5)
+
+        self.assertEqual(len(self.hub), 3)
+        self.assertEqual(self.hub.active_count, 2)
+        restored = await self.hub.board(first)
+        self.assertEqual(restored.state_as_string, board)
+        status, turn = await self.hub.status(first)
+        self.assertEqual(turn, Stone.BLACK)
+        self.assertEqual(self.hub.active_count, 2)
+
+    async def test_idle_games_are_evicted_with_their_result(self):
+        hub = GameHub(idle_timeout=60.0)
+        game_id = hub.create_game(size=5, ko_rule=KoRule.SITUATIONAL)
+        await hub.resign(game_id, Stone.BLACK)
+        self.assertEqual(hub.evict_idle(), 0)
+        self.assertEqual(hub.evict_idle(now=1e12), 1)
+
+        status, turn = await hub.status(game_id)
+        self.assertEqual(status.winner, Winner.WHITE)
+        with self.assertRaises(GameOverException):
+            await hub.make_move(game_id, Position(0, 0))
+        await hub.close()
+
+    async def test_concurrent_games(self):
+        ids = [
+            self.hub.create_game(RandomBot, RandomBot, size=5)
+            for _ in range(4)
+        ]
+        moves = await asyncio.gather(
+            *(self.hub.bot_move(game_id) for game_id in ids for _ in range(3))
+        )
+
+        self.assertEqual(len(moves), 12)
+        for game_id in ids:
+            status, turn = await self.hub.status(game_id)
+            self.assertEqual(turn, Stone.WHITE)
+
+    async def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            hub = GameHub(executor=executor, idle_timeout=None)
+            game_id = hub.create_game(RandomBot, RandomBot, size=5)
+            await hub.bot_move(game_id)
+            move = await hub.bot_move(game_id)
+            await hub.close()
+
+        self.assertEqual(move.figure, Stone.WHITE)
+        status, turn = await hub.status(game_id)
+        self.assertEqual(turn, Stone.BLACK)
+
+    async def test_unknown_and_duplicate_games(self):
+        game_id = self.hub.create_game(game_id="a", size=5)
+        with self.assertRaises(ValueError):
+            self.hub.create_game(game_id=game_id)
+        self.hub.remove_game(game_id)
+
+        self.assertNotIn(game_id, self.hub)
+        with self.assertRaises(KeyError):
+            await self.hub.status(game_id)
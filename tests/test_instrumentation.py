@@ -0,0 +1,121 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+
+from weiqi.core.board import Board, BoardSnapshot
+from weiqi.core.figure import Stone
+from weiqi.core.game import WeiqiGame
+from weiqi.core.move import Move
+from weiqi.core.position import Position
+from weiqi.players.bot import RandomBot
+from weiqi.players.player import Player
+from weiqi.utils import instrumentation
+
+
+class TestInstrumentation(unittest.TestCase):
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_record_counts_the_block_only(self):
+        board = Board.generate_empty_board(5)
+        board.place_figure(Move(Position(0, 0), Stone.BLACK))
+
+        with instrumentation.record() as counters:
+            board.place_figure(Move(Position(1, 0), Stone.BLACK))
+            board.chain_at(Position(0, 0))
+            board.score
+            board.score
+
+        self.assertEqual(counters["play"]["calls"], 1)
+        self.assertEqual(counters["group_at_position"]["calls"], 1)
+        self.assertEqual(counters["group_at_position"]["nodes"], 2)
+        self.assertEqual(counters["territory_floods"]["calls"], 2)
+        self.assertEqual(counters["territory_floods"]["nodes"], 23)
+        self.assertGreater(counters["play"]["seconds"], 0)
+        self.assertFalse(instrumentation.is_enabled())
+
+    def test_overlapping_records(self):
+        board = Board.generate_empty_board(5)
+        first = instrumentation.record()
+        first_counters = first.__enter__()
+        second = instrumentation.record()
+        second_counters = second.__enter__()
+        board.place_figure(Move(Position(0, 0), Stone.BLACK))
+        first.__exit__(None, None, None)
+
+        self.assertTrue(instrumentation.is_enabled())
+        board.place_figure(Move(Position(1, 0), Stone.BLACK))
+        second.__exit__(None, None, None)
+        self.assertEqual(first_counters["play"]["calls"], 1)
+        self.assertEqual(second_counters["play"]["calls"], 2)
+        self.assertFalse(instrumentation.is_enabled())
+
+    def test_threads_are_counted(self):
+        board = Board("B..../...../...../...../.....")
+
+        def query(count: int):
+            for _ in range(count):
+                board.chain_at(Position(0, 0))
+
+        with instrumentation.record() as counters:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(query, [2000] * 4))
+
+        self.assertEqual(counters["group_at_position"]["calls"], 8000)
+        self.assertEqual(counters["group_at_position"]["nodes"], 8000)
+
+    def test_disable_restores_methods(self):
+        play = Board.play
+        board_property = WeiqiGame.board
+
+        instrumentation.enable()
+        self.assertIsNot(Board.play, play)
+        self.assertIn("find_territories", vars(BoardSnapshot))
+        instrumentation.disable()
+
+        self.assertIs(Board.play, play)
+        self.assertIs(WeiqiGame.board, board_property)
+        self.assertNotIn("find_territories", vars(BoardSnapshot))
+
+    def test_game_moves_are_counted(self):
+        black, white = RandomBot(Stone.BLACK), RandomBot(Stone.WHITE)
+        game = WeiqiGame(
+            Board.generate_empty_board(5), black, white, headless=True
+        )
+
+        with instrumentation.record() as counters:
+            for _ in range(5):
+                black.make_move(game)
+                white.make_move(game)
+            game.board.find_territories()
+
+        self.assertEqual(counters["play"]["calls"], 10)
+        self.assertEqual(counters["bot_moves"]["calls"], 10)
+        self.assertEqual(counters["find_territories"]["calls"], 1)
+
+    @unittest.skipIf(find_spec("numpy") is None, "NumPy is not installed")
+    def test_numpy_territories_are_counted_once(self):
+        board = Board.generate_empty_board(5)
+        with instrumentation.record() as counters:
+            board.find_territories("numpy")
+
+        self.assertEqual(counters["find_territories"]["calls"], 1)
+        self.assertEqual(counters["find_territories"]["nodes"], 25)
+
+    def test_game_and_bot_counters(self):
+        human = Player(Stone.BLACK)
+        bot = RandomBot(Stone.WHITE)
+        game = WeiqiGame(Board.generate_empty_board(5), human, bot)
+
+        instrumentation.enable()
+        snapshot = game.board
+        human.make_move(game, Position(2, 2))
+        bot.make_move(game)
+        counters = instrumentation.snapshot()
+
+        self.assertEqual(counters["bot_moves"]["calls"], 1)
+        self.assertGreaterEqual(counters["game_board"]["calls"], 1)
+        # Both moves were played on a board with a snapshot handed out.
+        self.assertEqual(counters["board_copies"]["calls"], 2)
+        self.assertEqual(snapshot.state_as_string, "...../" * 4 + ".....")
@@ -0,0 +1,80 @@
+import time
+import unittest
+
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.game import WeiqiGame
+from weiqi.core.position import Position
+from weiqi.players.mcts import MCTSBot
+from weiqi.players.player import Player
+
+
+class TestMCTSBot(unittest.TestCase):
+    def test_budget_is_required(self):
+        with self.assertRaises(ValueError):
+            MCTSBot(Stone.WHITE, playouts=None, time_limit=None)
+
+    def test_passes_to_win_after_opponent_pass(self):
+        board = Board(".B.W./.B.W./.B.W./.B.W./.B.W.")
+        human = Player(Stone.BLACK)
+        bot = MCTSBot(Stone.WHITE, playouts=200, seed=1)
+        game = WeiqiGame(board, human, bot)
+        human.make_move(game, None)
+
+        move = bot.make_move(game)
+
+        self.assertIsNone(move.position)
+        self.assertTrue(game.game_status.is_over)
+
+    def test_time_limit(self):
+        board = Board.generate_empty_board(5)
+        bot = MCTSBot(Stone.WHITE, playouts=None, time_limit=0.05, seed=1)
+        game = WeiqiGame(board, Player(Stone.BLACK), bot, turn=Stone.WHITE)
+
+        start = time.perf_counter()
+        move = bot.make_move(game)
+
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(game.move_history.last_move, move)
+
+    def test_reuses_subtree(self):
+        board = Board.generate_empty_board(5)
+        human = Player(Stone.BLACK)
+        bot = MCTSBot(Stone.WHITE, playouts=300, seed=1)
+        game = WeiqiGame(board, human, bot, turn=Stone.WHITE)
+        bot.make_move(game)
+
+        kept = bot._root
+        assert kept is not None
+        reply = max(kept.children, key=lambda child: child.visits)
+        stride = board.size + 2
+        human.make_move(
+            game, Position(reply.point % stride - 1, reply.point // stride - 1)
+        )
+
+        root = bot._reuse_root(game)
+        self.assertIs(root, reply)
+        self.assertIsNone(root.parent)
+        self.assertGreater(root.visits, 0)
+        bot.make_move(game)
+        self.assertEqual(len(game.move_history), 3)
+
+    def test_parallel_search(self):
+        board = Board.generate_empty_board(5)
+        human = Player(Stone.BLACK)
+        with MCTSBot(Stone.WHITE, playouts=60, seed=1, workers=2) as bot:
+            game = WeiqiGame(board, human, bot, turn=Stone.WHITE)
+            move = bot.make_move(game)
+            self.assertEqual(bot.last_playouts, 60)
+            self.assertEqual(game.move_history.last_move, move)
+            human.make_move(game, None)
+            bot.make_move(game)
+        self.assertEqual(len(game.move_history), 3)
+
+    def test_workers_are_required(self):
+        with self.assertRaises(ValueError):
+            MCTSBot(Stone.WHITE, workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import datetime
+import unittest
+
+from weiqi.core.figure import Stone
+from weiqi.core.move import Move, MoveHistory
+from weiqi.core.position import Position
+
+
+class TestMoveHistory(unittest.TestCase):
+    def test_keeps_order_of_addition(self):
+        late = Move(
+            Position(3, 4),
+            Stone.BLACK,
+            datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc),
+        )
+        early = Move(None, Stone.WHITE)
+        history = MoveHistory([late, early])
+
+        self.assertEqual(
+            list(history),
+            [Move(Position(3, 4), Stone.BLACK), Move(None, Stone.WHITE)],
+        )
+        self.assertEqual(history.last_move, early)
+        self.assertIsNone(history[0].timestamp)
+
+    def test_slicing(self):
+        history = MoveHistory(
+            Move(Position(x, 18 - x), Stone.BLACK if x % 2 else Stone.WHITE)
+            for x in range(19)
+        )
+
+        tail = history[15:]
+        self.assertIsInstance(tail, MoveHistory)
+        self.assertEqual(len(tail), 4)
+        self.assertEqual(tail[0], history[15])
+        self.assertEqual(history[-1], Move(Position(18, 0), Stone.WHITE))
+
+    def test_timestamps(self):
+        timestamp = datetime.datetime(
+            2024, 5, 1, 12, 30, tzinfo=datetime.timezone.utc
+        )
+        history = MoveHistory(timestamps=True)
+        history.add_move(Move(Position(0, 0), Stone.BLACK, timestamp))
+        history.add_move(Move(Position(1, 0), Stone.WHITE))
+
+        self.assertTrue(history.timestamps)
+        self.assertEqual(history[0].timestamp, timestamp)
+        added = history[1].timestamp
+        assert added is not None
+        self.assertLess(
+            abs(datetime.datetime.now(datetime.timezone.utc) - added),
+            datetime.timedelta(minutes=1),
+        )
+        self.assertEqual(history[1:][0].timestamp, added)
+        self.assertFalse(MoveHistory().timestamps)
+
+    def test_pop(self):
+        moves = [
+            Move(Position(1, 2), Stone.BLACK),
+            Move(None, Stone.WHITE),
+        ]
+        history = MoveHistory(moves)
+
+        self.assertEqual(history.pop(), moves[1])
+        self.assertEqual(history, MoveHistory(moves[:1]))
+        self.assertEqual(history.pop(), moves[0])
+        with self.assertRaises(IndexError):
+            history.pop()
+
+    def test_position_out_of_range(self):
+        with self.assertRaises(ValueError):
+            MoveHistory().add_move(Move(Position(-1, 0), Stone.BLACK))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import random
+import unittest
+
+from weiqi.core.base_board import (
+    BLACK,
+    EMPTY,
+    WHITE,
+    board_points,
+    point_positions,
+)
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.move import Move
+from weiqi.core.playout import PlayoutBoard, playout
+from weiqi.core.position import Position
+
+
+class TestPlayout(unittest.TestCase):
+    def test_is_reproducible(self):
+        board = Board.generate_empty_board(9)
+        data = board.to_bytes()
+
+        first = playout(board, BLACK, 7)
+        second = playout(board, BLACK, random.Random(7))
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 81)
+        self.assertTrue(set(first) <= {BLACK, WHITE, EMPTY})
+        self.assertEqual(board.to_bytes(), data)
+
+    def test_keeps_true_eyes(self):
+        board = Board("B.B.B/BBBBB/WWWWW/...../.....")
+
+        for seed in range(10):
+            owners = playout(board, WHITE, seed)
+            self.assertEqual(owners[:10], [BLACK] * 10)
+
+    def test_true_eye(self):
+        board = PlayoutBoard(Board("B.B../BBB../.W.W./..W../....."))
+        stride = board.size + 2
+
+        self.assertTrue(board.is_true_eye(stride + 2, BLACK))
+        self.assertFalse(board.is_true_eye(3 * stride + 3, WHITE))
+        self.assertFalse(board.is_true_eye(3 * stride + 3, BLACK))
+
+    def test_ko(self):
+        board = Board(".BW../BW.W./.BW../...../.....")
+        board.play(Move(position=Position(2, 1), figure=Stone.BLACK))
+        playout_board = PlayoutBoard(board)
+        point = 2 * (board.size + 2) + 2
+
+        self.assertFalse(playout_board.play(point, WHITE))
+        self.assertTrue(playout_board.play(point, BLACK))
+
+    def test_matches_board(self):
+        rng = random.Random(5)
+        for _ in range(20):
+            board = Board.generate_empty_board(7)
+            playout_board = PlayoutBoard(board)
+            positions = point_positions(board.size)
+            value = BLACK
+            for _ in range(150):
+                point = rng.choice(board_points(board.size))
+                if board._points[point] != EMPTY:
+                    continue
+                legal = not (
+                    point == board._ko_point and value == board._ko_value
+                ) and not board._is_suicide(point, value)
+                self.assertEqual(playout_board.play(point, value), legal)
+                if legal:
+                    stone = Stone.BLACK if value == BLACK else Stone.WHITE
+                    board.play(Move(position=positions[point], figure=stone))
+                    value = -value
+                self.assertEqual(playout_board._points, board._points.tolist())
+            self.assertEqual(
+                playout_board._white_captured, board.white_captured
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,12 @@ class TestPlayer(unittest.TestCase):
 
         self.assertEqual(a + b, Position(4, 6))
 
+    def test_interned_positions(self):
+        self.assertIs(Position.of(3, 4), Position.of(3, 4))
+        self.assertIs(Position(1, 2) + Position(2, 2), Position.of(3, 4))
+        self.assertIs(Position.of(-1, 19), Position.of(-1, 19))
+        self.assertEqual(Position.of(30, -5), Position(30, -5))
+
 
 if __name__ == "__main__":
     unittest.main()
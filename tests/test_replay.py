@@ -0,0 +1,132 @@
+import unittest
+
+from parameterized import parameterized  # type: ignore[import-untyped]
+
+from weiqi.arena import play_game
+from weiqi.core.figure import Stone
+from weiqi.core.move import Move, MoveHistory
+from weiqi.core.position import Position
+from weiqi.players.bot import RandomBot
+from weiqi.records import GameRecord, replay_game, replay_games
+from weiqi.utils.enums import KoRule
+
+KO = GameRecord(
+    size=5,
+    black_stones=(Position(1, 0), Position(0, 1), Position(1, 2)),
+    white_stones=(
+        Position(2, 0),
+        Position(1, 1),
+        Position(3, 1),
+        Position(2, 2),
+    ),
+)
+
+
+def _moves(*positions: Position | None) -> tuple[Move, ...]:
+    return tuple(
+        Move(position, Stone.BLACK if index % 2 == 0 else Stone.WHITE)
+        for index, position in enumerate(positions)
+    )
+
+
+class TestReplay(unittest.TestCase):
+    def test_matches_game(self):
+        for seed in range(5):
+            result = play_game(RandomBot, RandomBot, size=7, seed=seed)
+            game = GameRecord(
+                size=7, komi=6.5, moves=_moves(*result.moves)
+            ).to_game()
+
+            replay = replay_game(MoveHistory(game.move_history), size=7)
+
+            self.assertTrue(replay.legal)
+            self.assertEqual(replay.moves, result.move_count)
+            self.assertEqual(replay.hash, game.board.hash)
+            self.assertEqual(replay.black_score, result.black_score)
+            self.assertEqual(replay.white_score, result.white_score)
+
+    @parameterized.expand(
+        [
+            (KoRule.POSITIONAL, 1),
+            (KoRule.SITUATIONAL, 1),
+            (None, None),
+        ]
+    )
+    def test_ko(self, ko_rule: KoRule | None, illegal_move: int | None):
+        record = GameRecord(
+            size=5,
+            black_stones=KO.black_stones,
+            white_stones=KO.white_stones,
+            moves=_moves(Position(2, 1), Position(1, 1)),
+        )
+
+        result = replay_game(record, ko_rule=ko_rule)
+
+        self.assertEqual(result.illegal_move, illegal_move)
+        if illegal_move is not None:
+            self.assertEqual(
+                result.error, "Move repeats a previous position (ko)."
+            )
+
+    def test_superko_after_passes(self):
+        record = GameRecord(
+            size=5,
+            black_stones=KO.black_stones,
+            white_stones=KO.white_stones,
+            moves=_moves(Position(2, 1), None, None, Position(1, 1)),
+        )
+        board = record.to_board()
+        board.play(record.moves[0])
+
+        result = replay_game(record)
+
+        self.assertEqual(result.illegal_move, 3)
+        self.assertEqual(result.hash, board.hash)
+        score = board.score
+        self.assertEqual(result.black_score, score[Stone.BLACK])
+
+    @parameterized.expand(
+        [
+            (_moves(Position(5, 0)), "Position out of bounds."),
+            (
+                _moves(Position(0, 0), Position(0, 0)),
+                "Intersection occupied by existing stone.",
+            ),
+            (
+                _moves(
+                    Position(0, 1),
+                    Position(1, 1),
+                    Position(1, 0),
+                    Position(0, 0),
+                ),
+                "New group has zero liberties (suicide)",
+            ),
+        ]
+    )
+    def test_illegal_moves(self, moves: tuple[Move, ...], error: str):
+        result = replay_game(GameRecord(size=5, moves=moves))
+
+        self.assertEqual(result.illegal_move, len(moves) - 1)
+        self.assertEqual(result.error, error)
+
+    def test_replay_games_in_workers(self):
+        games = [
+            GameRecord(size=5, moves=_moves(Position(index % 5, 0)))
+            for index in range(10)
+        ]
+        games.append(GameRecord(size=5, moves=_moves(Position(9, 9))))
+
+        results = sorted(
+            replay_games(iter(games), workers=2, batch_size=3),
+            key=lambda result: result.index,
+        )
+
+        indices = [result.index for result in results]
+        self.assertEqual(indices, list(range(11)))
+        self.assertTrue(results[-2].legal)
+        self.assertFalse(results[-1].legal)
+        self.assertEqual(results[0], replay_game(games[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import io
+import os
+import tempfile
+import unittest
+
+from parameterized import parameterized  # type: ignore[import-untyped]
+
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.game import WeiqiGame
+from weiqi.core.move import Move
+from weiqi.core.position import Position
+from weiqi.players.player import Player
+from weiqi.records import GameRecord, parse_sgf, read_sgf, write_sgf
+from weiqi.records.replay import replay_game
+
+COLLECTION = r"""
+(;FF[4]GM[1]SZ[9]KM[6.5]PB[Alice]PW[Bob]RE[W+2.5]
+C[A comment with \] and ( inside]
+;B[ee];W[ce]
+(;B[gc]C[main line];W[])
+(;B[cc];W[gc]))
+Some text between games.
+(;GM[1]SZ[5]AB[aa:bb][dd]AW[ca]PL[W];W[cc]C[(];B[]
+;W[tt])
+"""
+
+
+class TestSGF(unittest.TestCase):
+    @parameterized.expand([(5,), (64,), (1 << 16,)])
+    def test_read_collection(self, chunk_size: int):
+        first, second = read_sgf(io.StringIO(COLLECTION), chunk_size)
+
+        self.assertEqual(first.size, 9)
+        self.assertEqual(first.komi, 6.5)
+        self.assertEqual(first.result, "W+2.5")
+        self.assertEqual(first.properties["PB"], ("Alice",))
+        self.assertEqual(
+            first.properties["C"], ("A comment with ] and ( inside",)
+        )
+        self.assertEqual(
+            first.moves,
+            (
+                Move(Position(4, 4), Stone.BLACK),
+                Move(Position(2, 4), Stone.WHITE),
+                Move(Position(6, 2), Stone.BLACK),
+                Move(None, Stone.WHITE),
+            ),
+        )
+
+        self.assertEqual(second.size, 5)
+        self.assertEqual(second.komi, 0)
+        self.assertEqual(
+            second.black_stones,
+            (
+                Position(0, 0),
+                Position(1, 0),
+                Position(0, 1),
+                Position(1, 1),
+                Position(3, 3),
+            ),
+        )
+        self.assertEqual(second.white_stones, (Position(2, 0),))
+        self.assertEqual(
+            [move.position for move in second.moves],
+            [Position(2, 2), None, None],
+        )
+
+    def test_setup_board_and_game(self):
+        (record,) = parse_sgf("(;SZ[5]AB[aa][bb]AW[cc];W[dd];B[ab])")
+
+        board = record.to_board()
+        self.assertEqual(board.figures[Position(1, 1)], Stone.BLACK)
+        self.assertEqual(board.figures[Position(2, 2)], Stone.WHITE)
+
+        game = record.to_game()
+        self.assertEqual(game.turn, Stone.WHITE)
+        self.assertEqual(len(game.move_history), 2)
+        self.assertEqual(game.board.figures[Position(0, 1)], Stone.BLACK)
+
+    @parameterized.expand(
+        [
+            ("(;SZ[9]KM[0.5];B[cc];B[gg];W[ee])", 4),
+            ("(;SZ[9]KM[0.5];B[cc];W[];B[];W[ee];W[gg])", 6),
+        ]
+    )
+    def test_moves_out_of_turn(self, text: str, moves: int):
+        (record,) = parse_sgf(text)
+        game = record.to_game()
+        result = replay_game(record)
+
+        self.assertIsNone(result.illegal_move)
+        self.assertEqual(len(game.move_history), moves)
+        self.assertFalse(game.game_status.is_over)
+        self.assertEqual(game.board.hash, result.hash)
+        self.assertEqual(game.board.figures[Position(4, 4)], Stone.WHITE)
+
+    def test_round_trip(self):
+        black = Player(Stone.BLACK)
+        white = Player(Stone.WHITE)
+        game = WeiqiGame(Board.generate_empty_board(9), black, white)
+        black.make_move(game, Position(2, 2))
+        white.make_move(game, Position(6, 6))
+        black.make_move(game, Position(2, 6))
+        white.make_move(game, None)
+        black.make_move(game, None)
+        record = GameRecord.from_game(game, PB="Alice]")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.sgf")
+            self.assertEqual(write_sgf([record, record], path), 2)
+            records = list(read_sgf(path))
+
+        self.assertEqual(records, [record, record])
+        self.assertTrue(record.result and record.result.startswith("W+"))
+        replay = records[0].to_game()
+        self.assertEqual(replay.board.to_bytes(), game.board.to_bytes())
+        self.assertEqual(list(replay.move_history), list(game.move_history))
+
+    @parameterized.expand(
+        [
+            ("(;SZ[9];B[ee]",),
+            ("(;GM[2])",),
+            ("(;SZ[9];B[e])",),
+            ("(;SZ[nine])",),
+            ("(;SZ[9];B[ee]AB[aa])",),
+        ]
+    )
+    def test_invalid_data(self, text: str):
+        with self.assertRaises(ValueError):
+            parse_sgf(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
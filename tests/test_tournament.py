@@ -0,0 +1,94 @@
+import unittest
+from functools import partial
+
+from parameterized import parameterized  # type: ignore[import-untyped]
+
+from weiqi.arena import SPRT, Decision, PairStats, Tournament
+from weiqi.players.bot import RandomBot
+from weiqi.players.mcts import MCTSBot
+
+
+class TestTournament(unittest.TestCase):
+    def test_round_robin_alternates_colors(self):
+        tournament = Tournament(
+            {"a": RandomBot, "b": RandomBot, "c": RandomBot},
+            games=2,
+            size=5,
+            workers=1,
+        )
+        games = list(tournament.run())
+
+        self.assertEqual(len(games), 6)
+        colors = {(game.black, game.white) for game in games}
+        self.assertEqual(len(colors), 6)
+        for stats in tournament.pairs:
+            self.assertEqual(stats.games, 2)
+        ratings = tournament.ratings()
+        self.assertAlmostEqual(sum(r.elo for r in ratings.values()), 0)
+        for rating in ratings.values():
+            self.assertEqual(rating.games, 4)
+            self.assertLessEqual(rating.low, rating.elo)
+            self.assertGreaterEqual(rating.high, rating.elo)
+
+    def test_gauntlet_with_sprt_stops_early(self):
+        tournament = Tournament(
+            {
+                "mcts": partial(MCTSBot, playouts=100),
+                "random": RandomBot,
+            },
+            games=100,
+            schedule="gauntlet",
+            challenger="mcts",
+            size=5,
+            workers=1,
+            sprt=SPRT(elo0=0, elo1=200, alpha=0.1, beta=0.1),
+        )
+        games = list(tournament.run())
+
+        (stats,) = tournament.pairs
+        self.assertEqual(stats.decision, Decision.H1)
+        self.assertLess(len(games), 100)
+        self.assertGreater(stats.elo(), 0)
+        ratings = tournament.ratings()
+        self.assertGreater(ratings["mcts"].elo, ratings["random"].elo)
+
+    def test_shared_seed_for_both_colors(self):
+        tournament = Tournament(
+            {"a": RandomBot, "b": RandomBot}, games=4, size=5, workers=1
+        )
+        seeds = [game.result.seed for game in tournament.run()]
+
+        self.assertEqual(seeds[0], seeds[1])
+        self.assertEqual(seeds[2], seeds[3])
+
+    @parameterized.expand(
+        [
+            ({"a": RandomBot}, "round_robin", None),
+            ({"a": RandomBot, "b": RandomBot}, "swiss", None),
+            ({"a": RandomBot, "b": RandomBot}, "gauntlet", "c"),
+        ]
+    )
+    def test_invalid_arguments(self, bots, schedule, challenger):
+        with self.assertRaises(ValueError):
+            Tournament(bots, 2, schedule=schedule, challenger=challenger)
+
+
+class TestSPRT(unittest.TestCase):
+    def test_decisions(self):
+        sprt = SPRT(elo0=0, elo1=10)
+
+        self.assertIsNone(sprt.decision(10, 0, 10))
+        self.assertEqual(sprt.decision(700, 0, 300), Decision.H1)
+        self.assertEqual(sprt.decision(300, 0, 700), Decision.H0)
+
+    def test_elo_interval(self):
+        stats = PairStats("a", "b", wins=60, draws=0, losses=40)
+
+        low, high = stats.elo_interval()
+        self.assertAlmostEqual(stats.elo(), 70.4, places=1)
+        self.assertLess(low, stats.elo())
+        self.assertGreater(high, stats.elo())
+
+
+if __name__ == "__main__":
+    unittest.main()
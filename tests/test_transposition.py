@@ -0,0 +1,80 @@
+import unittest
+
+from parameterized import parameterized  # type: ignore[import-untyped]
+
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.game import WeiqiGame
+from weiqi.core.position import Position
+from weiqi.players.mcts import MCTSBot
+from weiqi.players.player import Player
+from weiqi.players.transposition import TranspositionTable, position_key
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_lru_eviction(self):
+        table = TranspositionTable(capacity=2)
+        table.store(1, visits=1)
+        table.store(2, visits=2)
+        table.get(1)
+        table.store(3, visits=3)
+
+        self.assertEqual(len(table), 2)
+        self.assertIn(1, table)
+        self.assertNotIn(2, table)
+        self.assertEqual(table.evictions, 1)
+
+    def test_depth_replacement(self):
+        table = TranspositionTable(capacity=4, replacement="depth")
+        self.assertTrue(table.store(1, visits=10, depth=5))
+
+        self.assertFalse(table.store(5, visits=1, depth=2))
+        self.assertIn(1, table)
+        self.assertTrue(table.store(5, visits=1, depth=5))
+        self.assertNotIn(1, table)
+        self.assertTrue(table.store(5, visits=2, depth=0))
+        self.assertEqual(len(table), 1)
+
+    def test_counters(self):
+        table = TranspositionTable()
+        table.store(7, visits=3, wins=2, best_move=Position(1, 2))
+
+        entry = table.get(7)
+        self.assertIsNone(table.get(8))
+
+        assert entry is not None
+        self.assertEqual(entry.best_move, Position(1, 2))
+        self.assertEqual((table.hits, table.misses), (1, 1))
+        self.assertEqual(table.hit_rate, 0.5)
+        table.clear()
+        self.assertEqual((len(table), table.hits, table.stores), (0, 0, 0))
+
+    def test_key_depends_on_turn(self):
+        board = Board.generate_empty_board(9)
+
+        self.assertNotEqual(
+            position_key(board, Stone.BLACK), position_key(board, Stone.WHITE)
+        )
+
+    @parameterized.expand([({"capacity": 0},), ({"replacement": "fifo"},)])
+    def test_invalid_arguments(self, arguments):
+        with self.assertRaises(ValueError):
+            TranspositionTable(**arguments)
+
+    def test_shared_by_bots(self):
+        table = TranspositionTable(capacity=1000)
+        for seed in (1, 2):
+            bot = MCTSBot(
+                Stone.WHITE, playouts=300, seed=seed, transpositions=table
+            )
+            board = Board.generate_empty_board(5)
+            game = WeiqiGame(board, Player(Stone.BLACK), bot, turn=Stone.WHITE)
+            hits = table.hits
+            bot.make_move(game)
+
+        # The second bot found the moves searched by the first one.
+        self.assertGreater(table.hits - hits, 1)
+        entry = table.get(position_key(game.board, Stone.BLACK))
+        assert entry is not None
+        self.assertGreater(entry.visits, 0)
+        self.assertGreater(entry.depth, 0)
@@ -0,0 +1,65 @@
+import unittest
+from parameterized import parameterized  # type: ignore[import-untyped]
+
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+
+try:
+    import numpy as np
+
+    from weiqi.core import vectorized
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+STATES = [
+    ".W.../W.WWW/BWBBB/.B.../.....",
+    ".B.W./.B.W./.B.W./.BBW./..BW.",
+    "...../...../...../...../.....",
+    "...../...../...../..B../.....",
+    "B.W../.BW../BW.W./WWWB./...B.",
+]
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestVectorized(unittest.TestCase):
+    @parameterized.expand([(state,) for state in STATES])
+    def test_find_territories_matches_python(self, state: str):
+        board = Board(state)
+        self.assertEqual(
+            board.find_territories(backend="numpy"), board.find_territories()
+        )
+
+    def test_ownership_array(self):
+        board = Board(".W.../W.WWW/BWBBB/.B.../.....")
+        _, owner = vectorized.find_territories(board)
+        self.assertEqual(
+            owner.tolist(),
+            [
+                [-1, 0, -1, -1, -1],
+                [0, -1, 0, 0, 0],
+                [0, 0, 0, 0, 0],
+                [1, 0, 1, 1, 1],
+                [1, 1, 1, 1, 1],
+            ],
+        )
+
+    def test_batch_score(self):
+        boards = [Board(state) for state in STATES]
+        boards.append(Board(".W.../WBW../.W.../..BB./.BWWB"))
+        states = np.array([board.state_as_matrix for board in boards])
+        scores = vectorized.score(
+            states,
+            np.array([board.white_captured for board in boards]),
+            np.array([board.black_captured for board in boards]),
+        )
+        self.assertEqual(
+            scores.tolist(),
+            [
+                [board.score[Stone.BLACK], board.score[Stone.WHITE]]
+                for board in boards
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,22 @@
 from weiqi.core.game import WeiqiGame
-from weiqi.core.board import Board
+from weiqi.core.board import Board, BoardSnapshot
+from weiqi.core.delta import Delta
 from weiqi.core.figure import Stone
 from weiqi.core.position import Position
 from weiqi.core.move import Move, MoveHistory
 from weiqi.players.player import Player
 from weiqi.players.bot import BaseBot, RandomBot
+from weiqi.players.mcts import MCTSBot
+from weiqi.players.transposition import TranspositionTable
 from weiqi.utils.game_status import GameStatus
-from weiqi.utils.enums import Winner
+from weiqi.utils.enums import KoRule, Winner
 
 
 __all__ = [
     "WeiqiGame",
     "Board",
+    "BoardSnapshot",
+    "Delta",
     "Stone",
     "Position",
     "Move",
@@ -19,6 +24,9 @@ __all__ = [
     "Player",
     "BaseBot",
     "RandomBot",
+    "MCTSBot",
+    "TranspositionTable",
     "GameStatus",
     "Winner",
+    "KoRule",
 ]
@@ -0,0 +1,29 @@
+from weiqi.arena.selfplay import (
+    BotFactory,
+    GameResult,
+    play_game,
+    play_games,
+    run_games,
+)
+from weiqi.arena.tournament import (
+    SPRT,
+    Decision,
+    PairStats,
+    Rating,
+    Tournament,
+    TournamentGame,
+)
+
+__all__ = (
+    "BotFactory",
+    "GameResult",
+    "play_game",
+    "play_games",
+    "run_games",
+    "SPRT",
+    "Decision",
+    "PairStats",
+    "Rating",
+    "Tournament",
+    "TournamentGame",
+)
@@ -0,0 +1,141 @@
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+import random
+import time
+
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.game import WeiqiGame
+from weiqi.core.position import Position
+from weiqi.players.bot import BaseBot
+from weiqi.utils.enums import Winner
+from weiqi.utils.pool import imap_unordered
+
+# Creates a bot playing the stone. Bot classes, module-level functions and
+# functools.partial objects can be sent to worker processes.
+BotFactory = Callable[[Stone], BaseBot]
+
+
+@dataclass(frozen=True)
+class GameResult:
+    """Result of a headless game between two bots."""
+
+    index: int
+    seed: int
+    winner: Winner | None
+    black_score: int | None
+    white_score: float | int | None
+    moves: tuple[Position | None, ...]
+    move_times: tuple[float, ...]  # Seconds spent by the bot on each move.
+    truncated: bool = False  # Scored as is when the move limit was hit.
+
+    @property
+    def move_count(self) -> int:
+        return len(self.moves)
+
+
+def play_game(
+    black: BotFactory,
+    white: BotFactory,
+    size: int = 9,
+    komi: float | int = 6.5,
+    seed: int = 0,
+    max_moves: int | None = None,
+    index: int = 0,
+) -> GameResult:
+    """
+    Plays one game between two bots, until both pass or the move limit.
+
+    The random module is seeded before the bots are created, so bots that
+    draw from it play the same game for the same seed. Its state is put
+    back afterwards, so callers playing games in-process keep their own
+    sequence.
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        return _play_game(black, white, size, komi, seed, max_moves, index)
+    finally:
+        random.setstate(state)
+
+
+def _play_game(
+    black: BotFactory,
+    white: BotFactory,
+    size: int,
+    komi: float | int,
+    seed: int,
+    max_moves: int | None,
+    index: int,
+) -> GameResult:
+    bots = {Stone.BLACK: black(Stone.BLACK), Stone.WHITE: white(Stone.WHITE)}
+    game = WeiqiGame(
+        Board.generate_empty_board(size),
+        bots[Stone.BLACK],
+        bots[Stone.WHITE],
+        komi=komi,
+        headless=True,
+    )
+
+    moves: list[Position | None] = []
+    move_times: list[float] = []
+    truncated = False
+    while not game.game_status.is_over:
+        if max_moves is not None and len(moves) >= max_moves:
+            game.end_by_score()
+            truncated = True
+            break
+        start = time.perf_counter()
+        move = bots[game.turn].make_move(game)
+        move_times.append(time.perf_counter() - start)
+        moves.append(move.position)
+
+    status = game.game_status
+    return GameResult(
+        index=index,
+        seed=seed,
+        winner=status.winner,
+        black_score=status.black_score,
+        white_score=status.white_score,
+        moves=tuple(moves),
+        move_times=tuple(move_times),
+        truncated=truncated,
+    )
+
+
+def play_games(
+    black: BotFactory,
+    white: BotFactory,
+    games: int,
+    size: int = 9,
+    komi: float | int = 6.5,
+    seed: int = 0,
+    workers: int | None = None,
+    max_moves: int | None = None,
+) -> Iterator[GameResult]:
+    """
+    Plays games between two bots in worker processes.
+
+    Every game gets its own seed, drawn from a generator seeded with
+    ``seed``, so each game is reproducible on its own with ``play_game``.
+    Results are yielded as soon as the games finish, not in order. With
+    one worker, the games are played in this process.
+    """
+    rng = random.Random(seed)
+    tasks = (
+        (black, white, size, komi, rng.getrandbits(32), max_moves, index)
+        for index in range(games)
+    )
+    return run_games(tasks, workers)
+
+
+def run_games(
+    tasks: Iterable[tuple], workers: int | None = None
+) -> Iterator[GameResult]:
+    """
+    Runs ``play_game`` with every tuple of arguments in a process pool.
+
+    Only a few tasks per worker are submitted ahead, so long or endless
+    task streams are fine. Results are yielded as the games finish.
+    """
+    return imap_unordered(play_game, tasks, workers)
@@ -0,0 +1,307 @@
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from enum import Enum
+from itertools import combinations
+import math
+import random
+
+from weiqi.arena.selfplay import BotFactory, GameResult, run_games
+from weiqi.utils.enums import Winner
+
+
+def elo_difference(score: float) -> float:
+    """Elo difference that gives the expected score (0..1)."""
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return -400 * math.log10(1 / score - 1)
+
+
+def expected_score(elo: float) -> float:
+    """Expected score of a player rated ``elo`` above the opponent."""
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+class Decision(Enum):
+    """Outcome of a sequential probability ratio test."""
+
+    H0 = 1  # The Elo difference is at most elo0.
+    H1 = 2  # The Elo difference is at least elo1.
+
+
+@dataclass(frozen=True)
+class SPRT:
+    """
+    Sequential probability ratio test between two Elo hypotheses.
+
+    The log-likelihood ratio of the game results is the generalized SPRT
+    approximation used by engine testing frameworks; the test stops when
+    it leaves the bounds given by ``alpha`` and ``beta``.
+    """
+
+    elo0: float = 0.0
+    elo1: float = 10.0
+    alpha: float = 0.05
+    beta: float = 0.05
+
+    def llr(self, wins: int, draws: int, losses: int) -> float:
+        games = wins + draws + losses
+        if not wins + draws or not losses + draws:
+            # All games won or lost: no variance to measure yet.
+            games += 2
+            wins += 1
+            losses += 1
+        score = (wins + draws / 2) / games
+        variance = (
+            wins * (1 - score) ** 2
+            + draws * (0.5 - score) ** 2
+            + losses * score**2
+        ) / games
+        if variance == 0:
+            return 0.0
+        score0 = expected_score(self.elo0)
+        score1 = expected_score(self.elo1)
+        return (
+            (score1 - score0)
+            * (2 * score - score0 - score1)
+            / (2 * variance / games)
+        )
+
+    def decision(self, wins: int, draws: int, losses: int) -> Decision | None:
+        llr = self.llr(wins, draws, losses)
+        if llr >= math.log((1 - self.beta) / self.alpha):
+            return Decision.H1
+        if llr <= math.log(self.beta / (1 - self.alpha)):
+            return Decision.H0
+        return None
+
+
+@dataclass
+class PairStats:
+    """Results of the games between two bots, seen from the first one."""
+
+    first: str
+    second: str
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    decision: Decision | None = None
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self) -> float:
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.5
+
+    def elo(self) -> float:
+        return elo_difference(self.score)
+
+    def elo_interval(self, z: float = 1.96) -> tuple[float, float]:
+        """Confidence interval of the Elo difference (95% by default)."""
+        low, high = _score_interval(
+            self.wins, self.draws, self.losses, z
+        )
+        return elo_difference(low), elo_difference(high)
+
+
+@dataclass(frozen=True)
+class Rating:
+    """Elo rating of a bot in a tournament, the mean rating being 0."""
+
+    elo: float
+    low: float
+    high: float
+    games: int
+    score: float
+
+
+@dataclass(frozen=True)
+class TournamentGame:
+    """A finished game of a tournament."""
+
+    black: str
+    white: str
+    result: GameResult
+
+
+def _score_interval(
+    wins: int, draws: int, losses: int, z: float
+) -> tuple[float, float]:
+    games = wins + draws + losses
+    if not games:
+        return 0.0, 1.0
+    score = (wins + draws / 2) / games
+    variance = (
+        wins * (1 - score) ** 2
+        + draws * (0.5 - score) ** 2
+        + losses * score**2
+    ) / games
+    margin = z * math.sqrt(variance / games)
+    return max(score - margin, 0.0), min(score + margin, 1.0)
+
+
+class Tournament:
+    """
+    Matches between bots, played in worker processes.
+
+    ``round_robin`` pairs every two bots, ``gauntlet`` pairs the challenger
+    with each other bot. Every pairing plays up to ``games`` games with
+    colors alternating, and each two consecutive games of a pairing share
+    a seed so both bots get the same start with either color. With an
+    SPRT, a pairing stops as soon as the test decides it; results of games
+    already running when that happens are still counted.
+    """
+
+    def __init__(
+        self,
+        bots: Mapping[str, BotFactory],
+        games: int,
+        schedule: str = "round_robin",
+        challenger: str | None = None,
+        size: int = 9,
+        komi: float | int = 6.5,
+        seed: int = 0,
+        workers: int | None = None,
+        max_moves: int | None = None,
+        sprt: SPRT | None = None,
+    ):
+        if len(bots) < 2:
+            raise ValueError("At least two bots are required.")
+        if schedule == "round_robin":
+            pairs = list(combinations(bots, 2))
+        elif schedule == "gauntlet":
+            if challenger is None or challenger not in bots:
+                raise ValueError("Challenger must be one of the bots.")
+            pairs = [(challenger, name) for name in bots if name != challenger]
+        else:
+            raise ValueError("Schedule must be round_robin or gauntlet.")
+
+        self._bots = dict(bots)
+        self._games = games
+        self._size = size
+        self._komi = komi
+        self._seed = seed
+        self._workers = workers
+        self._max_moves = max_moves
+        self._sprt = sprt
+        self._pairs = {pair: PairStats(*pair) for pair in pairs}
+        self._scheduled: dict[int, tuple[str, str, tuple[str, str]]] = {}
+
+    @property
+    def pairs(self) -> list[PairStats]:
+        return list(self._pairs.values())
+
+    def run(self) -> Iterator[TournamentGame]:
+        """Plays the tournament, yielding the games as they finish."""
+        for result in run_games(self._tasks(), self._workers):
+            black, white, pair = self._scheduled.pop(result.index)
+            self._record(pair, black, result.winner)
+            yield TournamentGame(black, white, result)
+
+    def _tasks(self) -> Iterator[tuple]:
+        rng = random.Random(self._seed)
+        index = 0
+        for round_ in range(self._games):
+            if round_ % 2 == 0:
+                seed = rng.getrandbits(32)
+            for pair, stats in self._pairs.items():
+                if stats.decision is not None:
+                    continue
+                first, second = pair
+                black, white = (
+                    (first, second) if round_ % 2 == 0 else (second, first)
+                )
+                self._scheduled[index] = (black, white, pair)
+                yield (
+                    self._bots[black],
+                    self._bots[white],
+                    self._size,
+                    self._komi,
+                    seed,
+                    self._max_moves,
+                    index,
+                )
+                index += 1
+
+    def _record(
+        self, pair: tuple[str, str], black: str, winner: Winner | None
+    ) -> None:
+        stats = self._pairs[pair]
+        if winner is None or winner == Winner.DRAW:
+            stats.draws += 1
+        elif (winner == Winner.BLACK) == (black == stats.first):
+            stats.wins += 1
+        else:
+            stats.losses += 1
+        if self._sprt is not None and stats.decision is None:
+            stats.decision = self._sprt.decision(
+                stats.wins, stats.draws, stats.losses
+            )
+
+    def ratings(self, z: float = 1.96) -> dict[str, Rating]:
+        """
+        Elo ratings of the bots from all the games played so far.
+
+        Ratings are the Bradley-Terry fit of the results, with a draw added
+        to every pairing so unbeaten bots get finite ratings. Intervals come
+        from the spread of each bot's own results.
+        """
+        names = list(self._bots)
+        # Wins and games of every bot, against each opponent.
+        wins = {name: 0.0 for name in names}
+        totals = {name: [0, 0, 0] for name in names}
+        games: dict[tuple[str, str], float] = {}
+        for stats in self._pairs.values():
+            if not stats.games:
+                continue
+            pair = (stats.first, stats.second)
+            games[pair] = stats.games + 1
+            wins[stats.first] += stats.wins + (stats.draws + 1) / 2
+            wins[stats.second] += stats.losses + (stats.draws + 1) / 2
+            for name, won, lost in (
+                (stats.first, stats.wins, stats.losses),
+                (stats.second, stats.losses, stats.wins),
+            ):
+                totals[name][0] += won
+                totals[name][1] += stats.draws
+                totals[name][2] += lost
+
+        strengths = {name: 1.0 for name in names}
+        for _ in range(1000):
+            updated = {}
+            for name in names:
+                denominator = sum(
+                    count / (strengths[first] + strengths[second])
+                    for (first, second), count in games.items()
+                    if name in (first, second)
+                )
+                updated[name] = (
+                    wins[name] / denominator if denominator else 1.0
+                )
+            mean = math.exp(
+                sum(math.log(value) for value in updated.values())
+                / len(updated)
+            )
+            updated = {name: value / mean for name, value in updated.items()}
+            converged = all(
+                abs(updated[name] - strengths[name]) < 1e-9 for name in names
+            )
+            strengths = updated
+            if converged:
+                break
+
+        ratings = {}
+        for name in names:
+            elo = 400 * math.log10(strengths[name])
+            won, drawn, lost = totals[name]
+            played = won + drawn + lost
+            score = (won + drawn / 2) / played if played else 0.5
+            low, high = _score_interval(won, drawn, lost, z)
+            ratings[name] = Rating(
+                elo=elo,
+                low=elo + elo_difference(low) - elo_difference(score),
+                high=elo + elo_difference(high) - elo_difference(score),
+                games=played,
+                score=score,
+            )
+        return ratings
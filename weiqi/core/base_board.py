@@ -0,0 +1,388 @@
+from array import array
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from functools import lru_cache
+from typing import Literal
+import struct
+
+from weiqi.core.geometry import geometry
+from weiqi.core.group import Group
+from weiqi.core.position import Position
+from weiqi.core.figure import Stone
+
+# Values stored in the padded point array of the board.
+EMPTY = 0
+BLACK = 1
+WHITE = -1
+BORDER = 2
+
+AVAILABLE_SIZES = frozenset({5, 6, 7, 8, 9, 11, 13, 15, 17, 19})
+
+# Header of the packed board: size, capture counters and ko.
+BYTES_HEADER = struct.Struct("<BIIHb")
+
+STONE_VALUES: dict[Stone, int] = {Stone.BLACK: BLACK, Stone.WHITE: WHITE}
+VALUE_STONES: dict[int, Stone | None] = {
+    BLACK: Stone.BLACK,
+    WHITE: Stone.WHITE,
+    EMPTY: None,
+}
+
+
+@lru_cache(maxsize=None)
+def point_positions(size: int) -> tuple[Position, ...]:
+    """Positions of the padded point indices (border cells are off-board)."""
+    stride = size + 2
+    return tuple(
+        Position.of(point % stride - 1, point // stride - 1)
+        for point in range(stride * stride)
+    )
+
+
+def board_points(size: int) -> tuple[int, ...]:
+    """Padded point indices of the intersections, row by row."""
+    return geometry(size).points
+
+
+class FiguresView(Mapping[Position, Stone | None]):
+    """Read-only mapping of positions to stones, backed by the board."""
+
+    __slots__ = ("_board",)
+
+    def __init__(self, board: "BaseBoard"):
+        self._board = board
+
+    def __getitem__(self, position: Position) -> Stone | None:
+        board = self._board
+        if not isinstance(position, Position) or not board.position_in_bounds(
+            position
+        ):
+            raise KeyError(position)
+        return VALUE_STONES[board._points[board._index(position)]]
+
+    def __iter__(self) -> Iterator[Position]:
+        positions = point_positions(self._board.size)
+        return (positions[point] for point in board_points(self._board.size))
+
+    def __len__(self) -> int:
+        return self._board.size**2
+
+
+class BaseBoard:
+    """
+    Read-only queries shared by the board and its snapshots.
+
+    Intersections are kept in a padded one-dimensional array with a ring of
+    border cells. The neighbors of every point are read from the geometry
+    tables of the size, shared by all boards, so nothing is bounds checked.
+    """
+
+    __slots__ = (
+        "_size",
+        "_stride",
+        "_neighbors",
+        "_points",
+        "_white_captured",
+        "_black_captured",
+        "_hash",
+        "_ko_point",
+        "_ko_value",
+    )
+
+    _size: int
+    _stride: int
+    _neighbors: tuple[tuple[int, ...], ...]
+    _points: array
+    _white_captured: int
+    _black_captured: int
+    _hash: int
+    _ko_point: int
+    _ko_value: int
+
+    @property
+    def figures(self) -> Mapping[Position, Stone | None]:
+        return FiguresView(self)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def white_captured(self) -> int:
+        """
+        Number of white stones captured by black player (stones).
+        """
+        return self._white_captured
+
+    @property
+    def black_captured(self) -> int:
+        """
+        Number of black stones captured by white player (stones).
+        """
+        return self._black_captured
+
+    @property
+    def hash(self) -> int:
+        """
+        Zobrist hash of the stones on the board.
+
+        It is updated incrementally on every move and is the same for equal
+        positions of boards of the same size.
+        """
+        return self._hash
+
+    @property
+    def ko(self) -> tuple[Position, Stone] | None:
+        """
+        Point of a ko that was just taken and the stone that may not retake
+        it with the next move, if any.
+        """
+        if not self._ko_point:
+            return None
+        position = point_positions(self._size)[self._ko_point]
+        stone = Stone.BLACK if self._ko_value == BLACK else Stone.WHITE
+        return position, stone
+
+    def position_in_bounds(self, position: Position) -> bool:
+        return 0 <= position.x < self._size and 0 <= position.y < self._size
+
+    def _index(self, position: Position) -> int:
+        """Index of the position in the padded point array."""
+        return (position.y + 1) * self._stride + position.x + 1
+
+    def _point_at(self, position: Position) -> int:
+        """Index of an occupied position, validated."""
+        if not self.position_in_bounds(position):
+            raise ValueError("Position is empty.")
+        point = self._index(position)
+        if self._points[point] == EMPTY:
+            raise ValueError("Position is empty.")
+        return point
+
+    def _chain(self, point: int) -> tuple[Iterable[int], Collection[int]]:
+        """Stones and liberties of the chain occupying the point."""
+        points = self._points
+        neighbors = self._neighbors
+        value = points[point]
+        stones = {point}
+        liberties: set[int] = set()
+        stack = [point]
+        while stack:
+            current = stack.pop()
+            for neighbor in neighbors[current]:
+                neighbor_value = points[neighbor]
+                if neighbor_value == value:
+                    if neighbor not in stones:
+                        stones.add(neighbor)
+                        stack.append(neighbor)
+                elif neighbor_value == EMPTY:
+                    liberties.add(neighbor)
+        return stones, liberties
+
+    def _liberty_count(self, point: int) -> int:
+        return len(self._chain(point)[1])
+
+    def liberties_at(self, position: Position) -> int:
+        """Number of liberties of the chain at the position."""
+        return self._liberty_count(self._point_at(position))
+
+    def _is_suicide(self, point: int, value: int) -> bool:
+        """Checks if a stone on the empty point would have no liberties."""
+        points = self._points
+        for neighbor in self._neighbors[point]:
+            neighbor_value = points[neighbor]
+            if neighbor_value == EMPTY:
+                return False
+            count = self._liberty_count(neighbor)
+            # A friendly chain keeps another liberty, an enemy chain in
+            # atari is captured by the move.
+            if (count > 1) if neighbor_value == value else (count == 1):
+                return False
+        return True
+
+    def _legal_points(self, value: int) -> Iterator[tuple[int, int]]:
+        """Yields the bit and the point of every legal move, in one pass."""
+        points = self._points
+        ko_point = self._ko_point if value == self._ko_value else 0
+        is_suicide = self._is_suicide
+        for bit, point in enumerate(board_points(self._size)):
+            if (
+                points[point] == EMPTY
+                and point != ko_point
+                and not is_suicide(point, value)
+            ):
+                yield bit, point
+
+    def legal_moves(self, stone: Stone) -> list[Position]:
+        """
+        Returns every position the stone may be played on, row by row.
+
+        Occupied points, suicides and the point of a ko just taken by the
+        opponent are left out. Superko is checked by the game only.
+        """
+        positions = point_positions(self._size)
+        return [
+            positions[point]
+            for _, point in self._legal_points(STONE_VALUES[stone])
+        ]
+
+    def legal_moves_mask(self, stone: Stone) -> int:
+        """
+        Returns the legal moves of the stone as a bitmask.
+
+        Bit ``y * size + x`` is set if the stone may be played on (x, y).
+        """
+        mask = 0
+        for bit, _ in self._legal_points(STONE_VALUES[stone]):
+            mask |= 1 << bit
+        return mask
+
+    def chain_at(self, position: Position) -> Group:
+        """The chain (group) of stones at the position with its liberties."""
+        return self._group_at_position(position)
+
+    def _group_at_position(self, position: Position) -> Group:
+        point = self._point_at(position)
+        stones, liberties = self._chain(point)
+        positions = point_positions(self._size)
+        return Group(
+            positions={positions[stone] for stone in stones},
+            liberties={positions[liberty] for liberty in liberties},
+            figure=(
+                Stone.BLACK if self._points[point] == BLACK else Stone.WHITE
+            ),
+        )
+
+    def find_territories(
+        self, backend: Literal["python", "numpy"] = "python"
+    ) -> dict[Stone | None, set[Position]]:
+        """
+        Finds the territories of both colors and the neutral points.
+
+        The ``numpy`` backend needs NumPy installed (the ``numpy`` extra).
+        """
+        if backend == "numpy":
+            from weiqi.core.vectorized import find_territories
+
+            return find_territories(self)[0]
+
+        points = self._points
+        neighbors = self._neighbors
+        positions = point_positions(self._size)
+        visited: set[int] = set()
+        territories: dict[Stone | None, set[Position]] = {
+            Stone.BLACK: set(),
+            Stone.WHITE: set(),
+            None: set(),
+        }
+
+        for start in board_points(self._size):
+            if points[start] != EMPTY or start in visited:
+                continue
+
+            visited.add(start)
+            region = [start]
+            colors: set[int] = set()
+            stack = [start]
+            while stack:
+                current = stack.pop()
+                for neighbor in neighbors[current]:
+                    value = points[neighbor]
+                    if value == EMPTY:
+                        if neighbor not in visited:
+                            visited.add(neighbor)
+                            region.append(neighbor)
+                            stack.append(neighbor)
+                    else:
+                        colors.add(value)
+
+            owner = VALUE_STONES[colors.pop()] if len(colors) == 1 else None
+            territories[owner].update(positions[point] for point in region)
+
+        return territories
+
+    @property
+    def score(self) -> dict[Stone, int]:
+        territories = self.find_territories()
+        return self._score_of(
+            len(territories[Stone.BLACK]), len(territories[Stone.WHITE])
+        )
+
+    def _score_of(
+        self, black_score: int, white_score: int
+    ) -> dict[Stone, int]:
+        """Score of the board with the given territory sizes."""
+        max_figures = self.size**2
+        expected_score = max_figures - 1
+
+        # If one figure in board, score for white and black is 0,0 respectively
+        if expected_score == black_score or expected_score == white_score:
+            return {
+                Stone.BLACK: 0,
+                Stone.WHITE: 0,
+            }
+
+        return {
+            Stone.BLACK: black_score + self.white_captured,
+            Stone.WHITE: white_score + self.black_captured,
+        }
+
+    @property
+    def state_as_matrix(self) -> list[list[int]]:
+        """
+        Converts the board state to a matrix representation.
+
+        -1 - white stone
+        0 - empty intersection
+        1 - black stone
+
+        Returns:
+            list[list[int]]: The board state as a matrix.
+        """
+        state = []
+        for start in range(
+            self._stride + 1, self._stride * (self._size + 1), self._stride
+        ):
+            end = start + self._size
+            state.append(self._points[start:end].tolist())
+        return state
+
+    def to_bytes(self) -> bytes:
+        """
+        Packs the board into a compact byte string.
+
+        A small header with the size, the capture counters and the ko is
+        followed by one byte per intersection, row by row. The board is
+        unpacked with ``Board.from_bytes``.
+        """
+        header = BYTES_HEADER.pack(
+            self._size,
+            self._white_captured,
+            self._black_captured,
+            self._ko_point,
+            self._ko_value,
+        )
+        rows = []
+        for start in range(
+            self._stride + 1, self._stride * (self._size + 1), self._stride
+        ):
+            end = start + self._size
+            rows.append(self._points[start:end].tobytes())
+        return header + b"".join(rows)
+
+    @property
+    def state_as_string(self) -> str:
+        """
+        Converts the board state to a string representation.
+
+        W - white stone
+        B - black stone
+        . - empty intersection
+
+        Returns:
+            str: The board state as a string.
+        """
+        symbols = {BLACK: "B", WHITE: "W", EMPTY: "."}
+        return "/".join(
+            "".join(symbols[value] for value in row)
+            for row in self.state_as_matrix
+        )
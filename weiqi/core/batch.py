@@ -0,0 +1,432 @@
+"""
+Batches of boards of the same size, stored in NumPy arrays.
+
+This module needs NumPy, installed with the ``numpy`` extra of the package.
+"""
+
+from array import array
+from collections.abc import Sequence
+
+import numpy as np
+
+from weiqi.core.base_board import (
+    AVAILABLE_SIZES,
+    BaseBoard,
+    BLACK,
+    BORDER,
+    EMPTY,
+    STONE_VALUES,
+    WHITE,
+    board_points,
+)
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.vectorized import score
+
+
+class BoardBatch:
+    """
+    N boards of the same size, played one move per board at a time.
+
+    The boards are kept in one padded point array with the layout of
+    ``Board``: every board has a ring of border cells, so neighbors are
+    ``point +- 1`` and ``point +- stride`` for all boards at once, and the
+    rings keep the boards apart.
+
+    Moves are given as intersection indices ``y * size + x``, the bit
+    numbering of ``Board.legal_moves_mask``, and ``-1`` for a pass.
+    """
+
+    def __init__(
+        self,
+        states: np.ndarray | Sequence[list[list[int]]],
+        white_captured: np.ndarray | Sequence[int] | None = None,
+        black_captured: np.ndarray | Sequence[int] | None = None,
+    ):
+        states = np.asarray(states)
+        if states.ndim != 3 or states.shape[1] != states.shape[2]:
+            raise ValueError("Board must be square.")
+        if states.shape[1] not in AVAILABLE_SIZES:
+            raise ValueError("Not available size.")
+        if not np.isin(states, (EMPTY, BLACK, WHITE)).all():
+            raise ValueError("Invalid figures.")
+
+        count, size = states.shape[0], states.shape[1]
+        stride = size + 2
+        points = np.full((count, stride, stride), BORDER, dtype=np.int8)
+        points[:, 1:-1, 1:-1] = states
+        self._setup(
+            size,
+            points.reshape(-1),
+            self._counters(white_captured, count),
+            self._counters(black_captured, count),
+        )
+        self._build_chains()
+        self._remove_dead_chains()
+
+    def _setup(
+        self,
+        size: int,
+        points: np.ndarray,
+        white_captured: np.ndarray,
+        black_captured: np.ndarray,
+    ):
+        self._size = size
+        self._stride = size + 2
+        self._area = self._stride**2
+        self._count = len(points) // self._area
+        self._points = points
+        self._white_captured = white_captured
+        self._black_captured = black_captured
+        self._ko_points = np.zeros(self._count, dtype=np.int64)
+        self._ko_values = np.zeros(self._count, dtype=np.int8)
+        self._offsets = (1, -1, self._stride, -self._stride)
+        self._inner = (
+            np.arange(self._count, dtype=np.int64)[:, None] * self._area
+            + np.array(board_points(size), dtype=np.int64)
+        ).reshape(-1)
+
+    @staticmethod
+    def _counters(
+        values: np.ndarray | Sequence[int] | None, count: int
+    ) -> np.ndarray:
+        if values is None:
+            return np.zeros(count, dtype=np.int64)
+        result = np.array(values, dtype=np.int64)
+        if result.shape != (count,):
+            raise ValueError("Expected one value per board.")
+        return result
+
+    @classmethod
+    def empty(cls, count: int, size: int) -> "BoardBatch":
+        """Creates a batch of ``count`` empty boards."""
+        return cls(np.zeros((count, size, size), dtype=np.int8))
+
+    @classmethod
+    def from_boards(cls, boards: Sequence[BaseBoard]) -> "BoardBatch":
+        """Creates a batch from boards or snapshots of the same size."""
+        if not boards:
+            raise ValueError("At least one board is required.")
+        size = boards[0].size
+        if any(board.size != size for board in boards):
+            raise ValueError("Boards must have the same size.")
+
+        batch = cls.__new__(cls)
+        batch._setup(
+            size,
+            np.concatenate(
+                [
+                    np.frombuffer(board._points, dtype=np.int8)
+                    for board in boards
+                ]
+            ),
+            np.array([board.white_captured for board in boards], np.int64),
+            np.array([board.black_captured for board in boards], np.int64),
+        )
+        for index, board in enumerate(boards):
+            if board._ko_point:
+                batch._ko_points[index] = index * batch._area + board._ko_point
+                batch._ko_values[index] = board._ko_value
+        batch._build_chains()
+        return batch
+
+    def to_board(self, index: int) -> Board:
+        """Returns a new board with the state of one board of the batch."""
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        start = index * self._area
+        end = start + self._area
+        board = Board._from_points(
+            self._size,
+            array("b", self._points[start:end].tobytes()),
+            int(self._white_captured[index]),
+            int(self._black_captured[index]),
+        )
+        if self._ko_points[index]:
+            board._ko_point = int(self._ko_points[index]) - start
+            board._ko_value = int(self._ko_values[index])
+        return board
+
+    def to_boards(self) -> list[Board]:
+        return [self.to_board(index) for index in range(self._count)]
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def states(self) -> np.ndarray:
+        """Read-only view of the boards in the ``state_as_matrix`` layout."""
+        points = self._points.reshape(self._count, self._stride, self._stride)
+        states = points[:, 1:-1, 1:-1]
+        states.flags.writeable = False
+        return states
+
+    @property
+    def white_captured(self) -> np.ndarray:
+        """Number of white stones captured by black on every board."""
+        return self._white_captured.copy()
+
+    @property
+    def black_captured(self) -> np.ndarray:
+        """Number of black stones captured by white on every board."""
+        return self._black_captured.copy()
+
+    @property
+    def ko_points(self) -> np.ndarray:
+        """Intersection index of the ko of every board, -1 if none."""
+        local = self._ko_points % self._area
+        result = (local // self._stride - 1) * self._size
+        result += local % self._stride - 1
+        result[self._ko_points == 0] = -1
+        return result
+
+    @property
+    def score(self) -> np.ndarray:
+        """Black and white scores of every board, as ``Board.score``."""
+        return score(self.states, self._white_captured, self._black_captured)
+
+    def _values(
+        self, stones: Stone | Sequence[Stone] | np.ndarray
+    ) -> np.ndarray:
+        """Point values of the stone to play on every board."""
+        if isinstance(stones, Stone):
+            return np.full(self._count, STONE_VALUES[stones], dtype=np.int8)
+        if isinstance(stones, np.ndarray):
+            values = stones.astype(np.int8)
+        else:
+            values = np.array(
+                [STONE_VALUES[stone] for stone in stones], dtype=np.int8
+            )
+        if values.shape != (self._count,):
+            raise ValueError("Expected one value per board.")
+        if not np.isin(values, (BLACK, WHITE)).all():
+            raise ValueError("Invalid figures.")
+        return values
+
+    def _distinct(self, labels: list[np.ndarray], valid: list[np.ndarray]):
+        """
+        Marks the first occurrence of every label among the neighbors.
+
+        Both lists hold one array per direction; a label counts once per
+        point even if the chain touches the point from several sides.
+        """
+        result = []
+        for index, (label, ok) in enumerate(zip(labels, valid)):
+            first = ok.copy()
+            for other, other_ok in zip(labels[:index], valid[:index]):
+                first &= ~(other_ok & (other == label))
+            result.append(first)
+        return result
+
+    def _build_chains(self):
+        """Labels every chain with one of its points and counts liberties."""
+        points = self._points
+        stones = self._inner[points[self._inner] != EMPTY]
+        values = points[stones]
+
+        # Labels are spread along same-colored neighbors and shortcut by
+        # pointer jumping, so long chains take few passes.
+        links = []
+        for offset in self._offsets:
+            neighbors = stones + offset
+            same = points[neighbors] == values
+            links.append((stones[same], neighbors[same]))
+        labels = np.arange(len(points), dtype=np.int64)
+        current = labels[stones]
+        while True:
+            for source, target in links:
+                labels[source] = np.minimum(labels[source], labels[target])
+            labels[stones] = labels[labels[stones]]
+            updated = labels[stones]
+            if np.array_equal(updated, current):
+                break
+            current = updated
+
+        self._labels = labels
+        self._liberties = np.zeros(len(points), dtype=np.int64)
+        self._add_liberties(self._inner[points[self._inner] == EMPTY])
+
+    def _add_liberties(self, empties: np.ndarray):
+        """Adds the empty points to the liberties of the chains around."""
+        points = self._points
+        neighbors = [empties + offset for offset in self._offsets]
+        labels = [self._labels[neighbor] for neighbor in neighbors]
+        valid = [
+            (points[neighbor] == BLACK) | (points[neighbor] == WHITE)
+            for neighbor in neighbors
+        ]
+        for label, first in zip(labels, self._distinct(labels, valid)):
+            np.add.at(self._liberties, label[first], 1)
+
+    def _remove_dead_chains(self):
+        points = self._points
+        stones = self._inner[points[self._inner] != EMPTY]
+        dead = stones[self._liberties[self._labels[stones]] == 0]
+        if len(dead):
+            # Counted as captured, like the dead stones of Board.
+            boards = dead // self._area
+            values = points[dead]
+            self._black_captured += np.bincount(
+                boards[values == BLACK], minlength=self._count
+            )
+            self._white_captured += np.bincount(
+                boards[values == WHITE], minlength=self._count
+            )
+            points[dead] = EMPTY
+            self._build_chains()
+
+    def legal_mask(
+        self, stones: Stone | Sequence[Stone] | np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns the legal moves of the stone of every board.
+
+        The result is a boolean array of shape ``(n, size, size)``. As in
+        ``Board.legal_moves``, occupied points, suicides and the point of a
+        ko just taken by the opponent are left out.
+        """
+        value = self._values(stones)[:, None, None]
+        size = self._size
+        points = self._points.reshape(self._count, self._stride, self._stride)
+        counts = self._liberties[self._labels].reshape(points.shape)
+        legal = np.zeros((self._count, size, size), dtype=bool)
+        for y, x in ((0, 1), (2, 1), (1, 0), (1, 2)):
+            rows, columns = slice(y, y + size), slice(x, x + size)
+            neighbor_values = points[:, rows, columns]
+            neighbor_counts = counts[:, rows, columns]
+            legal |= neighbor_values == EMPTY
+            # A friendly chain keeps another liberty, an enemy chain in
+            # atari is captured by the move.
+            legal |= (neighbor_values == value) & (neighbor_counts > 1)
+            legal |= (neighbor_values == -value) & (neighbor_counts == 1)
+        legal &= points[:, 1:-1, 1:-1] == EMPTY
+
+        boards = np.flatnonzero(
+            (self._ko_points != 0) & (self._ko_values == value[:, 0, 0])
+        )
+        ko_points = self._ko_points[boards] % self._area
+        legal[
+            boards,
+            ko_points // self._stride - 1,
+            ko_points % self._stride - 1,
+        ] = False
+        return legal
+
+    def place(
+        self,
+        moves: np.ndarray | Sequence[int],
+        stones: Stone | Sequence[Stone] | np.ndarray,
+    ) -> np.ndarray:
+        """
+        Plays one move on every board and resolves the captures.
+
+        Illegal moves raise ValueError before any board is changed. As in
+        ``Board.play``, the ko point is not enforced here; use
+        ``legal_mask`` to pick moves. Only the chains around the moves and
+        the captured stones are relabeled.
+
+        Returns:
+            np.ndarray: Number of stones captured on every board.
+        """
+        moves = np.asarray(moves, dtype=np.int64)
+        if moves.shape != (self._count,):
+            raise ValueError("Expected one value per board.")
+        values = self._values(stones)
+        if ((moves < -1) | (moves >= self._size**2)).any():
+            raise ValueError("Position out of bounds.")
+
+        boards = np.flatnonzero(moves >= 0)
+        played = moves[boards]
+        played = (
+            boards * self._area
+            + (played // self._size + 1) * self._stride
+            + played % self._size
+            + 1
+        )
+        points = self._points
+        if (points[played] != EMPTY).any():
+            raise ValueError("Intersection occupied by existing stone.")
+
+        value = values[boards]
+        neighbors = [played + offset for offset in self._offsets]
+        neighbor_values = [points[neighbor] for neighbor in neighbors]
+        labels = [self._labels[neighbor] for neighbor in neighbors]
+        counts = [self._liberties[label] for label in labels]
+        friends = self._distinct(
+            labels, [values_at == value for values_at in neighbor_values]
+        )
+        enemies = self._distinct(
+            labels, [values_at == -value for values_at in neighbor_values]
+        )
+        captures = [
+            enemy & (count == 1) for enemy, count in zip(enemies, counts)
+        ]
+        legal = np.zeros(len(played), dtype=bool)
+        for values_at, friend, count, capture in zip(
+            neighbor_values, friends, counts, captures
+        ):
+            legal |= (values_at == EMPTY) | (friend & (count > 1)) | capture
+        if not legal.all():
+            raise ValueError("New group has zero liberties (suicide)")
+
+        points[played] = value
+        self._labels[played] = played
+        self._liberties[played] = 0
+
+        # The move takes a liberty from the enemy chains around it.
+        for label, enemy, capture in zip(labels, enemies, captures):
+            self._liberties[label[enemy & ~capture]] -= 1
+
+        # Captured chains are removed and give liberties to their
+        # neighbors, the chain of the move among them.
+        dead = np.zeros(len(points), dtype=bool)
+        for label, capture in zip(labels, captures):
+            dead[label[capture]] = True
+        captured_stones = np.flatnonzero(
+            dead[self._labels] & (points != EMPTY) & (points != BORDER)
+        )
+        captured = np.bincount(
+            captured_stones // self._area, minlength=self._count
+        )
+        points[captured_stones] = EMPTY
+        self._add_liberties(captured_stones)
+
+        # Friendly chains around the move are merged into the chain of the
+        # move, and its liberties are counted again.
+        merged = np.zeros(len(points), dtype=np.int64)
+        for label, friend in zip(labels, friends):
+            merged[label[friend]] = played[friend]
+        occupied = (points != EMPTY) & (points != BORDER)
+        chain = np.flatnonzero((merged[self._labels] != 0) & occupied)
+        self._labels[chain] = merged[self._labels[chain]]
+        chain = np.concatenate([chain, played])
+        neighbors = [chain + offset for offset in self._offsets]
+        liberties = np.unique(
+            np.concatenate(
+                [
+                    neighbor[points[neighbor] == EMPTY]
+                    for neighbor in neighbors
+                ]
+            )
+        )
+        self._liberties[played] = np.bincount(
+            liberties // self._area, minlength=self._count
+        )[boards]
+
+        # A single stone capturing a single stone with its only liberty
+        # could be taken back at once: the opponent may not play there.
+        single = ~np.any(friends, axis=0)
+        ko = single & (captured[boards] == 1) & (self._liberties[played] == 1)
+        ko_points = np.zeros(self._count, dtype=np.int64)
+        ko_points[captured_stones // self._area] = captured_stones
+        self._ko_points[:] = 0
+        self._ko_points[boards[ko]] = ko_points[boards[ko]]
+        self._ko_values[boards[ko]] = -value[ko]
+
+        self._white_captured += np.where(values == BLACK, captured, 0)
+        self._black_captured += np.where(values == WHITE, captured, 0)
+        return captured
@@ -1,13 +1,53 @@
+from array import array
+from collections.abc import Collection, Iterable, Iterator
 from itertools import product
-
-from weiqi.core.group import Group
+from typing import Literal
+
+from weiqi.core.base_board import (
+    AVAILABLE_SIZES,
+    BaseBoard,
+    BLACK,
+    BORDER,
+    BYTES_HEADER,
+    EMPTY,
+    STONE_VALUES,
+    VALUE_STONES,
+    WHITE,
+    board_points,
+    point_positions,
+)
+from weiqi.core.delta import Delta
 from weiqi.core.position import Position
 from weiqi.core.figure import Stone
 from weiqi.core.move import Move
-
-
-class Board:
-    """Class for the board of the Weiqi game."""
+from weiqi.core.geometry import geometry
+from weiqi.core.zobrist import zobrist_keys
+
+
+class Board(BaseBoard):
+    """
+    Class for the board of the Weiqi game.
+
+    The empty regions and their owners are labelled when the score or the
+    territories are first read. Later moves only mark the points they
+    change, and the next read floods again just the regions next to them,
+    so reading the score between moves costs O(1).
+    """
+
+    __slots__ = (
+        "_version",
+        "_snapshot",
+        "_zobrist_keys",
+        "_region_of",
+        "_regions",
+        "_territory_sizes",
+        "_next_region",
+        "_changed",
+        "_chain_heads",
+        "_chain_next",
+        "_chain_sizes",
+        "_chain_liberties",
+    )
 
     def __init__(
         self,
@@ -16,265 +56,423 @@ class Board:
         black_captured: int = 0,
     ):
         if isinstance(figures, str):
-            self._figures = self._from_string(figures)
+            figures = self._from_string(figures)
         elif isinstance(figures, list):
-            self._figures = self._from_matrix(figures)
-        else:
-            self._figures = figures
+            figures = self._from_matrix(figures)
 
-        self._size = int(len(self._figures) ** 0.5)
+        self._size = int(len(figures) ** 0.5)
+        self._stride = self._size + 2
         self._white_captured = white_captured
         self._black_captured = black_captured
 
         if not self._validate_available_size():
             raise ValueError("Not available size.")
-        if not self._validate_positions():
+        if not self._validate_positions(figures):
             raise ValueError("Invalid positions.")
-        if not self._is_square_board():
+        if not self._is_square_board(figures):
             raise ValueError("Board must be square.")
-        if not self._validate_figures():
+        if not self._validate_figures(figures):
             raise ValueError("Invalid figures.")
 
-        for group in self._find_groups_without_liberties():
-            self.__remove_group(group)
+        self._points = self._to_points(figures)
+        self._setup()
+
+    @classmethod
+    def _from_points(
+        cls,
+        size: int,
+        points: array,
+        white_captured: int,
+        black_captured: int,
+    ) -> "Board":
+        """Creates a board from a padded point array without validation."""
+        board = cls.__new__(cls)
+        board._size = size
+        board._stride = size + 2
+        board._white_captured = white_captured
+        board._black_captured = black_captured
+        board._points = points
+        board._setup()
+        return board
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Board":
+        """Unpacks a board packed with ``to_bytes``."""
+        header = BYTES_HEADER.size
+        if len(data) < header:
+            raise ValueError("Invalid board data.")
+        size, white_captured, black_captured, ko_point, ko_value = (
+            BYTES_HEADER.unpack_from(data)
+        )
+        values = array("b", data[header:])
+        if (
+            size not in AVAILABLE_SIZES
+            or len(values) != size * size
+            or not set(values) <= {EMPTY, BLACK, WHITE}
+        ):
+            raise ValueError("Invalid board data.")
+
+        stride = size + 2
+        points = array("b", [BORDER]) * (stride**2)
+        for row in range(size):
+            start = (row + 1) * stride + 1
+            end = start + size
+            first = row * size
+            last = first + size
+            points[start:end] = values[first:last]
+        board = cls._from_points(size, points, white_captured, black_captured)
+        board._ko_point = ko_point
+        board._ko_value = ko_value
+        return board
+
+    def _setup(self):
+        self._version = 0
+        self._snapshot: BoardSnapshot | None = None
+        self._ko_point = 0
+        self._ko_value = EMPTY
+        self._neighbors = geometry(self._size).neighbors
+        keys = zobrist_keys(self._size)
+        self._zobrist_keys = {BLACK: keys.black, WHITE: keys.white}
+        self._hash = self._compute_hash()
+        self._reset_territories()
+        self._build_chains()
+
+        dead_chains = [
+            head
+            for head, liberties in self._chain_liberties.items()
+            if not liberties
+        ]
+        if dead_chains:
+            # Chains without liberties are removed all at once, before any
+            # of them could give liberties back to the others.
+            for head in dead_chains:
+                self._remove_stones(list(self._chain_stones(head)))
+            self._build_chains()
 
     @property
-    def figures(self) -> dict[Position, Stone | None]:
-        return self._figures
+    def version(self) -> int:
+        """Number of changes made to the board since it was created."""
+        return self._version
 
-    @property
-    def size(self) -> int:
-        return self._size
+    def snapshot(self) -> "BoardSnapshot":
+        """
+        Returns a read-only snapshot of the current state in O(1).
 
-    @property
-    def white_captured(self) -> int:
+        The snapshot shares the point array with the board, and the board
+        copies the array before its next change, so the snapshot never
+        changes afterwards. Snapshots of an unchanged board are reused.
         """
-        Number of white stones captured by black player (stones).
+        if self._snapshot is None:
+            self._snapshot = BoardSnapshot(self)
+        return self._snapshot
+
+    def _before_change(self):
+        """Detaches the point array from the snapshot before a change."""
+        self._version += 1
+        if self._snapshot is not None:
+            self._points = self._points[:]
+            self._snapshot = None
+
+    def _reset_territories(self):
+        """Drops the region labelling, rebuilt from scratch when read."""
+        # Region number of every empty point, 0 for the other points.
+        self._region_of: list[int] | None = None
+        # Points and owner (a stone value or EMPTY) of every region.
+        self._regions: dict[int, tuple[list[int], int]] = {}
+        # Number of points owned by BLACK, WHITE and EMPTY (neutral).
+        self._territory_sizes = {BLACK: 0, WHITE: 0, EMPTY: 0}
+        self._next_region = 1
+        # Points changed since the labelling was last updated.
+        self._changed: list[int] = []
+
+    def _touch(self, points: Iterable[int]):
+        """Marks changed points for the next territory update."""
+        if self._region_of is None:
+            return
+        changed = self._changed
+        changed.extend(points)
+        if len(changed) > self._size**2:
+            # Flooding every region again is cheaper by then.
+            self._reset_territories()
+
+    def _update_territories(self) -> int:
         """
-        return self._white_captured
+        Floods again the regions next to the points changed.
 
-    @property
-    def black_captured(self) -> int:
-        """
-        Number of black stones captured by white player (stones).
+        Returns:
+            int: The number of points flooded.
         """
-        return self._black_captured
+        points = self._points
+        neighbors = self._neighbors
+        region_of = self._region_of
+        regions = self._regions
+        sizes = self._territory_sizes
+        starts: Iterable[int]
+        if region_of is None:
+            region_of = self._region_of = [0] * len(points)
+            starts = board_points(self._size)
+        elif self._changed:
+            starts = []
+            for point in self._changed:
+                for current in (point, *neighbors[point]):
+                    number = region_of[current]
+                    if number:
+                        region, owner = regions.pop(number)
+                        sizes[owner] -= len(region)
+                        for member in region:
+                            region_of[member] = 0
+                        starts.extend(region)
+            starts.extend(self._changed)
+            self._changed.clear()
+        else:
+            return 0
+
+        flooded = 0
+        for start in starts:
+            if points[start] != EMPTY or region_of[start]:
+                continue
+            number = self._next_region
+            self._next_region += 1
+            region_of[start] = number
+            region = [start]
+            colors = 0  # Bit 1 for a black neighbor, bit 2 for white.
+            for current in region:
+                for neighbor in neighbors[current]:
+                    value = points[neighbor]
+                    if value == EMPTY:
+                        if not region_of[neighbor]:
+                            region_of[neighbor] = number
+                            region.append(neighbor)
+                    elif value == BLACK:
+                        colors |= 1
+                    else:
+                        colors |= 2
+            owner = BLACK if colors == 1 else WHITE if colors == 2 else EMPTY
+            regions[number] = (region, owner)
+            sizes[owner] += len(region)
+            flooded += len(region)
+        return flooded
+
+    def find_territories(
+        self, backend: Literal["python", "numpy"] = "python"
+    ) -> dict[Stone | None, set[Position]]:
+        if backend != "python":
+            return super().find_territories(backend)
+        self._update_territories()
+        positions = point_positions(self._size)
+        territories: dict[Stone | None, set[Position]] = {
+            Stone.BLACK: set(),
+            Stone.WHITE: set(),
+            None: set(),
+        }
+        for region, owner in self._regions.values():
+            territories[VALUE_STONES[owner]].update(
+                positions[point] for point in region
+            )
+        return territories
 
-    def _is_square_board(self) -> bool:
-        unique_x = len(set(position.x for position in self._figures.keys()))
-        unique_y = len(set(position.y for position in self._figures.keys()))
+    @property
+    def score(self) -> dict[Stone, int]:
+        self._update_territories()
+        sizes = self._territory_sizes
+        return self._score_of(sizes[BLACK], sizes[WHITE])
+
+    def _is_square_board(
+        self, figures: dict[Position, Stone | None]
+    ) -> bool:
+        unique_x = len(set(position.x for position in figures.keys()))
+        unique_y = len(set(position.y for position in figures.keys()))
         return unique_x == unique_y and unique_x == self._size
 
-    def _validate_positions(self) -> bool:
+    def _validate_positions(
+        self, figures: dict[Position, Stone | None]
+    ) -> bool:
         return all(
-            position.x < self._size and position.y < self._size
-            for position in self._figures.keys()
+            0 <= position.x < self._size and 0 <= position.y < self._size
+            for position in figures.keys()
         )
 
-    def _validate_figures(self) -> bool:
+    @staticmethod
+    def _validate_figures(figures: dict[Position, Stone | None]) -> bool:
         return all(
             isinstance(stone, (Stone, type(None)))
-            for stone in self._figures.values()
+            for stone in figures.values()
         )
 
     def _validate_available_size(self) -> bool:
-        valid_sizes = {5, 6, 7, 8, 9, 11, 13, 15, 17, 19}
-        return self.size in valid_sizes
-
-    def position_in_bounds(self, position: Position) -> bool:
-        return 0 <= position.x < self._size and 0 <= position.y < self._size
-
-    def _find_groups_without_liberties(self) -> set[Group]:
-        return {
-            self._group_at_position(position)
-            for position in self._get_not_empty_positions()
-            if not self._group_at_position(position).liberties
-        }
-
-    def _get_not_empty_positions(self) -> list[Position]:
-        return [
-            position
-            for position, stone in self._figures.items()
-            if stone is not None
-        ]
-
-    def _get_neighbors(self, position: Position) -> list[Position]:
-        return [
-            position + delta
-            for delta in [
-                Position(0, 1),
-                Position(0, -1),
-                Position(1, 0),
-                Position(-1, 0),
-            ]
-            if self.position_in_bounds(position + delta)
-        ]
-
-    def __remove_group(self, group: Group):
-        count = len(group.positions)
-
-        if group.figure == Stone.BLACK:
-            self._black_captured += count
-        elif group.figure == Stone.WHITE:
-            self._white_captured += count
-
-        for position in group.positions:
-            self._figures[position] = None
-
-    def _group_at_position(self, position: Position) -> Group:
-        figure = self._figures.get(position, None)
-        if figure is None:
-            raise ValueError("Position is empty.")
-
-        def bfs(queue: list[Position], visited: set[Position], group: Group):
-            while queue:
-                pos = queue.pop(0)
-                if pos in visited:
-                    continue
-                visited.add(pos)
-
-                if self._figures.get(pos) == figure:
-                    group.positions.add(pos)
-                    queue.extend(
-                        neighbor
-                        for neighbor in self._get_neighbors(pos)
-                        if neighbor not in visited
-                    )
-                elif self._figures.get(pos) is None:
-                    group.liberties.add(pos)
-            return group
-
-        group = Group(positions=set(), liberties=set(), figure=figure)
-        return bfs([position], set(), group)
-
-    def find_territories(self) -> dict[Stone | None, set[Position]]:
-        visited: set[Position] = set()
-        white_territory: set[Position] = set()
-        black_territory: set[Position] = set()
-        neutral_territory: set[Position] = set()
-
-        def dfs(
-            position: Position,
-            visited: set[Position],
-            territory: set[Position],
-            colors: set[Stone],
-        ):
-            stack = [position]
-            while stack:
-                current_position = stack.pop()
-                if current_position in visited:
-                    continue
-                visited.add(current_position)
-                territory.add(current_position)
-
-                for neighbor in self._get_neighbors(current_position):
-                    if neighbor in visited:
-                        continue
-
-                    neighbor_stone = self._figures.get(neighbor)
-                    if neighbor_stone is None:
-                        stack.append(neighbor)
-                    else:
-                        colors.add(neighbor_stone)
-
-        for i in range(self.size):
-            for j in range(self.size):
-                position = Position(i, j)
-                if (
-                    self._figures[position] is None
-                    and position not in neutral_territory
-                ):
-                    colors: set[Stone] = set()
-                    territory: set[Position] = set()
-                    dfs(position, visited, territory, colors)
-
-                    if Stone.BLACK in colors and Stone.WHITE not in colors:
-                        black_territory.update(territory)
-                    elif Stone.WHITE in colors and Stone.BLACK not in colors:
-                        white_territory.update(territory)
-                    else:
-                        neutral_territory.update(territory)
-
-        return {
-            Stone.BLACK: black_territory,
-            Stone.WHITE: white_territory,
-            None: neutral_territory,
+        return self.size in AVAILABLE_SIZES
+
+    def _to_points(self, figures: dict[Position, Stone | None]) -> array:
+        points = array("b", [BORDER]) * (self._stride**2)
+        for point in board_points(self._size):
+            points[point] = EMPTY
+        for position, stone in figures.items():
+            if stone is not None:
+                points[self._index(position)] = STONE_VALUES[stone]
+        return points
+
+    def _compute_hash(self) -> int:
+        points = self._points
+        keys = self._zobrist_keys
+        result = 0
+        for point in board_points(self._size):
+            if points[point] != EMPTY:
+                result ^= keys[points[point]][point]
+        return result
+
+    def _build_chains(self):
+        """Rebuilds the chain tables from scratch."""
+        points_count = self._stride**2
+        self._chain_heads = [0] * points_count
+        self._chain_next = [0] * points_count
+        self._chain_sizes = [0] * points_count
+        self._chain_liberties: dict[int, set[int]] = {}
+
+        points = self._points
+        for point in board_points(self._size):
+            if points[point] != EMPTY and not self._chain_heads[point]:
+                self._build_chain(point)
+
+    def _build_chain(self, point: int):
+        """Floods the chain occupying the point and registers it."""
+        points = self._points
+        heads = self._chain_heads
+        neighbors = self._neighbors
+        value = points[point]
+        stones = [point]
+        liberties: set[int] = set()
+        heads[point] = point
+        for current in stones:
+            for neighbor in neighbors[current]:
+                neighbor_value = points[neighbor]
+                if neighbor_value == value:
+                    if heads[neighbor] != point:
+                        heads[neighbor] = point
+                        stones.append(neighbor)
+                elif neighbor_value == EMPTY:
+                    liberties.add(neighbor)
+
+        chain_next = self._chain_next
+        for current, following in zip(stones, stones[1:] + stones[:1]):
+            chain_next[current] = following
+        self._chain_sizes[point] = len(stones)
+        self._chain_liberties[point] = liberties
+
+    def _chain(self, point: int) -> tuple[Iterable[int], Collection[int]]:
+        head = self._chain_heads[point]
+        return self._chain_stones(head), self._chain_liberties[head]
+
+    def _chain_stones(self, head: int) -> Iterator[int]:
+        chain_next = self._chain_next
+        stone = head
+        while True:
+            yield stone
+            stone = chain_next[stone]
+            if stone == head:
+                return
+
+    def _merge_chains(self, first: int, second: int) -> int:
+        """Merges two chains and returns the head of the merged one."""
+        sizes = self._chain_sizes
+        if sizes[first] < sizes[second]:
+            first, second = second, first
+
+        heads = self._chain_heads
+        for stone in self._chain_stones(second):
+            heads[stone] = first
+
+        chain_next = self._chain_next
+        chain_next[first], chain_next[second] = (
+            chain_next[second],
+            chain_next[first],
+        )
+        sizes[first] += sizes[second]
+        liberties = self._chain_liberties
+        liberties[first] |= liberties.pop(second)
+        return first
+
+    def _remove_stones(self, stones: list[int]):
+        points = self._points
+        value = points[stones[0]]
+
+        if value == BLACK:
+            self._black_captured += len(stones)
+        elif value == WHITE:
+            self._white_captured += len(stones)
+
+        keys = self._zobrist_keys[value]
+        for point in stones:
+            points[point] = EMPTY
+            self._hash ^= keys[point]
+        self._touch(stones)
+
+    def _capture_chain(self, head: int) -> list[int]:
+        """Removes the chain and gives its points back as liberties."""
+        stones = list(self._chain_stones(head))
+        enemy = -self._points[head]
+        self._remove_stones(stones)
+
+        points = self._points
+        heads = self._chain_heads
+        liberties = self._chain_liberties
+        neighbors = self._neighbors
+        del liberties[head]
+        for stone in stones:
+            heads[stone] = 0
+            for neighbor in neighbors[stone]:
+                if points[neighbor] == enemy:
+                    liberties[heads[neighbor]].add(stone)
+        return stones
+
+    def _liberty_count(self, point: int) -> int:
+        return len(self._chain_liberties[self._chain_heads[point]])
+
+    def _place_stone(self, point: int, value: int) -> list[int]:
+        """Places a stone on a legal point and returns captured points."""
+        points = self._points
+        heads = self._chain_heads
+        liberties = self._chain_liberties
+        neighbors = self._neighbors[point]
+
+        points[point] = value
+        self._hash ^= self._zobrist_keys[value][point]
+        self._touch((point,))
+        heads[point] = point
+        self._chain_next[point] = point
+        self._chain_sizes[point] = 1
+        liberties[point] = {
+            neighbor for neighbor in neighbors if points[neighbor] == EMPTY
         }
 
-    @property
-    def score(self) -> dict[Stone, int]:
-        territories = self.find_territories()
-        black_score = len(territories[Stone.BLACK])
-        white_score = len(territories[Stone.WHITE])
-
-        max_figures = self.size**2
-        expected_score = max_figures - 1
-
-        # If one figure in board, score for white and black is 0,0 respectively
-        if expected_score == black_score or expected_score == white_score:
-            return {
-                Stone.BLACK: 0,
-                Stone.WHITE: 0,
-            }
-
-        return {
-            Stone.BLACK: black_score + self.white_captured,
-            Stone.WHITE: white_score + self.black_captured,
-        }
+        head = point
+        captured: list[int] = []
+        for neighbor in neighbors:
+            neighbor_value = points[neighbor]
+            if neighbor_value == value:
+                neighbor_head = heads[neighbor]
+                if neighbor_head != head:
+                    liberties[neighbor_head].discard(point)
+                    head = self._merge_chains(head, neighbor_head)
+            elif neighbor_value == -value:
+                neighbor_head = heads[neighbor]
+                neighbor_liberties = liberties[neighbor_head]
+                neighbor_liberties.discard(point)
+                if not neighbor_liberties:
+                    captured.extend(self._capture_chain(neighbor_head))
+        return captured
 
     @staticmethod
     def generate_empty_board(size: int) -> "Board":
         figures: dict[Position, Stone | None] = {
-            Position(x, y): None for x, y in product(range(size), range(size))
+            Position.of(x, y): None
+            for x, y in product(range(size), range(size))
         }
         return Board(figures)
 
-    @property
-    def state_as_matrix(self) -> list[list[int]]:
-        """
-        Converts the board state to a matrix representation.
-
-        -1 - white stone
-        0 - empty intersection
-        1 - black stone
-
-        Returns:
-            list[list[int]]: The board state as a matrix.
-        """
-        state = [[0] * self.size for _ in range(self.size)]
-        for position, stone in self._figures.items():
-            state[position.y][position.x] = (
-                1
-                if stone == Stone.BLACK
-                else -1 if stone == Stone.WHITE else 0
-            )
-        return state
-
-    @property
-    def state_as_string(self) -> str:
-        """
-        Converts the board state to a string representation.
-
-        W - white stone
-        B - black stone
-        . - empty intersection
-
-        Returns:
-            str: The board state as a string.
-        """
-        symbols = {Stone.BLACK: "B", Stone.WHITE: "W", None: "."}
-        return "/".join(
-            "".join(
-                symbols.get(self._figures.get(Position(x, y)), ".")
-                for x in range(self.size)
-            )
-            for y in range(self.size)
-        )
-
     @staticmethod
     def _from_matrix(matrix: list[list[int]]) -> dict[Position, Stone | None]:
         return {
-            Position(x, y): (
+            Position.of(x, y): (
                 Stone.BLACK
                 if cell == 1
                 else Stone.WHITE if cell == -1 else None
@@ -298,36 +496,184 @@ class Board:
     def place_figure(self, move: Move) -> None:
         if move.position is None:
             raise ValueError("Position is required.")
+        self.play(move)
+
+    def play(self, move: Move) -> Delta:
+        """
+        Plays the move and returns the delta needed to take it back.
+
+        A move without a position is a pass and only clears the ko point.
+        Illegal moves raise ValueError before the board is touched. The ko
+        point is not enforced here, as the game checks superko itself.
+
+        Returns:
+            Delta: The placed stone and the stones it captured.
+        """
+        ko = self.ko
+        if move.position is None:
+            if ko is not None:
+                self._before_change()
+                self._ko_point = 0
+            return Delta(move, ko=ko)
         if not self.position_in_bounds(move.position):
             raise ValueError("Position out of bounds.")
-        if self._figures.get(move.position) is not None:
+        point = self._index(move.position)
+        if self._points[point] != EMPTY:
             raise ValueError("Intersection occupied by existing stone.")
-        white_captured = self.white_captured
-        black_captured = self.black_captured
-        figures = self._figures.copy()
+        value = STONE_VALUES[move.figure]
+        if self._is_suicide(point, value):
+            raise ValueError("New group has zero liberties (suicide)")
 
-        self._figures[move.position] = move.figure
+        captured = self._play_point(point, value)
+        positions = point_positions(self._size)
+        return Delta(
+            move, tuple(positions[stone] for stone in captured), ko=ko
+        )
 
-        try:
-            neighboring_enemy_groups = [
-                self._group_at_position(neighbor)
-                for neighbor in self._get_neighbors(move.position)
-                if self._figures.get(neighbor) not in {None, move.figure}
-            ]
+    def _play_point(self, point: int, value: int) -> list[int]:
+        """
+        Plays a legal stone without building a delta, for fast playouts.
 
-            for group in neighboring_enemy_groups:
-                if not group.liberties:
-                    self.__remove_group(group)
-
-            new_group = self._group_at_position(move.position)
-        except ValueError as e:
-            self._figures = figures
-            self._white_captured = white_captured
-            self._black_captured = black_captured
-            raise e
-
-        if not new_group.liberties:
-            self._figures = figures
-            self._white_captured = white_captured
-            self._black_captured = black_captured
-            raise ValueError("New group has zero liberties (suicide)")
+        Returns:
+            list[int]: The captured points.
+        """
+        self._before_change()
+        captured = self._place_stone(point, value)
+
+        # A single stone capturing a single stone with its only liberty
+        # could be taken back at once: the opponent may not play there.
+        self._ko_point = 0
+        if len(captured) == 1 and self._liberty_count(point) == 1:
+            head = self._chain_heads[point]
+            if self._chain_sizes[head] == 1:
+                self._ko_point = captured[0]
+                self._ko_value = -value
+        return captured
+
+    def undo(self, delta: Delta) -> None:
+        """
+        Takes back the move recorded in the delta.
+
+        Deltas must be undone in the reverse order of the moves played.
+        Only the chains around the move and the captured stones are rebuilt.
+        """
+        position = delta.move.position
+        if position is not None:
+            value = STONE_VALUES[delta.move.figure]
+            self._undo_stone(self._index(position), value, delta.captured)
+        elif delta.ko is not None:
+            self._before_change()
+
+        if delta.ko is None:
+            self._ko_point = 0
+        else:
+            self._ko_point = self._index(delta.ko[0])
+            self._ko_value = STONE_VALUES[delta.ko[1]]
+
+    def _undo_stone(
+        self, point: int, value: int, captured_positions: tuple[Position, ...]
+    ):
+        if self._points[point] != value:
+            raise ValueError("Delta does not match the board.")
+
+        self._before_change()
+        points = self._points
+
+        heads = self._chain_heads
+        liberties = self._chain_liberties
+        neighbors = self._neighbors
+
+        head = heads[point]
+        stones = list(self._chain_stones(head))
+        del liberties[head]
+        for stone in stones:
+            heads[stone] = 0
+        points[point] = EMPTY
+        self._hash ^= self._zobrist_keys[value][point]
+
+        captured = [self._index(position) for position in captured_positions]
+        keys = self._zobrist_keys[-value]
+        for stone in captured:
+            points[stone] = -value
+            self._hash ^= keys[stone]
+        if value == BLACK:
+            self._white_captured -= len(captured)
+        else:
+            self._black_captured -= len(captured)
+        self._touch((point, *captured))
+
+        # Removing the stone may split its chain into several ones.
+        for stone in stones + captured:
+            if points[stone] != EMPTY and not heads[stone]:
+                self._build_chain(stone)
+        for stone in captured:
+            for neighbor in neighbors[stone]:
+                if points[neighbor] == value:
+                    liberties[heads[neighbor]].discard(stone)
+        for neighbor in neighbors[point]:
+            if points[neighbor] == -value:
+                liberties[heads[neighbor]].add(point)
+
+
+class BoardSnapshot(BaseBoard):
+    """
+    Read-only snapshot of a board at one version.
+
+    It answers the same queries as the board it was taken from. Territories
+    and liberties are computed from the shared point array on demand.
+    """
+
+    __slots__ = ("_version", "_liberty_counts", "_score")
+
+    def __init__(self, board: Board):
+        self._size = board._size
+        self._stride = board._stride
+        self._neighbors = board._neighbors
+        self._points = board._points
+        self._white_captured = board._white_captured
+        self._black_captured = board._black_captured
+        self._hash = board._hash
+        self._ko_point = board._ko_point
+        self._ko_value = board._ko_value
+        self._version = board._version
+        self._liberty_counts: list[int] | None = None
+        self._score: dict[Stone, int] | None = None
+        if board._region_of is not None and not board._changed:
+            # The labelling of the board is up to date: reuse its score.
+            self._score = board.score
+
+    @property
+    def version(self) -> int:
+        """Version of the board this snapshot was taken at."""
+        return self._version
+
+    @property
+    def score(self) -> dict[Stone, int]:
+        if self._score is None:
+            self._score = super().score
+        return dict(self._score)
+
+    def _liberty_count(self, point: int) -> int:
+        if self._liberty_counts is None:
+            # Liberties of every chain, flooded once for the whole snapshot.
+            counts = [0] * len(self._points)
+            points = self._points
+            for start in board_points(self._size):
+                if points[start] != EMPTY and not counts[start]:
+                    stones, liberties = self._chain(start)
+                    for stone in stones:
+                        counts[stone] = len(liberties)
+            self._liberty_counts = counts
+        return self._liberty_counts[point]
+
+    def to_board(self) -> Board:
+        """Returns a new mutable board with the state of the snapshot."""
+        board = Board._from_points(
+            self._size,
+            self._points[:],
+            self._white_captured,
+            self._black_captured,
+        )
+        board._ko_point = self._ko_point
+        board._ko_value = self._ko_value
+        return board
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from weiqi.core.figure import Stone
+from weiqi.core.move import Move
+from weiqi.core.position import Position
+
+
+@dataclass(frozen=True, slots=True)
+class Delta:
+    """Changes made to the board by a single move.
+
+    Only the played move, the stones it captured and the ko before the
+    move are recorded; the capture counters change by ``len(captured)``.
+    A pass move has no captures.
+    """
+
+    move: Move
+    captured: tuple[Position, ...] = ()
+    ko: tuple[Position, Stone] | None = None
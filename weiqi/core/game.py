@@ -1,10 +1,10 @@
-import copy
-
 from weiqi.exceptions.game import GameOverException
-from weiqi.core.board import Board
-from weiqi.utils.enums import Winner
+from weiqi.core.board import Board, BoardSnapshot
+from weiqi.core.delta import Delta
+from weiqi.utils.enums import KoRule, Winner
 from weiqi.core.figure import Stone
 from weiqi.core.move import MoveHistory, Move
+from weiqi.core.zobrist import zobrist_keys
 from weiqi.players.player import Player
 from weiqi.players.bot import BaseBot
 from weiqi.utils.game_status import GameStatus
@@ -20,6 +20,8 @@ class WeiqiGame:
         game_status: GameStatus | None = None,
         move_history: MoveHistory | None = None,
         komi: float | int = 6.5,  # 6.5 is the Japanese and Korean rules.
+        ko_rule: KoRule | None = KoRule.POSITIONAL,  # None disables ko.
+        headless: bool = False,  # Allows games between two bots.
     ):
         self._board = board
         self._players = [player_black, player_white]
@@ -27,13 +29,22 @@ class WeiqiGame:
         self._game_status = game_status or GameStatus(False, None)
         self._move_history = move_history or MoveHistory()
         self._komi = komi
+        self._ko_rule = ko_rule
+        self._headless = headless
+        # Hashes of the positions seen since the game was created, kept
+        # next to the move history so superko checks are O(1) per move.
+        self._position_hashes = {self._position_hash()}
+        # What every move made in this game changed, so it can be undone:
+        # the board delta, the position hash it added and whether it ended
+        # the game.
+        self._undo_stack: list[tuple[Delta | None, int | None, bool]] = []
 
         self._validate_players()
 
     @property
-    def board(self) -> Board:
-        """Returns a copy of the board."""
-        return copy.deepcopy(self._board)
+    def board(self) -> BoardSnapshot:
+        """Returns a read-only snapshot of the board, taken in O(1)."""
+        return self._board.snapshot()
 
     @property
     def game_status(self) -> GameStatus:
@@ -55,12 +66,22 @@ class WeiqiGame:
     def komi(self) -> float:
         return self._komi
 
+    @property
+    def ko_rule(self) -> KoRule | None:
+        return self._ko_rule
+
+    @property
+    def headless(self) -> bool:
+        return self._headless
+
     def _validate_players(self):
         if not all(
             isinstance(player, (Player, BaseBot)) for player in self._players
         ):
             raise ValueError("Invalid player type.")
-        if all(isinstance(player, BaseBot) for player in self._players):
+        if not self._headless and all(
+            isinstance(player, BaseBot) for player in self._players
+        ):
             raise ValueError("At least one player must be human.")
         if not all(
             player.figure in (Stone.BLACK, Stone.WHITE)
@@ -98,25 +119,96 @@ class WeiqiGame:
         if move.figure != player.figure:
             raise ValueError("You can't place a figure of another color.")
 
+        delta = None
+        added_hash = None
         if move.position is not None:
-            self._board.place_figure(move)
+            delta = self._board.play(move)
+            if self._ko_rule is not None:
+                position_hash = self._position_hash(self._opponent())
+                if position_hash in self._position_hashes:
+                    self._board.undo(delta)
+                    raise ValueError("Move repeats a previous position (ko).")
+                self._position_hashes.add(position_hash)
+                added_hash = position_hash
         else:
+            if self._ko_rule == KoRule.SITUATIONAL:
+                position_hash = self._position_hash(self._opponent())
+                if position_hash not in self._position_hashes:
+                    self._position_hashes.add(position_hash)
+                    added_hash = position_hash
+
             last_move = self._move_history.last_move
             # If the last move was a pass, the game is over.
             if last_move and last_move.position is None:
-                score = self._board.score
-                black_score = score[Stone.BLACK]
-                white_score = score[Stone.WHITE] + self._komi
-                if black_score > white_score:
-                    winner = Winner.BLACK
-                elif white_score > black_score:
-                    winner = Winner.WHITE
-                else:
-                    winner = Winner.DRAW
-                self._game_status.end_game(winner, black_score, white_score)
+                self._end_by_score()
 
         self._move_history.add_move(move)
+        self._undo_stack.append(
+            (delta, added_hash, self._game_status.is_over)
+        )
         self._next_turn()
 
+    def resume(self):
+        """
+        Opens again a game ended by two passes, so the players go on.
+
+        Resigned games cannot be resumed.
+        """
+        status = self._game_status
+        if status.is_over and status.black_score is None:
+            raise GameOverException("Game is already over.")
+        self._game_status = GameStatus(False, None)
+
+    def end_by_score(self):
+        """Ends the game now, won by score with komi, as after two passes."""
+        if self._game_status.is_over:
+            raise GameOverException("Game is already over.")
+        self._end_by_score()
+
+    def undo(self) -> Move:
+        """
+        Takes back the last move made in this game and returns it.
+
+        A game ended by two passes is open again. Moves of a history given
+        to the game cannot be taken back, nor moves of a resigned game.
+        """
+        if not self._undo_stack:
+            raise ValueError("No move to undo.")
+        delta, added_hash, ended = self._undo_stack[-1]
+        if self._game_status.is_over and not ended:
+            raise GameOverException("Game is already over.")
+        self._undo_stack.pop()
+        if ended:
+            self._game_status = GameStatus(False, None)
+        if delta is not None:
+            self._board.undo(delta)
+        if added_hash is not None:
+            self._position_hashes.discard(added_hash)
+        self._next_turn()
+        return self._move_history.pop()
+
+    def _end_by_score(self):
+        """Ends the game with the winner by score, komi included."""
+        score = self._board.score
+        black_score = score[Stone.BLACK]
+        white_score = score[Stone.WHITE] + self._komi
+        if black_score > white_score:
+            winner = Winner.BLACK
+        elif white_score > black_score:
+            winner = Winner.WHITE
+        else:
+            winner = Winner.DRAW
+        self._game_status.end_game(winner, black_score, white_score)
+
+    def _position_hash(self, turn: Stone | None = None) -> int:
+        """Hash of the board, with the player to move if situational."""
+        turn = turn or self._turn
+        if self._ko_rule == KoRule.SITUATIONAL and turn == Stone.WHITE:
+            return self._board.hash ^ zobrist_keys(self._board.size).side
+        return self._board.hash
+
+    def _opponent(self) -> Stone:
+        return Stone.BLACK if self._turn == Stone.WHITE else Stone.WHITE
+
     def _next_turn(self):
-        self._turn = Stone.BLACK if self._turn == Stone.WHITE else Stone.WHITE
+        self._turn = self._opponent()
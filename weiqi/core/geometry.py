@@ -0,0 +1,120 @@
+from functools import lru_cache
+from typing import NamedTuple
+
+from weiqi.core.position import Position
+
+
+class Geometry(NamedTuple):
+    """
+    Tables of a board size, indexed by padded point.
+
+    Border cells have no neighbors nor diagonals and an edge distance of
+    -1. Every symmetry maps the padded grid onto itself, border included.
+    """
+
+    size: int
+    stride: int
+    points: tuple[int, ...]  # Intersections, row by row.
+    neighbors: tuple[tuple[int, ...], ...]  # Orthogonal, on the board.
+    diagonals: tuple[tuple[int, ...], ...]  # Diagonal, on the board.
+    edge_distance: tuple[int, ...]  # 0 on the first line.
+    star_points: tuple[int, ...]
+    # The 8 rotations and reflections, identity first: the image of every
+    # point.
+    symmetries: tuple[tuple[int, ...], ...]
+
+
+@lru_cache(maxsize=None)
+def geometry(size: int) -> Geometry:
+    """Returns the tables of the board size, built once and shared."""
+    stride = size + 2
+    area = stride * stride
+    points = tuple(
+        (y + 1) * stride + x + 1 for y in range(size) for x in range(size)
+    )
+    on_board = [False] * area
+    for point in points:
+        on_board[point] = True
+
+    neighbors: list[tuple[int, ...]] = [()] * area
+    diagonals: list[tuple[int, ...]] = [()] * area
+    edge_distance = [-1] * area
+    for point in points:
+        neighbors[point] = tuple(
+            other
+            for other in (point - 1, point + 1, point - stride, point + stride)
+            if on_board[other]
+        )
+        diagonals[point] = tuple(
+            other
+            for other in (
+                point - stride - 1,
+                point - stride + 1,
+                point + stride - 1,
+                point + stride + 1,
+            )
+            if on_board[other]
+        )
+        y, x = divmod(point, stride)
+        edge_distance[point] = min(x, y, stride - 1 - x, stride - 1 - y) - 1
+
+    last = stride - 1
+    transforms = (
+        lambda x, y: (x, y),
+        lambda x, y: (last - y, x),
+        lambda x, y: (last - x, last - y),
+        lambda x, y: (y, last - x),
+        lambda x, y: (last - x, y),
+        lambda x, y: (x, last - y),
+        lambda x, y: (y, x),
+        lambda x, y: (last - y, last - x),
+    )
+    symmetries = []
+    for transform in transforms:
+        images = []
+        for point in range(area):
+            x, y = transform(point % stride, point // stride)
+            images.append(y * stride + x)
+        symmetries.append(tuple(images))
+
+    return Geometry(
+        size=size,
+        stride=stride,
+        points=points,
+        neighbors=tuple(neighbors),
+        diagonals=tuple(diagonals),
+        edge_distance=tuple(edge_distance),
+        star_points=tuple(
+            (y + 1) * stride + x + 1 for x, y in _star_coordinates(size)
+        ),
+        symmetries=tuple(symmetries),
+    )
+
+
+def star_points(size: int) -> tuple[Position, ...]:
+    """Positions of the star points (hoshi) of the board size."""
+    return tuple(Position.of(x, y) for x, y in _star_coordinates(size))
+
+
+def _star_coordinates(size: int) -> list[tuple[int, int]]:
+    """
+    Corner points on the 3-3 points up to 11x11 and the 4-4 points above,
+    the center of odd boards and the side points of 19x19 and larger.
+    Boards smaller than 9x9 have none.
+    """
+    if size < 9:
+        return []
+    low = 2 if size < 13 else 3
+    high = size - 1 - low
+    coordinates = [(low, low), (high, low), (low, high), (high, high)]
+    if size % 2:
+        middle = size // 2
+        coordinates.append((middle, middle))
+        if size >= 19:
+            coordinates += [
+                (middle, low),
+                (low, middle),
+                (high, middle),
+                (middle, high),
+            ]
+    return coordinates
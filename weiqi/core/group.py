@@ -3,23 +3,39 @@ from weiqi.core.position import Position
 
 
 class Group:
+    """
+    Stones of a chain and its liberties.
+
+    Groups are values: the hash is computed on first use and kept, so the
+    sets must not be changed once the group is hashed.
+    """
+
+    __slots__ = ("positions", "liberties", "figure", "_hash")
+
     def __init__(
         self, positions: set[Position], liberties: set[Position], figure: Stone
     ):
         self.positions = positions
         self.liberties = liberties
         self.figure = figure
+        self._hash: int | None = None
 
     def __hash__(self):
-        return hash(
-            (frozenset(self.positions), frozenset(self.liberties), self.figure)
-        )
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    frozenset(self.positions),
+                    frozenset(self.liberties),
+                    self.figure,
+                )
+            )
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, Group):
             return False
         return (
-            frozenset(self.positions) == frozenset(other.positions)
-            and frozenset(self.liberties) == frozenset(other.liberties)
-            and self.figure == other.figure
+            self.figure == other.figure
+            and self.positions == other.positions
+            and self.liberties == other.liberties
         )
@@ -1,44 +1,140 @@
-from bisect import insort
-from dataclasses import dataclass, field
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import overload
 import datetime
+import time
 
 from weiqi.core.position import Position
 from weiqi.core.figure import Stone
 
+# Packed move: coordinates in the high bits, then the pass flag and the
+# color bit (set for white).
+_WHITE_BIT = 1
+_PASS_BIT = 2
+_COORDINATE_LIMIT = 256
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Move:
     position: Position | None
     figure: Stone
-    timestamp: datetime.datetime = field(init=False)
+    timestamp: datetime.datetime | None = None
+
+
+def _encode(move: Move) -> int:
+    code = _WHITE_BIT if move.figure == Stone.WHITE else 0
+    position = move.position
+    if position is None:
+        return code | _PASS_BIT
+    if not (
+        0 <= position.x < _COORDINATE_LIMIT
+        and 0 <= position.y < _COORDINATE_LIMIT
+    ):
+        raise ValueError("Position out of bounds.")
+    return (position.y * _COORDINATE_LIMIT + position.x) << 2 | code
+
 
-    def __post_init__(self):
-        utc_tz = datetime.timezone.utc
-        object.__setattr__(self, "timestamp", datetime.datetime.now(utc_tz))
+@lru_cache(maxsize=None)
+def _decode(code: int) -> Move:
+    """Move of the packed code, shared as moves without time are equal."""
+    figure = Stone.WHITE if code & _WHITE_BIT else Stone.BLACK
+    if code & _PASS_BIT:
+        return Move(None, figure)
+    y, x = divmod(code >> 2, _COORDINATE_LIMIT)
+    return Move(Position.of(x, y), figure)
 
 
 class MoveHistory:
-    def __init__(self, history: list[Move] | None = None):
-        self._history = history or []
-        self._history.sort(key=lambda m: m.timestamp)
+    """
+    Moves of a game in the order they were played.
+
+    Moves are packed into a typed array, one integer each, so appending is
+    O(1) and slicing copies plain integers. ``Move`` objects are only built
+    when read. Timestamps are kept only with ``timestamps=True``: the time
+    of a move is its own timestamp if it has one, or the time it was added.
+    """
+
+    __slots__ = ("_codes", "_times")
+
+    def __init__(
+        self, history: Iterable[Move] | None = None, timestamps: bool = False
+    ):
+        self._codes = array("i")
+        self._times: array | None = array("d") if timestamps else None
+        for move in history or ():
+            self.add_move(move)
+
+    @classmethod
+    def _from_arrays(cls, codes: array, times: array | None) -> "MoveHistory":
+        history = cls.__new__(cls)
+        history._codes = codes
+        history._times = times
+        return history
+
+    @property
+    def timestamps(self) -> bool:
+        return self._times is not None
 
     def add_move(self, move: Move):
-        insort(self._history, move, key=lambda m: m.timestamp)
+        self._codes.append(_encode(move))
+        if self._times is not None:
+            self._times.append(
+                move.timestamp.timestamp()
+                if move.timestamp is not None
+                else time.time()
+            )
+
+    def pop(self) -> Move:
+        """Removes the last move and returns it."""
+        if not self._codes:
+            raise IndexError("No move to remove.")
+        move = self._move(-1)
+        self._codes.pop()
+        if self._times is not None:
+            self._times.pop()
+        return move
+
+    def _move(self, index: int) -> Move:
+        move = _decode(self._codes[index])
+        if self._times is None:
+            return move
+        timestamp = datetime.datetime.fromtimestamp(
+            self._times[index], datetime.timezone.utc
+        )
+        return Move(move.position, move.figure, timestamp)
 
     @property
     def last_move(self) -> Move | None:
-        if self._history:
-            return self._history[-1]
+        if self._codes:
+            return self._move(-1)
         return None
 
     def get_all_moves(self) -> list[Move]:
-        return self._history
+        return list(self)
 
-    def __iter__(self):
-        return iter(self._history)
+    def __iter__(self) -> Iterator[Move]:
+        if self._times is None:
+            return map(_decode, self._codes)
+        return map(self._move, range(len(self._codes)))
 
     def __len__(self):
-        return len(self._history)
+        return len(self._codes)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MoveHistory):
+            return NotImplemented
+        return self._codes == other._codes and self._times == other._times
+
+    @overload
+    def __getitem__(self, item: int) -> Move: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> "MoveHistory": ...
 
     def __getitem__(self, item):
-        return self._history[item]
+        if isinstance(item, slice):
+            times = self._times[item] if self._times is not None else None
+            return self._from_arrays(self._codes[item], times)
+        return self._move(item)
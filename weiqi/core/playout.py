@@ -0,0 +1,357 @@
+import random
+
+from weiqi.core.base_board import BLACK, EMPTY, WHITE, BaseBoard
+from weiqi.core.geometry import geometry
+
+
+class PlayoutBoard:
+    """
+    Throwaway board for random playouts.
+
+    It keeps only what a playout needs, in plain lists: the padded points,
+    the chain of every stone as a circular linked list, and the number of
+    pseudo-liberties of every chain (empty neighbors counted once per
+    adjacent stone, so a chain is captured exactly when it reaches zero).
+    There is no undo, no hashing and no superko check.
+    """
+
+    def __init__(self, board: BaseBoard):
+        size = board.size
+        stride = size + 2
+        self._size = size
+        self._geometry = geometry(size)
+        self._neighbors = neighbors = self._geometry.neighbors
+        self._points = board._points.tolist()
+        self._white_captured = board._white_captured
+        self._black_captured = board._black_captured
+        self._ko_point = board._ko_point
+        self._ko_value = board._ko_value
+
+        points = self._points
+        self._heads = heads = [0] * (stride * stride)
+        self._next = following = list(range(stride * stride))
+        self._sizes = sizes = [0] * (stride * stride)
+        self._liberties = liberties = [0] * (stride * stride)
+        self._empties: list[int] = []
+        for start in self._geometry.points:
+            value = points[start]
+            if value == EMPTY:
+                self._empties.append(start)
+                continue
+            if heads[start]:
+                continue
+            heads[start] = start
+            stack = [start]
+            last = start
+            while stack:
+                point = stack.pop()
+                sizes[start] += 1
+                for neighbor in neighbors[point]:
+                    other = points[neighbor]
+                    if other == EMPTY:
+                        liberties[start] += 1
+                    elif other == value and not heads[neighbor]:
+                        heads[neighbor] = start
+                        following[last] = neighbor
+                        last = neighbor
+                        stack.append(neighbor)
+            following[last] = start
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def is_true_eye(self, point: int, value: int) -> bool:
+        """
+        Checks if the empty point is a true single-point eye of the value.
+
+        All four neighbors are own stones or borders, and the opponent holds
+        at most one diagonal point in the middle of the board and none on
+        the edge, so the eye cannot be made false.
+        """
+        points = self._points
+        for neighbor in self._neighbors[point]:
+            if points[neighbor] != value:
+                return False
+        enemies = 1 if self._geometry.edge_distance[point] == 0 else 0
+        for diagonal in self._geometry.diagonals[point]:
+            if points[diagonal] == -value:
+                enemies += 1
+        return enemies < 2
+
+    def play(self, point: int, value: int) -> bool:
+        """
+        Plays the value at the empty point if it is legal.
+
+        Returns:
+            bool: Whether the stone was placed.
+        """
+        if point == self._ko_point and value == self._ko_value:
+            return False
+        points = self._points
+        heads = self._heads
+        liberties = self._liberties
+        neighbors = self._neighbors[point]
+
+        # The stone takes a pseudo-liberty from every adjacent chain; the
+        # move is legal if it touches an empty point, captures or leaves a
+        # friendly chain with a liberty.
+        legal = False
+        for neighbor in neighbors:
+            other = points[neighbor]
+            if other == EMPTY:
+                legal = True
+            else:
+                liberties[heads[neighbor]] -= 1
+        if not legal:
+            for neighbor in neighbors:
+                other = points[neighbor]
+                if (liberties[heads[neighbor]] == 0) == (other != value):
+                    legal = True
+                    break
+        if not legal:
+            for neighbor in neighbors:
+                liberties[heads[neighbor]] += 1
+            return False
+
+        self._place(point, value, neighbors)
+        return True
+
+    def _place(
+        self, point: int, value: int, neighbors: tuple[int, ...]
+    ) -> None:
+        """Places a legal stone whose neighbors already lost a liberty."""
+        points = self._points
+        heads = self._heads
+        following = self._next
+        sizes = self._sizes
+        liberties = self._liberties
+
+        points[point] = value
+        heads[point] = point
+        following[point] = point
+        sizes[point] = 1
+        liberties[point] = 0
+        head = point
+        dead = []
+        for neighbor in neighbors:
+            other = points[neighbor]
+            if other == EMPTY:
+                liberties[head] += 1
+            elif other == value:
+                other_head = heads[neighbor]
+                if other_head == head:
+                    continue
+                # The smaller chain joins the larger one.
+                if sizes[other_head] < sizes[head]:
+                    head, other_head = other_head, head
+                current = head
+                while True:
+                    heads[current] = other_head
+                    current = following[current]
+                    if current == head:
+                        break
+                following[head], following[other_head] = (
+                    following[other_head],
+                    following[head],
+                )
+                sizes[other_head] += sizes[head]
+                liberties[other_head] += liberties[head]
+                head = other_head
+            elif other == -value:
+                enemy = heads[neighbor]
+                if liberties[enemy] == 0 and enemy not in dead:
+                    dead.append(enemy)
+
+        captured = 0
+        for enemy in dead:
+            captured += sizes[enemy]
+            self._remove(enemy)
+        if value == BLACK:
+            self._white_captured += captured
+        else:
+            self._black_captured += captured
+        # A single stone taking a single stone, left in atari, is a ko.
+        if captured == 1 and sizes[head] == 1 and liberties[head] == 1:
+            self._ko_point = dead[0]
+            self._ko_value = -value
+        else:
+            self._ko_point = 0
+
+    def _remove(self, head: int) -> None:
+        points = self._points
+        heads = self._heads
+        following = self._next
+        liberties = self._liberties
+        neighbors = self._neighbors
+        empties = self._empties
+
+        current = head
+        while True:
+            points[current] = EMPTY
+            heads[current] = 0
+            empties.append(current)
+            current = following[current]
+            if current == head:
+                break
+        while True:
+            for neighbor in neighbors[current]:
+                if points[neighbor] != EMPTY:
+                    liberties[heads[neighbor]] += 1
+            current = following[current]
+            if current == head:
+                break
+
+    def run(
+        self,
+        value: int,
+        rng: random.Random,
+        passes: int = 0,
+        max_moves: int | None = None,
+    ) -> list[int]:
+        """
+        Plays random moves, starting with the value, until both sides pass.
+
+        A side passes when it has no legal move except filling its own true
+        eyes, so the playout ends with only eyes and neutral points empty.
+
+        Returns:
+            list[int]: The points played, negated for white stones.
+        """
+        played: list[int] = []
+        points = self._points
+        heads = self._heads
+        liberties = self._liberties
+        neighbor_table = self._neighbors
+        empties = self._empties
+        random_float = rng.random
+        is_true_eye = self.is_true_eye
+        play = self.play
+        place = self._place
+        if max_moves is None:
+            max_moves = self._size * self._size * 3
+        for _ in range(max_moves):
+            if passes >= 2:
+                break
+            # Rejected points are swapped behind the candidates still to try.
+            count = len(empties)
+            while count:
+                index = int(random_float() * count)
+                point = empties[index]
+                neighbors = neighbor_table[point]
+                # Most points have an empty neighbor: always legal, never an
+                # eye and never the ko point, so the checks are skipped.
+                if EMPTY in [points[neighbor] for neighbor in neighbors]:
+                    for neighbor in neighbors:
+                        if points[neighbor] != EMPTY:
+                            liberties[heads[neighbor]] -= 1
+                    place(point, value, neighbors)
+                    placed = True
+                else:
+                    placed = not is_true_eye(point, value) and play(
+                        point, value
+                    )
+                if placed:
+                    empties[index] = empties[-1]
+                    empties.pop()
+                    played.append(point * value)
+                    passes = 0
+                    break
+                count -= 1
+                empties[index], empties[count] = empties[count], point
+            else:
+                self._ko_point = 0
+                passes += 1
+            value = -value
+        return played
+
+    def ownership(self) -> list[int]:
+        """
+        Owner of every intersection, row by row.
+
+        Stones belong to their color and empty regions to the color of all
+        the stones around them: 1 for black, -1 for white and 0 for
+        neutral points.
+        """
+        points = self._points
+        neighbors = self._neighbors
+        owners = dict.fromkeys(self._geometry.points, EMPTY)
+        visited: set[int] = set()
+        for start in owners:
+            value = points[start]
+            if value != EMPTY:
+                owners[start] = value
+                continue
+            if start in visited:
+                continue
+            visited.add(start)
+            region = [start]
+            colors: set[int] = set()
+            for point in region:
+                for neighbor in neighbors[point]:
+                    other = points[neighbor]
+                    if other == EMPTY:
+                        if neighbor not in visited:
+                            visited.add(neighbor)
+                            region.append(neighbor)
+                    else:
+                        colors.add(other)
+            if len(colors) == 1:
+                owner = colors.pop()
+                for point in region:
+                    owners[point] = owner
+        return list(owners.values())
+
+    def score(self) -> tuple[int, int]:
+        """
+        Scores of black and white, without komi.
+
+        Scored like the board: empty points owned by one color plus the
+        captured stones.
+        """
+        owners = self.ownership()
+        points = self._points
+        black = white = 0
+        for point, owner in zip(self._geometry.points, owners):
+            if points[point] == EMPTY:
+                if owner == BLACK:
+                    black += 1
+                elif owner == WHITE:
+                    white += 1
+        if self._size**2 - 1 in (black, white):
+            # A lone stone on the board scores nothing, like on the board.
+            return 0, 0
+        return black + self._white_captured, white + self._black_captured
+
+    def winner(self, komi: float | int) -> int:
+        """Point value of the winner, EMPTY on a draw."""
+        black_score, white_points = self.score()
+        white_score = white_points + komi
+        if black_score > white_score:
+            return BLACK
+        if white_score > black_score:
+            return WHITE
+        return EMPTY
+
+
+def playout(
+    board: BaseBoard,
+    value: int,
+    rng: random.Random | int | None = None,
+    passes: int = 0,
+) -> list[int]:
+    """
+    Plays a random game from the board, starting with the value.
+
+    The board is not changed. ``rng`` is a generator or a seed for a new
+    one, so the playout never touches the global random state.
+
+    Returns:
+        list[int]: The final ownership of every intersection, row by row
+        (1 for black, -1 for white, 0 for neutral points).
+    """
+    if not isinstance(rng, random.Random):
+        rng = random.Random(rng)
+    playout_board = PlayoutBoard(board)
+    playout_board.run(value, rng, passes)
+    return playout_board.ownership()
@@ -1,10 +1,28 @@
 from dataclasses import dataclass
 
+# Positions from -1 to _LIMIT - 2 on both axes are interned: every board
+# size, with its ring of border cells, shares the same objects.
+_LIMIT = 21
+_interned: list["Position"] = []
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Position:
     x: int
     y: int
 
+    @staticmethod
+    def of(x: int, y: int) -> "Position":
+        """Returns the shared position of the coordinates."""
+        if -1 <= x < _LIMIT - 1 and -1 <= y < _LIMIT - 1:
+            return _interned[(y + 1) * _LIMIT + x + 1]
+        return Position(x, y)
+
     def __add__(self, other) -> "Position":
-        return Position(self.x + other.x, self.y + other.y)
+        return Position.of(self.x + other.x, self.y + other.y)
+
+
+_interned.extend(
+    Position(index % _LIMIT - 1, index // _LIMIT - 1)
+    for index in range(_LIMIT * _LIMIT)
+)
@@ -0,0 +1,118 @@
+"""
+NumPy backend for territory and score computation.
+
+This module needs NumPy, installed with the ``numpy`` extra of the package.
+States are integer arrays in the ``state_as_matrix`` layout: ``1`` for
+black stones, ``-1`` for white stones and ``0`` for empty intersections.
+Every function accepts a single board of shape ``(size, size)`` or a batch
+of shape ``(n, size, size)``.
+"""
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from weiqi.core.figure import Stone
+from weiqi.core.position import Position
+
+if TYPE_CHECKING:
+    from weiqi.core.base_board import BaseBoard
+
+
+def _neighbors(mask: np.ndarray) -> np.ndarray:
+    """Points next to at least one point of the mask."""
+    result = np.zeros_like(mask)
+    result[..., 1:, :] |= mask[..., :-1, :]
+    result[..., :-1, :] |= mask[..., 1:, :]
+    result[..., :, 1:] |= mask[..., :, :-1]
+    result[..., :, :-1] |= mask[..., :, 1:]
+    return result
+
+
+def _flood(sources: np.ndarray, area: np.ndarray) -> np.ndarray:
+    """Points of the area connected through the area to the sources."""
+    reached = _neighbors(sources) & area
+    while True:
+        grown = (reached | _neighbors(reached)) & area
+        if np.array_equal(grown, reached):
+            return reached
+        reached = grown
+
+
+def ownership(states: np.ndarray) -> np.ndarray:
+    """
+    Labels the territory of every empty intersection.
+
+    An empty region belongs to a color if all the stones around it are of
+    that color. Regions are flooded with shifted masks, so the whole batch
+    is processed at once.
+
+    Returns:
+        np.ndarray: int8 array of the shape of the states, 1 for black
+            territory, -1 for white territory and 0 for neutral points and
+            stones.
+    """
+    states = np.asarray(states)
+    empty = states == 0
+    black = _flood(states == 1, empty)
+    white = _flood(states == -1, empty)
+    result = np.zeros(states.shape, dtype=np.int8)
+    result[black & ~white] = 1
+    result[white & ~black] = -1
+    return result
+
+
+def score(
+    states: np.ndarray,
+    white_captured: np.ndarray | int = 0,
+    black_captured: np.ndarray | int = 0,
+) -> np.ndarray:
+    """
+    Scores boards the same way as ``Board.score``.
+
+    Returns:
+        np.ndarray: Array of shape ``(..., 2)`` with the black and white
+            scores of every board.
+    """
+    owner = ownership(states)
+    black = np.count_nonzero(owner == 1, axis=(-2, -1))
+    white = np.count_nonzero(owner == -1, axis=(-2, -1))
+    result = np.stack(
+        [black + white_captured, white + black_captured], axis=-1
+    )
+
+    # If one figure in board, score for white and black is 0,0 respectively
+    expected_score = owner.shape[-1] * owner.shape[-2] - 1
+    single = (black == expected_score) | (white == expected_score)
+    result[single] = 0
+    return result
+
+
+def find_territories(
+    board: "BaseBoard",
+) -> tuple[dict[Stone | None, set[Position]], np.ndarray]:
+    """
+    Vectorized version of ``Board.find_territories``.
+
+    Returns:
+        tuple: The territories, as returned by the board, and the raw
+            ownership array of the board, indexed by ``[y, x]``.
+    """
+    states = np.array(board.state_as_matrix, dtype=np.int8)
+    owner = ownership(states)
+    neutral = (states == 0) & (owner == 0)
+    territories: dict[Stone | None, set[Position]] = {
+        Stone.BLACK: set(),
+        Stone.WHITE: set(),
+        None: set(),
+    }
+    for key, mask in (
+        (Stone.BLACK, owner == 1),
+        (Stone.WHITE, owner == -1),
+        (None, neutral),
+    ):
+        ys, xs = np.nonzero(mask)
+        territories[key].update(
+            Position.of(int(x), int(y)) for x, y in zip(xs, ys)
+        )
+    return territories, owner
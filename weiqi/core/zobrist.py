@@ -0,0 +1,28 @@
+from functools import lru_cache
+from typing import NamedTuple
+import random
+
+
+class ZobristKeys(NamedTuple):
+    """Random 64-bit keys of a board size, indexed by padded point."""
+
+    black: tuple[int, ...]
+    white: tuple[int, ...]
+    side: int
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(size: int) -> ZobristKeys:
+    """
+    Returns the Zobrist keys of the board size.
+
+    The generator is seeded with the size, so the same position has the
+    same hash in every process and every run.
+    """
+    rng = random.Random(size)
+    points = (size + 2) ** 2
+    return ZobristKeys(
+        black=tuple(rng.getrandbits(64) for _ in range(points)),
+        white=tuple(rng.getrandbits(64) for _ in range(points)),
+        side=rng.getrandbits(64),
+    )
@@ -0,0 +1,372 @@
+"""
+Go Text Protocol (GTP) engine, to play bots in Go programs and tournament
+managers.
+
+Usage: python -m weiqi.gtp [--size 19] [--komi 6.5] [--time 5.0]
+       [--playouts N] [--seed N]
+"""
+
+from collections.abc import Callable
+from functools import partial
+from importlib import metadata
+from typing import IO
+import argparse
+import sys
+
+from weiqi.arena.selfplay import BotFactory
+from weiqi.core.base_board import AVAILABLE_SIZES, BLACK, EMPTY, WHITE
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.game import WeiqiGame
+from weiqi.core.move import Move
+from weiqi.core.position import Position
+from weiqi.exceptions.game import GameOverException
+from weiqi.players.bot import BaseBot
+from weiqi.players.mcts import MCTSBot
+
+COLUMNS = "ABCDEFGHJKLMNOPQRSTUVWXYZ"  # Without I, as in GTP.
+COLORS = {
+    "b": Stone.BLACK,
+    "black": Stone.BLACK,
+    "w": Stone.WHITE,
+    "white": Stone.WHITE,
+}
+SYMBOLS = {BLACK: "X", WHITE: "O", EMPTY: "."}
+# Part of the time budget of a move kept for the controller and the pipes.
+SAFETY = 0.9
+MIN_TIME = 0.05
+
+
+class _CommandError(Exception):
+    pass
+
+
+class GTPEngine:
+    """
+    Plays a game through GTP commands, with a bot of each color.
+
+    ``handle`` answers one command line. Moves may be given for either
+    color: when it is not the turn of the color, the other one passes.
+    The controller decides when the game ends, so moves may follow two
+    passes.
+    ``genmove`` gives MCTS bots the time left by ``time_settings`` and
+    ``time_left``, within their own time limit.
+    """
+
+    def __init__(
+        self,
+        bot_factory: BotFactory | None = None,
+        size: int = 19,
+        komi: float | int = 6.5,
+    ):
+        if size not in AVAILABLE_SIZES:
+            raise ValueError("Not available size.")
+        self._bot_factory = bot_factory or partial(
+            MCTSBot, playouts=None, time_limit=5.0
+        )
+        self._size = size
+        self._komi = komi
+        self._main_time = 0.0
+        self._byo_yomi_time = 0.0
+        self._byo_yomi_stones = 0
+        self._time_left: dict[Stone, tuple[float, int]] = {}
+        self._limits: dict[Stone, float | None] = {}
+        self._quit = False
+        self._commands: dict[str, Callable[[list[str]], str]] = {
+            "protocol_version": lambda args: "2",
+            "name": lambda args: "weiqi",
+            "version": self._version,
+            "known_command": self._known_command,
+            "list_commands": lambda args: "\n".join(self._commands),
+            "quit": self._quit_command,
+            "boardsize": self._boardsize,
+            "clear_board": self._clear_board,
+            "komi": self._komi_command,
+            "play": self._play,
+            "genmove": self._genmove,
+            "undo": self._undo,
+            "final_score": self._final_score,
+            "showboard": self._showboard,
+            "time_settings": self._time_settings,
+            "time_left": self._time_left_command,
+        }
+        self._new_game([])
+
+    @property
+    def game(self) -> WeiqiGame:
+        return self._game
+
+    @property
+    def finished(self) -> bool:
+        """Checks if the controller sent ``quit``."""
+        return self._quit
+
+    def handle(self, line: str) -> str | None:
+        """
+        Answers a command line, or returns None for an empty line.
+
+        Returns:
+            str: The response, ending with the empty line of GTP.
+        """
+        line = line.split("#", 1)[0].replace("\t", " ")
+        # Other control characters are dropped.
+        words = "".join(char for char in line if char >= " ").split()
+        if not words:
+            return None
+        command_id = ""
+        if words[0].isdigit():
+            command_id = words.pop(0)
+        if not words:
+            return f"?{command_id} missing command\n\n"
+        command = self._commands.get(words[0].lower())
+        if command is None:
+            return f"?{command_id} unknown command\n\n"
+        try:
+            result = command(words[1:])
+        except _CommandError as error:
+            return f"?{command_id} {error}\n\n"
+        if not result:
+            return f"={command_id}\n\n"
+        return f"={command_id} {result}\n\n"
+
+    def run(self, input: IO[str], output: IO[str]):
+        """Answers the commands of the input until ``quit`` or its end."""
+        for line in input:
+            response = self.handle(line)
+            if response is None:
+                continue
+            output.write(response)
+            output.flush()
+            if self._quit:
+                break
+
+    def _new_game(self, moves: list[Move]):
+        self._bots = {
+            stone: self._bot_factory(stone)
+            for stone in (Stone.BLACK, Stone.WHITE)
+        }
+        self._game = WeiqiGame(
+            Board.generate_empty_board(self._size),
+            self._bots[Stone.BLACK],
+            self._bots[Stone.WHITE],
+            komi=self._komi,
+            headless=True,
+        )
+        for stone, bot in self._bots.items():
+            if isinstance(bot, MCTSBot):
+                self._limits[stone] = bot.time_limit
+        # Number of game moves of every GTP move, passes added included.
+        self._moves: list[int] = []
+        for move in moves:
+            self._game.make_move(self._game.get_current_player(), move)
+            self._resume()
+
+    def _version(self, args: list[str]) -> str:
+        try:
+            return metadata.version("weiqi")
+        except metadata.PackageNotFoundError:
+            return "unknown"
+
+    def _known_command(self, args: list[str]) -> str:
+        return "true" if args and args[0] in self._commands else "false"
+
+    def _quit_command(self, args: list[str]) -> str:
+        self._quit = True
+        return ""
+
+    def _boardsize(self, args: list[str]) -> str:
+        size = self._int(args, 0)
+        if size not in AVAILABLE_SIZES:
+            raise _CommandError("unacceptable size")
+        self._size = size
+        self._new_game([])
+        return ""
+
+    def _clear_board(self, args: list[str]) -> str:
+        self._new_game([])
+        return ""
+
+    def _komi_command(self, args: list[str]) -> str:
+        try:
+            komi = float(args[0])
+        except (IndexError, ValueError):
+            raise _CommandError("syntax error") from None
+        self._komi = int(komi) if komi.is_integer() else komi
+        # The komi of a game is fixed: the moves are played again.
+        moves = list(self._game.move_history)
+        stack = self._moves
+        self._new_game(moves)
+        self._moves = stack
+        return ""
+
+    def _play(self, args: list[str]) -> str:
+        if len(args) < 2:
+            raise _CommandError("syntax error")
+        stone = self._color(args[0])
+        position = self._vertex(args[1])
+        added = self._take_turn(stone)
+        try:
+            self._game.make_move(
+                self._game.get_current_player(), Move(position, stone)
+            )
+        except (ValueError, GameOverException):
+            self._undo_moves(added)
+            raise _CommandError("illegal move") from None
+        self._moves.append(added + 1)
+        return ""
+
+    def _genmove(self, args: list[str]) -> str:
+        if not args:
+            raise _CommandError("syntax error")
+        stone = self._color(args[0])
+        added = self._take_turn(stone)
+        if self._game.game_status.is_over:
+            self._undo_moves(added)
+            return "pass"
+        bot = self._bots[stone]
+        if isinstance(bot, MCTSBot):
+            bot.time_limit = self._time_limit(stone)
+        move = bot.make_move(self._game)
+        self._moves.append(added + 1)
+        return "pass" if move.position is None else self._format(move.position)
+
+    def _undo(self, args: list[str]) -> str:
+        if not self._moves:
+            raise _CommandError("cannot undo")
+        self._undo_moves(self._moves.pop())
+        return ""
+
+    def _final_score(self, args: list[str]) -> str:
+        score = self._game.board.score
+        black = score[Stone.BLACK]
+        white = score[Stone.WHITE] + self._komi
+        if black == white:
+            return "0"
+        winner = "B" if black > white else "W"
+        difference = abs(black - white)
+        if float(difference).is_integer():
+            difference = int(difference)
+        return f"{winner}+{difference}"
+
+    def _showboard(self, args: list[str]) -> str:
+        size = self._size
+        header = "   " + " ".join(COLUMNS[:size])
+        lines = ["", header]
+        for y, values in enumerate(self._game.board.state_as_matrix):
+            row = " ".join(SYMBOLS[value] for value in values)
+            lines.append(f"{size - y:2} {row} {size - y}")
+        lines.append(header)
+        return "\n".join(lines)
+
+    def _time_settings(self, args: list[str]) -> str:
+        main_time = self._int(args, 0)
+        byo_yomi_time = self._int(args, 1)
+        byo_yomi_stones = self._int(args, 2)
+        self._main_time = main_time
+        self._byo_yomi_time = byo_yomi_time
+        self._byo_yomi_stones = byo_yomi_stones
+        self._time_left = {}
+        return ""
+
+    def _time_left_command(self, args: list[str]) -> str:
+        stone = self._color(args[0] if args else "")
+        self._time_left[stone] = (self._int(args, 1), self._int(args, 2))
+        return ""
+
+    def _time_limit(self, stone: Stone) -> float | None:
+        """Seconds the bot may think on its next move."""
+        limit = self._limits.get(stone)
+        if self._byo_yomi_time > 0 and self._byo_yomi_stones == 0:
+            # No time limit, by the GTP convention.
+            return limit
+        if not self._main_time and not self._byo_yomi_time:
+            return limit
+        left, stones = self._time_left.get(stone, (self._main_time, 0))
+        if stones:
+            budget = left / stones
+        elif left > 0:
+            empty = sum(
+                row.count(EMPTY) for row in self._game.board.state_as_matrix
+            )
+            budget = left / max(empty // 2, 10)
+        else:
+            budget = self._byo_yomi_time / max(self._byo_yomi_stones, 1)
+        budget = max(budget * SAFETY, MIN_TIME)
+        return budget if limit is None else min(budget, limit)
+
+    def _take_turn(self, stone: Stone) -> int:
+        """
+        Passes for the other color if needed, returns the passes made.
+
+        A game ended by two passes goes on, and the passes made here never
+        end it.
+        """
+        game = self._game
+        self._resume()
+        if game.turn == stone or game.game_status.is_over:
+            return 0
+        game.make_move(game.get_current_player(), Move(None, game.turn))
+        self._resume()
+        return 1
+
+    def _resume(self):
+        """Opens again the game if it was ended by two passes."""
+        status = self._game.game_status
+        if status.is_over and status.black_score is not None:
+            self._game.resume()
+
+    def _undo_moves(self, count: int):
+        for _ in range(count):
+            self._game.undo()
+
+    def _color(self, word: str) -> Stone:
+        stone = COLORS.get(word.lower())
+        if stone is None:
+            raise _CommandError("invalid color")
+        return stone
+
+    def _vertex(self, word: str) -> Position | None:
+        word = word.upper()
+        if word == "PASS":
+            return None
+        column = COLUMNS.find(word[:1])
+        if not word[1:].isdigit() or column < 0:
+            raise _CommandError("invalid coordinate")
+        row = int(word[1:])
+        if not (column < self._size and 1 <= row <= self._size):
+            raise _CommandError("invalid coordinate")
+        return Position.of(column, self._size - row)
+
+    def _format(self, position: Position) -> str:
+        return f"{COLUMNS[position.x]}{self._size - position.y}"
+
+    @staticmethod
+    def _int(args: list[str], index: int) -> int:
+        try:
+            return int(args[index])
+        except (IndexError, ValueError):
+            raise _CommandError("syntax error") from None
+
+
+def main(arguments: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=19)
+    parser.add_argument("--komi", type=float, default=6.5)
+    parser.add_argument(
+        "--time", type=float, default=5.0, help="seconds per move at most"
+    )
+    parser.add_argument("--playouts", type=int)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(arguments)
+
+    def bot_factory(stone: Stone) -> BaseBot:
+        return MCTSBot(
+            stone, playouts=args.playouts, time_limit=args.time, seed=args.seed
+        )
+
+    engine = GTPEngine(bot_factory, args.size, args.komi)
+    engine.run(sys.stdin, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+Asyncio hub holding many concurrent games in one process.
+"""
+
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+import asyncio
+import struct
+import time
+import uuid
+
+from weiqi.arena.selfplay import BotFactory
+from weiqi.core.board import Board, BoardSnapshot
+from weiqi.core.figure import Stone
+from weiqi.core.game import WeiqiGame
+from weiqi.core.move import Move
+from weiqi.core.position import Position
+from weiqi.players.bot import BaseBot
+from weiqi.players.player import Player
+from weiqi.records.archive import decode_move, encode_moves
+from weiqi.utils.enums import KoRule, Winner
+from weiqi.utils.game_status import GameStatus
+
+# Packed game: size, komi, ko rule and the winner of a resigned game (0 if
+# none), followed by the moves as archive codes.
+_PACKED = struct.Struct("<BdBB")
+_KO_RULES = {None: 0, KoRule.POSITIONAL: 1, KoRule.SITUATIONAL: 2}
+_KO_CODES = {code: rule for rule, code in _KO_RULES.items()}
+
+
+@dataclass
+class _Session:
+    black: BotFactory | None  # None for a human player.
+    white: BotFactory | None
+    game: WeiqiGame | None = None  # None while the game is evicted.
+    packed: bytes = b""
+    used: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+def _pack(game: WeiqiGame) -> bytes:
+    """Packs the game into a few bytes per move."""
+    status = game.game_status
+    resigned = status.is_over and status.black_score is None
+    header = _PACKED.pack(
+        game.board.size,
+        game.komi,
+        _KO_RULES[game.ko_rule],
+        status.winner.value if resigned and status.winner else 0,
+    )
+    return header + encode_moves(game.move_history, game.board.size).tobytes()
+
+
+def _unpack(
+    data: bytes, black: BotFactory | None, white: BotFactory | None
+) -> WeiqiGame:
+    """Plays the moves of a packed game again in a new game."""
+    size, komi, ko_code, winner = _PACKED.unpack_from(data)
+    game = WeiqiGame(
+        Board.generate_empty_board(size),
+        black(Stone.BLACK) if black else Player(Stone.BLACK),
+        white(Stone.WHITE) if white else Player(Stone.WHITE),
+        komi=int(komi) if komi.is_integer() else komi,
+        ko_rule=_KO_CODES[ko_code],
+        headless=True,
+    )
+    start = _PACKED.size
+    for code in memoryview(data)[start:].cast("H"):
+        game.make_move(game.get_current_player(), decode_move(code, size))
+    if winner:
+        game.game_status.end_game(Winner(winner), None, None)
+    return game
+
+
+def _think(
+    data: bytes, black: BotFactory | None, white: BotFactory | None
+) -> Move:
+    """Chooses the move of the bot to play, in a worker process."""
+    game = _unpack(data, black, white)
+    bot = game.get_current_player()
+    assert isinstance(bot, BaseBot)
+    return bot.make_move(game)
+
+
+class GameHub:
+    """
+    Holds games by id and plays their moves from asyncio code.
+
+    Calls on one game run one at a time, in order; calls on different games
+    run concurrently. Bots think in ``executor``, a thread pool of
+    ``workers`` threads by default, and at most ``max_pending`` bot moves
+    are queued or running: further ``bot_move`` calls wait for a slot.
+    Bots of a process pool get the game packed and send back their move,
+    so they keep nothing between moves. A cancelled ``bot_move`` of a
+    thread pool holds the game until the bot has played.
+
+    A game unused for ``idle_timeout`` seconds, or the least recently used
+    one when more than ``max_active`` are held, is evicted: only its packed
+    moves are kept, and it is played again on its next use. Bots are made
+    again then, so search trees are lost.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        executor: Executor | None = None,
+        max_pending: int = 64,
+        max_active: int = 1000,
+        idle_timeout: float | None = 300.0,
+    ):
+        if max_pending < 1 or max_active < 1:
+            raise ValueError("Limits must be positive.")
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=workers)
+        self._remote = isinstance(self._executor, ProcessPoolExecutor)
+        self._slots = asyncio.Semaphore(max_pending)
+        self._max_active = max_active
+        self._idle_timeout = idle_timeout
+        self._sessions: dict[str, _Session] = {}
+        # Ids of the games not evicted, least recently used first.
+        self._active: OrderedDict[str, None] = OrderedDict()
+        self._eviction_task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "GameHub":
+        if self._idle_timeout is not None:
+            self._eviction_task = asyncio.create_task(self._evict_forever())
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Stops the eviction task and the executor, if the hub made it."""
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            self._eviction_task = None
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, game_id: object) -> bool:
+        return game_id in self._sessions
+
+    @property
+    def active_count(self) -> int:
+        """Number of games held unpacked."""
+        return len(self._active)
+
+    def create_game(
+        self,
+        black: BotFactory | None = None,
+        white: BotFactory | None = None,
+        size: int = 19,
+        komi: float | int = 6.5,
+        ko_rule: KoRule | None = KoRule.POSITIONAL,
+        game_id: str | None = None,
+    ) -> str:
+        """
+        Starts a game and returns its id.
+
+        A color without a bot factory is played by a human, through
+        ``make_move``.
+        """
+        game_id = game_id or uuid.uuid4().hex
+        if game_id in self._sessions:
+            raise ValueError("Game already exists.")
+        game = WeiqiGame(
+            Board.generate_empty_board(size),
+            black(Stone.BLACK) if black else Player(Stone.BLACK),
+            white(Stone.WHITE) if white else Player(Stone.WHITE),
+            komi=komi,
+            ko_rule=ko_rule,
+            headless=True,
+        )
+        self._sessions[game_id] = _Session(black, white, game)
+        self._touch(game_id, self._sessions[game_id])
+        self._evict_over_limit()
+        return game_id
+
+    def remove_game(self, game_id: str):
+        """Forgets the game; calls on it still running end normally."""
+        self._session(game_id)
+        del self._sessions[game_id]
+        self._active.pop(game_id, None)
+
+    async def make_move(self, game_id: str, position: Position | None) -> Move:
+        """Plays the move of the human to play; None passes."""
+        async with self._use(game_id) as (session, game):
+            player = game.get_current_player()
+            if isinstance(player, BaseBot):
+                raise ValueError("It's the bot's turn.")
+            move = Move(position, player.figure)
+            game.make_move(player, move)
+            return move
+
+    async def bot_move(self, game_id: str) -> Move:
+        """Lets the bot to play think in the executor and plays its move."""
+        async with self._use(game_id) as (session, game):
+            bot = game.get_current_player()
+            if not isinstance(bot, BaseBot):
+                raise ValueError("It's not a bot's turn.")
+            loop = asyncio.get_running_loop()
+            async with self._slots:
+                if not self._remote:
+                    future = loop.run_in_executor(
+                        self._executor, bot.make_move, game
+                    )
+                    try:
+                        return await asyncio.shield(future)
+                    except asyncio.CancelledError:
+                        # The thread plays on the game: it is locked and the
+                        # slot held until the move is made.
+                        while not future.done():
+                            with suppress(asyncio.CancelledError):
+                                await asyncio.wait({future})
+                        raise
+                move = await loop.run_in_executor(
+                    self._executor,
+                    _think,
+                    _pack(game),
+                    session.black,
+                    session.white,
+                )
+            game.make_move(bot, move)
+            return move
+
+    async def resign(self, game_id: str, stone: Stone):
+        async with self._use(game_id) as (session, game):
+            player = next(p for p in game.players if p.figure == stone)
+            if not isinstance(player, Player):
+                raise ValueError("Bots do not resign.")
+            game.resign(player)
+
+    async def board(self, game_id: str) -> BoardSnapshot:
+        async with self._use(game_id) as (session, game):
+            return game.board
+
+    async def status(self, game_id: str) -> tuple[GameStatus, Stone]:
+        """Status of the game and the color to play."""
+        async with self._use(game_id) as (session, game):
+            return game.game_status, game.turn
+
+    def evict_idle(self, now: float | None = None) -> int:
+        """
+        Packs the games unused for the idle timeout.
+
+        Returns:
+            int: The number of games evicted.
+        """
+        if self._idle_timeout is None:
+            return 0
+        limit = (time.monotonic() if now is None else now) - self._idle_timeout
+        idle = []
+        for game_id in self._active:
+            session = self._sessions[game_id]
+            if session.used > limit:
+                break
+            if not session.lock.locked():
+                idle.append(game_id)
+        for game_id in idle:
+            self._evict(game_id, self._sessions[game_id])
+        return len(idle)
+
+    async def _evict_forever(self):
+        assert self._idle_timeout is not None
+        while True:
+            await asyncio.sleep(max(self._idle_timeout / 2, 0.01))
+            self.evict_idle()
+
+    def _session(self, game_id: str) -> _Session:
+        try:
+            return self._sessions[game_id]
+        except KeyError:
+            raise KeyError(f"Unknown game: {game_id}.") from None
+
+    @asynccontextmanager
+    async def _use(
+        self, game_id: str
+    ) -> AsyncIterator[tuple[_Session, WeiqiGame]]:
+        session = self._session(game_id)
+        async with session.lock:
+            if session.game is None:
+                session.game = _unpack(
+                    session.packed, session.black, session.white
+                )
+                session.packed = b""
+            try:
+                yield session, session.game
+            finally:
+                # The game may have been removed meanwhile.
+                if self._sessions.get(game_id) is session:
+                    self._touch(game_id, session)
+        self._evict_over_limit()
+
+    def _touch(self, game_id: str, session: _Session):
+        session.used = time.monotonic()
+        self._active[game_id] = None
+        self._active.move_to_end(game_id)
+
+    def _evict(self, game_id: str, session: _Session):
+        assert session.game is not None
+        session.packed = _pack(session.game)
+        session.game = None
+        del self._active[game_id]
+
+    def _evict_over_limit(self):
+        excess = len(self._active) - self._max_active
+        if excess <= 0:
+            return
+        # Games in use are skipped; they are evicted later.
+        idle = []
+        for game_id in self._active:
+            if not self._sessions[game_id].lock.locked():
+                idle.append(game_id)
+                if len(idle) == excess:
+                    break
+        for game_id in idle:
+            self._evict(game_id, self._sessions[game_id])
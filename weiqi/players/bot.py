@@ -3,9 +3,8 @@ from typing import TYPE_CHECKING
 import random
 
 from weiqi.core.figure import Stone
-from weiqi.core.position import Position
 from weiqi.core.move import Move
-from weiqi.core.board import Board
+from weiqi.core.board import BoardSnapshot
 
 if TYPE_CHECKING:
     from weiqi.core.game import WeiqiGame
@@ -44,12 +43,6 @@ class RandomBot(BaseBot):
             and random.random() < 0.4
         )
 
-    @staticmethod
-    def _get_random_position(size: int) -> Position:
-        x_rand = random.randint(0, size - 1)
-        y_rand = random.randint(0, size - 1)
-        return Position(x_rand, y_rand)
-
     def make_move(self, game: "WeiqiGame") -> Move:
         board = game.board
         last_move = game.move_history.last_move
@@ -62,7 +55,7 @@ class RandomBot(BaseBot):
 
         return self._make_random_valid_move(game, board)
 
-    def _should_pass_on_high_occupancy(self, board: Board) -> bool:
+    def _should_pass_on_high_occupancy(self, board: BoardSnapshot) -> bool:
         state_as_matrix = board.state_as_matrix
         fielded_board = self._calc_field_board(state_as_matrix)
         return 0.8 <= fielded_board <= 1.0 and random.random() < 0.4
@@ -74,18 +67,19 @@ class RandomBot(BaseBot):
         return move
 
     def _make_random_valid_move(
-        self, game: "WeiqiGame", board: Board
+        self, game: "WeiqiGame", board: BoardSnapshot
     ) -> Move:
-        """Makes a random valid move."""
-        max_attempts = 15
-        for attempt in range(max_attempts):
-            position = self._get_random_position(board.size)
-            move = Move(position=position, figure=self.figure)
-            if board.figures[position] is None:
-                try:
-                    game.make_move(self, move)
-                    return move
-                except ValueError:
-                    continue
+        """Makes a move chosen uniformly among the legal ones."""
+        positions = board.legal_moves(self.figure)
+        while positions:
+            index = random.randrange(len(positions))
+            move = Move(position=positions[index], figure=self.figure)
+            try:
+                game.make_move(self, move)
+                return move
+            except ValueError:
+                # Superko is checked by the game only, drop the move.
+                positions[index] = positions[-1]
+                positions.pop()
         # If no valid move was found, pass.
         return self._make_pass_move(game)
@@ -0,0 +1,482 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+import math
+import random
+import time
+
+from weiqi.core.base_board import (
+    BLACK,
+    EMPTY,
+    STONE_VALUES,
+    WHITE,
+    point_positions,
+)
+from weiqi.core.board import Board
+from weiqi.core.delta import Delta
+from weiqi.core.figure import Stone
+from weiqi.core.move import Move, MoveHistory
+from weiqi.core.playout import PlayoutBoard
+from weiqi.players.bot import BaseBot
+from weiqi.players.transposition import TranspositionTable, position_key
+
+if TYPE_CHECKING:
+    from weiqi.core.game import WeiqiGame
+
+PASS = 0  # Padded point 0 is a border cell, so it never names a move.
+STONES = {BLACK: Stone.BLACK, WHITE: Stone.WHITE}
+# Nodes with fewer visits are not worth a transposition table entry.
+STORED_VISITS = 8
+
+
+class _Node:
+    """Node of the search tree, reached by ``value`` playing ``point``."""
+
+    __slots__ = (
+        "point",
+        "value",
+        "parent",
+        "children",
+        "untried",
+        "wins",
+        "visits",
+        "amaf_wins",
+        "amaf_visits",
+    )
+
+    def __init__(self, point: int, value: int, parent: "_Node | None"):
+        self.point = point
+        self.value = value
+        self.parent = parent
+        self.children: list[_Node] = []
+        # Moves not expanded yet, filled in when the node is first reached.
+        self.untried: list[int] | None = None
+        self.wins = 0.0
+        self.visits = 0
+        # All-moves-as-first statistics: results of the simulations through
+        # the parent in which the move was played later by the same side.
+        self.amaf_wins = 0.0
+        self.amaf_visits = 0
+
+    def uct_child(self, exploration: float, equivalence: float) -> "_Node":
+        log_visits = math.log(self.visits)
+
+        def value(child: _Node) -> float:
+            mean = child.wins / child.visits
+            if child.amaf_visits:
+                # The AMAF mean guides the first visits and fades out as
+                # the real visits reach the equivalence count.
+                visits = 3 * child.visits
+                beta = math.sqrt(equivalence / (visits + equivalence))
+                amaf_mean = child.amaf_wins / child.amaf_visits
+                mean = (1 - beta) * mean + beta * amaf_mean
+            return mean + exploration * math.sqrt(log_visits / child.visits)
+
+        return max(self.children, key=value)
+
+
+def _winner(board: Board, komi: float) -> int:
+    """Point value of the winner of the board, EMPTY on a draw."""
+    score = board.score
+    black_score = score[Stone.BLACK]
+    white_score = score[Stone.WHITE] + komi
+    if black_score > white_score:
+        return BLACK
+    if white_score > black_score:
+        return WHITE
+    return EMPTY
+
+
+def _is_eye(points: array, neighbors: tuple[int, ...], value: int) -> bool:
+    """Checks if the empty point is surrounded by the value and borders."""
+    for neighbor in neighbors:
+        if points[neighbor] != value:
+            return False
+    return True
+
+
+def _search_worker(
+    data: bytes,
+    figure: Stone,
+    root_point: int,
+    komi: float,
+    playouts: int | None,
+    time_limit: float | None,
+    exploration: float,
+    rave_equivalence: float,
+    seed: int,
+) -> tuple[dict[int, int], int]:
+    """
+    Searches the packed board in a worker process.
+
+    Returns:
+        tuple: The visits of every root move and the number of playouts.
+    """
+    bot = MCTSBot(
+        figure, playouts, time_limit, exploration, rave_equivalence, seed
+    )
+    root = _Node(root_point, -STONE_VALUES[figure], None)
+    count = bot._search(root, Board.from_bytes(data), komi)
+    return {child.point: child.visits for child in root.children}, count
+
+
+class MCTSBot(BaseBot):
+    """
+    Bot that searches moves with Monte Carlo tree search (UCT).
+
+    Every playout walks down the tree by the UCT rule, expands one new
+    move and finishes the game with random moves. The search board is
+    changed with ``Board.play`` and taken back with ``Board.undo``. The
+    subtree of the chosen move is kept for the next search.
+
+    Few playouts reach every move on 9x9 and larger boards, so the mean of
+    a move is blended with its all-moves-as-first (RAVE) mean until it has
+    about ``rave_equivalence`` visits of its own. Zero gives plain UCT.
+
+    The search stops after ``playouts`` playouts or ``time_limit`` seconds,
+    whichever comes first.
+
+    With ``workers`` above one, the search runs in that many processes
+    (root parallelism): each searches its own tree from the position, with
+    its share of the playouts or for the whole time limit, and the visits
+    of the moves are summed. Trees are not kept between moves then. Call
+    ``close`` or use the bot as a context manager to stop the processes.
+
+    A ``transpositions`` table keeps the statistics of the searched
+    positions between moves, and can be shared with other bots. New nodes
+    start from the statistics of their position as an AMAF prior, so
+    positions reached by other move orders are not searched from scratch.
+    The table is used by single-process searches only.
+    """
+
+    def __init__(
+        self,
+        figure: Stone,
+        playouts: int | None = 1000,
+        time_limit: float | None = None,
+        exploration: float = 0.4,
+        rave_equivalence: float = 1000,
+        seed: int | None = None,
+        workers: int = 1,
+        transpositions: TranspositionTable | None = None,
+    ):
+        super().__init__(figure)
+        if playouts is None and time_limit is None:
+            raise ValueError("Either playouts or time limit is required.")
+        if workers < 1:
+            raise ValueError("At least one worker is required.")
+        self._playouts = playouts
+        self._time_limit = time_limit
+        self._exploration = exploration
+        self._rave_equivalence = rave_equivalence
+        # Without a seed, seeding the random module makes bots reproducible.
+        self._random = random.Random(
+            random.getrandbits(64) if seed is None else seed
+        )
+        self._workers = workers
+        self._transpositions = transpositions
+        self._executor: ProcessPoolExecutor | None = None
+        self._last_playouts = 0
+        self._root: _Node | None = None
+        self._game: "WeiqiGame | None" = None
+        self._history_length = 0
+        self._history = MoveHistory()
+
+    def __enter__(self) -> "MCTSBot":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def playouts(self) -> int | None:
+        return self._playouts
+
+    @property
+    def time_limit(self) -> float | None:
+        return self._time_limit
+
+    @time_limit.setter
+    def time_limit(self, time_limit: float | None):
+        """Changes the time limit of the next searches."""
+        if self._playouts is None and time_limit is None:
+            raise ValueError("Either playouts or time limit is required.")
+        self._time_limit = time_limit
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def transpositions(self) -> TranspositionTable | None:
+        return self._transpositions
+
+    @property
+    def last_playouts(self) -> int:
+        """Number of playouts of the last search, over all workers."""
+        return self._last_playouts
+
+    def close(self):
+        """Stops the worker processes of the parallel search, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def make_move(self, game: "WeiqiGame") -> Move:
+        choices: list[tuple[int, _Node | None]]
+        if self._workers == 1:
+            root = self._reuse_root(game)
+            board = game.board.to_board()
+            self._last_playouts = self._search(root, board, game.komi)
+            if self._transpositions is not None:
+                self._store(root, board)
+            ranked = sorted(
+                root.children, key=lambda child: child.visits, reverse=True
+            )
+            choices = [(child.point, child) for child in ranked]
+        else:
+            visits = self._parallel_search(game)
+            ranked_visits = sorted(
+                visits.items(), key=lambda item: item[1], reverse=True
+            )
+            choices = [(point, None) for point, _ in ranked_visits]
+
+        positions = point_positions(game.board.size)
+        for point, child in choices:
+            position = positions[point] if point else None
+            move = Move(position=position, figure=self.figure)
+            try:
+                game.make_move(self, move)
+            except ValueError:
+                # Superko is checked by the game only, try the next move.
+                continue
+            if child is not None:
+                self._keep_subtree(game, child)
+            return move
+
+        move = Move(position=None, figure=self.figure)
+        game.make_move(self, move)
+        self._root = None
+        return move
+
+    def _parallel_search(self, game: "WeiqiGame") -> dict[int, int]:
+        """Searches in the worker processes and sums the root visits."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        playouts = self._playouts
+        if playouts is not None:
+            playouts = -(-playouts // self._workers)
+        # Workers get the position as packed bytes, not the game objects.
+        data = game.board.to_bytes()
+        root_point = self._new_root(game).point
+        futures = [
+            self._executor.submit(
+                _search_worker,
+                data,
+                self.figure,
+                root_point,
+                game.komi,
+                playouts,
+                self._time_limit,
+                self._exploration,
+                self._rave_equivalence,
+                self._random.getrandbits(64),
+            )
+            for _ in range(self._workers)
+        ]
+
+        visits: dict[int, int] = {}
+        self._last_playouts = 0
+        for future in futures:
+            worker_visits, count = future.result()
+            for point, count_visits in worker_visits.items():
+                visits[point] = visits.get(point, 0) + count_visits
+            self._last_playouts += count
+        self._root = None
+        return visits
+
+    def _reuse_root(self, game: "WeiqiGame") -> _Node:
+        """Finds the node of the current position in the kept tree."""
+        root = self._root
+        history = game.move_history
+        start = self._history_length
+        if (
+            root is None
+            or game is not self._game
+            or len(history) < start
+            # Moves taken back and played again lead elsewhere.
+            or history[:start] != self._history
+        ):
+            return self._new_root(game)
+
+        for move in history[start:]:
+            point = (
+                PASS
+                if move.position is None
+                else game.board._index(move.position)
+            )
+            root = next(
+                (child for child in root.children if child.point == point),
+                None,
+            )
+            if root is None:
+                return self._new_root(game)
+        root.parent = None
+        return root
+
+    def _new_root(self, game: "WeiqiGame") -> _Node:
+        last_move = game.move_history.last_move
+        # A root reached by a pass ends the game if the bot passes too.
+        point = PASS if last_move and last_move.position is None else -1
+        return _Node(point, -STONE_VALUES[self.figure], None)
+
+    def _keep_subtree(self, game: "WeiqiGame", child: _Node):
+        child.parent = None
+        self._root = child
+        self._game = game
+        self._history_length = len(game.move_history)
+        self._history = game.move_history[:]
+
+    def _search(self, root: _Node, board: Board, komi: float) -> int:
+        """Runs playouts from the root and returns their number."""
+        deadline = (
+            time.perf_counter() + self._time_limit
+            if self._time_limit is not None
+            else math.inf
+        )
+        count = 0
+        while (self._playouts is None or count < self._playouts) and (
+            time.perf_counter() < deadline
+        ):
+            self._iterate(root, board, komi)
+            count += 1
+        return count
+
+    def _iterate(self, root: _Node, board: Board, komi: float):
+        node = root
+        deltas: list[Delta] = []
+        terminal = False
+        while True:
+            parent = node.parent
+            if node.point == PASS and parent and parent.point == PASS:
+                terminal = True
+                break
+            if node.untried is None:
+                node.untried = self._candidates(board, node)
+            if node.untried:
+                point = node.untried.pop(
+                    self._random.randrange(len(node.untried))
+                )
+                child = _Node(point, -node.value, node)
+                node.children.append(child)
+                node = child
+                deltas.append(self._play(board, node))
+                if self._transpositions is not None:
+                    self._seed(child, board)
+                break
+            if not node.children:
+                break
+            node = node.uct_child(
+                self._exploration, self._rave_equivalence
+            )
+            deltas.append(self._play(board, node))
+
+        if terminal:
+            winner = _winner(board, komi)
+            played: set[int] = set()
+        else:
+            playout = PlayoutBoard(board)
+            passes = 1 if node.point == PASS else 0
+            played = set(playout.run(-node.value, self._random, passes))
+            winner = playout.winner(komi)
+
+        for delta in reversed(deltas):
+            board.undo(delta)
+        current: _Node | None = node
+        while current is not None:
+            current.visits += 1
+            if winner == current.value:
+                current.wins += 1
+            elif winner == EMPTY:
+                current.wins += 0.5
+            for child in current.children:
+                if child.point * child.value in played:
+                    child.amaf_visits += 1
+                    if winner == child.value:
+                        child.amaf_wins += 1
+                    elif winner == EMPTY:
+                        child.amaf_wins += 0.5
+            if current.point > 0:
+                played.add(current.point * current.value)
+            current = current.parent
+
+    def _seed(self, node: _Node, board: Board):
+        """Starts the new node from the statistics of its position."""
+        assert self._transpositions is not None
+        entry = self._transpositions.get(
+            position_key(board, STONES[-node.value])
+        )
+        if entry is not None and entry.visits:
+            node.amaf_wins += entry.wins
+            node.amaf_visits += entry.visits
+
+    def _store(self, node: _Node, board: Board) -> int:
+        """
+        Stores the statistics of the node and of the nodes below it with
+        enough visits, on the board of the node.
+
+        Returns:
+            int: The height of the subtree of the node.
+        """
+        assert self._transpositions is not None
+        height = 0
+        best = None
+        for child in node.children:
+            if best is None or child.visits > best.visits:
+                best = child
+            if child.visits >= STORED_VISITS:
+                delta = self._play(board, child)
+                height = max(height, self._store(child, board) + 1)
+                board.undo(delta)
+            elif child.visits:
+                height = max(height, 1)
+        best_move = None
+        if best is not None and best.point != PASS:
+            best_move = point_positions(board.size)[best.point]
+        self._transpositions.store(
+            position_key(board, STONES[-node.value]),
+            visits=node.visits,
+            wins=node.wins,
+            best_move=best_move,
+            depth=height,
+        )
+        return height
+
+    @staticmethod
+    def _candidates(board: Board, node: _Node) -> list[int]:
+        """
+        Moves searched from the node.
+
+        Own eyes are not filled, and passing is searched only to answer a
+        pass or when nothing else is left, so the game cannot end early by
+        chance.
+        """
+        value = -node.value
+        points = board._points
+        neighbors = board._neighbors
+        candidates = [
+            point
+            for _, point in board._legal_points(value)
+            if not _is_eye(points, neighbors[point], value)
+        ]
+        if node.point == PASS or not candidates:
+            candidates.append(PASS)
+        return candidates
+
+    @staticmethod
+    def _play(board: Board, node: _Node) -> Delta:
+        stone = STONES[node.value]
+        if node.point == PASS:
+            return board.play(Move(position=None, figure=stone))
+        position = point_positions(board.size)[node.point]
+        return board.play(Move(position=position, figure=stone))
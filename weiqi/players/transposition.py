@@ -0,0 +1,148 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Literal
+
+from weiqi.core.base_board import BaseBoard
+from weiqi.core.figure import Stone
+from weiqi.core.position import Position
+from weiqi.core.zobrist import zobrist_keys
+
+
+def position_key(board: BaseBoard, turn: Stone) -> int:
+    """Key of the position: the board hash, changed when white is to move."""
+    if turn == Stone.WHITE:
+        return board.hash ^ zobrist_keys(board.size).side
+    return board.hash
+
+
+@dataclass(slots=True)
+class TranspositionEntry:
+    """
+    What is known about a position.
+
+    ``wins`` and ``visits`` are seen from the player who moved into the
+    position; ``value`` is an evaluation by the same player.
+    """
+
+    key: int
+    visits: int = 0
+    wins: float = 0.0
+    value: float | None = None
+    best_move: Position | None = None
+    depth: int = 0
+
+
+class TranspositionTable:
+    """
+    Table of positions keyed by ``position_key``, with a fixed capacity.
+
+    With ``replacement="lru"``, a full table evicts the least recently used
+    entry. With ``replacement="depth"``, every key has one slot and a new
+    entry replaces the one in its slot only if it is searched at least as
+    deep, so shallow positions never push out deep ones.
+
+    The table is an ordinary object: a bot keeps it between ``make_move``
+    calls, and several bots can share one.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        replacement: Literal["lru", "depth"] = "lru",
+    ):
+        if capacity < 1:
+            raise ValueError("Capacity must be positive.")
+        if replacement not in ("lru", "depth"):
+            raise ValueError("Replacement must be lru or depth.")
+        self._capacity = capacity
+        self._replacement = replacement
+        self._entries: OrderedDict[int, TranspositionEntry] = OrderedDict()
+        self._slots: list[TranspositionEntry | None] = (
+            [None] * capacity if replacement == "depth" else []
+        )
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def replacement(self) -> str:
+        return self._replacement
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        if self._replacement == "depth":
+            return self._size
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Checks for the key, without counting a lookup."""
+        return isinstance(key, int) and self._find(key) is not None
+
+    def _find(self, key: int) -> TranspositionEntry | None:
+        if self._replacement == "depth":
+            entry = self._slots[key % self._capacity]
+            return entry if entry is not None and entry.key == key else None
+        return self._entries.get(key)
+
+    def get(self, key: int) -> TranspositionEntry | None:
+        entry = self._find(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self._replacement == "lru":
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(
+        self,
+        key: int,
+        visits: int = 0,
+        wins: float = 0.0,
+        value: float | None = None,
+        best_move: Position | None = None,
+        depth: int = 0,
+    ) -> bool:
+        """
+        Stores what is known about the position, replacing older data.
+
+        Returns:
+            bool: Whether it was stored (a deeper entry may be kept).
+        """
+        entry = TranspositionEntry(key, visits, wins, value, best_move, depth)
+        if self._replacement == "depth":
+            index = key % self._capacity
+            current = self._slots[index]
+            if current is None:
+                self._size += 1
+            elif current.key != key:
+                if current.depth > depth:
+                    return False
+                self.evictions += 1
+            self._slots[index] = entry
+        else:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            elif len(self._entries) >= self._capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._entries[key] = entry
+        self.stores += 1
+        return True
+
+    def clear(self):
+        """Removes all the entries and resets the counters."""
+        self._entries.clear()
+        self._slots = [None] * len(self._slots)
+        self._size = 0
+        self.hits = self.misses = self.stores = self.evictions = 0
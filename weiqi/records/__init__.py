@@ -0,0 +1,28 @@
+from weiqi.records.archive import (
+    Archive,
+    ArchiveGame,
+    ArchiveWriter,
+    write_archive,
+)
+from weiqi.records.replay import (
+    ReplayResult,
+    replay_archive,
+    replay_game,
+    replay_games,
+)
+from weiqi.records.sgf import GameRecord, parse_sgf, read_sgf, write_sgf
+
+__all__ = (
+    "GameRecord",
+    "parse_sgf",
+    "read_sgf",
+    "write_sgf",
+    "ReplayResult",
+    "replay_archive",
+    "replay_game",
+    "replay_games",
+    "Archive",
+    "ArchiveGame",
+    "ArchiveWriter",
+    "write_archive",
+)
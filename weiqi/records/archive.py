@@ -0,0 +1,370 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import IO
+import mmap
+import os
+import random
+import struct
+import sys
+
+from weiqi.core.base_board import AVAILABLE_SIZES, board_points
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.move import Move, MoveHistory
+from weiqi.core.playout import PlayoutBoard
+from weiqi.core.position import Position
+from weiqi.records.sgf import GameRecord
+
+# File layout: header, games, index of game offsets, footer.
+#
+# A game is a fixed header (size, result length, komi in half points,
+# number of setup stones, number of moves), the result text padded to an
+# even length, then the setup stones and the moves as uint16 codes. A code
+# is the intersection number (y * size + x + 1, 0 for a pass) shifted left
+# once, with the low bit set for white. Integers are little-endian.
+MAGIC = b"WQAR"
+VERSION = 1
+_HEADER = struct.Struct("<4sH")
+_GAME = struct.Struct("<BBhHI")
+_FOOTER = struct.Struct("<QQ4s")
+_WHITE_BIT = 1
+
+
+def encode_moves(
+    moves: Iterable[Move], size: int, strict: bool = True
+) -> array:
+    """
+    Packs moves into archive codes.
+
+    Positions off the board raise ValueError, or with ``strict=False`` get
+    the number after the last intersection, so a replay can report them.
+    """
+    codes = array("H")
+    for move in moves:
+        code = _WHITE_BIT if move.figure == Stone.WHITE else 0
+        position = move.position
+        if position is None:
+            pass
+        elif 0 <= position.x < size and 0 <= position.y < size:
+            code |= (position.y * size + position.x + 1) << 1
+        elif strict:
+            raise ValueError("Position out of bounds.")
+        else:
+            code |= (size * size + 1) << 1
+        codes.append(code)
+    return codes
+
+
+def decode_move(code: int, size: int) -> Move:
+    figure = Stone.WHITE if code & _WHITE_BIT else Stone.BLACK
+    number = code >> 1
+    if not number:
+        return Move(None, figure)
+    y, x = divmod(number - 1, size)
+    return Move(Position.of(x, y), figure)
+
+
+@lru_cache(maxsize=None)
+def _empty_board(size: int) -> Board:
+    return Board.generate_empty_board(size)
+
+
+def _start_board(size: int, setup: Sequence[int]) -> PlayoutBoard:
+    """Playout board with the setup stones of a game."""
+    if not setup:
+        return PlayoutBoard(_empty_board(size))
+    figures: dict[Position, Stone | None] = {
+        Position.of(x, y): None for y in range(size) for x in range(size)
+    }
+    for code in setup:
+        move = decode_move(code, size)
+        if move.position not in figures:
+            raise ValueError("Invalid positions.")
+        figures[move.position] = move.figure
+    return PlayoutBoard(Board(figures))
+
+
+def _uint16(data: memoryview) -> Sequence[int]:
+    """Codes of the bytes, without a copy on little-endian machines."""
+    if sys.byteorder == "little":
+        return data.cast("H")
+    codes = array("H", bytes(data))
+    codes.byteswap()
+    return codes
+
+
+@dataclass(frozen=True)
+class ArchiveGame:
+    """
+    Game of an archive, read without copying its moves.
+
+    ``setup`` and ``moves`` are views of the mapped file: they are valid
+    only while the archive is open.
+    """
+
+    index: int
+    size: int
+    komi: float | int
+    result: str | None
+    setup: Sequence[int]
+    moves: Sequence[int]
+
+    def to_record(self) -> GameRecord:
+        setup = [decode_move(code, self.size) for code in self.setup]
+        return GameRecord(
+            size=self.size,
+            komi=self.komi,
+            moves=tuple(decode_move(code, self.size) for code in self.moves),
+            black_stones=tuple(
+                move.position
+                for move in setup
+                if move.position and move.figure == Stone.BLACK
+            ),
+            white_stones=tuple(
+                move.position
+                for move in setup
+                if move.position and move.figure == Stone.WHITE
+            ),
+            result=self.result,
+        )
+
+    def move_history(self) -> MoveHistory:
+        return MoveHistory(decode_move(code, self.size) for code in self.moves)
+
+    def board(self, moves: int | None = None) -> Board:
+        """
+        Board after the first moves (all by default), replayed quickly.
+
+        The moves are trusted to be legal.
+        """
+        board = _start_board(self.size, self.setup)
+        points = board_points(self.size)
+        for code in self.moves[:moves]:
+            board._ko_point = 0
+            if code >> 1:
+                value = -1 if code & _WHITE_BIT else 1
+                board.play(points[(code >> 1) - 1], value)
+        result = Board._from_points(
+            self.size,
+            array("b", board._points),
+            board._white_captured,
+            board._black_captured,
+        )
+        result._ko_point = board._ko_point
+        result._ko_value = board._ko_value
+        return result
+
+
+class ArchiveWriter:
+    """
+    Writes games to a new archive, one at a time.
+
+    The index is written when the writer is closed; an archive that was not
+    closed cannot be read.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self._file: IO[bytes] = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION))
+        self._offsets = array("Q")
+        self._position = _HEADER.size
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def add(self, game: GameRecord) -> int:
+        """Adds the game and returns its index."""
+        if game.size not in AVAILABLE_SIZES:
+            raise ValueError("Not available size.")
+        if (game.komi * 2) % 1:
+            raise ValueError("Komi must be a multiple of 0.5.")
+        result = (game.result or "").encode()
+        if len(result) >= 255:
+            raise ValueError("Result is too long.")
+        setup = encode_moves(
+            [Move(position, Stone.BLACK) for position in game.black_stones]
+            + [Move(position, Stone.WHITE) for position in game.white_stones],
+            game.size,
+        )
+        moves = encode_moves(game.moves, game.size)
+        if sys.byteorder != "little":
+            setup.byteswap()
+            moves.byteswap()
+        header = _GAME.pack(
+            game.size,
+            len(result) if game.result is not None else 255,
+            int(game.komi * 2),
+            len(setup),
+            len(moves),
+        )
+        padding = b"\0" * (len(result) % 2)
+        data = b"".join(
+            (header, result, padding, setup.tobytes(), moves.tobytes())
+        )
+        self._file.write(data)
+        self._offsets.append(self._position)
+        self._position += len(data)
+        return len(self._offsets) - 1
+
+    def close(self):
+        if self._file.closed:
+            return
+        # The index starts on a multiple of 8 bytes.
+        padding = -self._position % 8
+        self._file.write(b"\0" * padding)
+        index_offset = self._position + padding
+        offsets = array("Q", self._offsets)
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        self._file.write(offsets.tobytes())
+        self._file.write(
+            _FOOTER.pack(index_offset, len(self._offsets), MAGIC)
+        )
+        self._file.close()
+
+
+def write_archive(
+    games: Iterable[GameRecord], path: str | os.PathLike
+) -> int:
+    """
+    Writes the games to a new archive.
+
+    Returns:
+        int: The number of games written.
+    """
+    with ArchiveWriter(path) as writer:
+        for game in games:
+            writer.add(game)
+        return len(writer)
+
+
+class Archive:
+    """
+    Archive of games, mapped in memory.
+
+    Reading game ``i`` looks up its offset in the index, so it is O(1) and
+    only touches the pages of that game. Moves are views of the mapping.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self._path = os.fspath(path)
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        data = memoryview(self._map)
+        try:
+            magic, version = _HEADER.unpack_from(data)
+            index_offset, count, end_magic = _FOOTER.unpack_from(
+                data, len(data) - _FOOTER.size
+            )
+        except struct.error:
+            magic = None
+        end = index_offset + count * 8 if magic else 0
+        if (
+            magic != MAGIC
+            or end_magic != MAGIC
+            or version != VERSION
+            or end != len(data) - _FOOTER.size
+        ):
+            data.release()
+            self._map.close()
+            raise ValueError("Invalid archive data.")
+
+        self._data = data
+        index = data[index_offset:end]
+        if sys.byteorder == "little":
+            self._offsets: Sequence[int] = index.cast("Q")
+        else:
+            offsets = array("Q", bytes(index))
+            offsets.byteswap()
+            self._offsets = offsets
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __enter__(self) -> "Archive":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._map.closed:
+            return
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._data.release()
+        try:
+            self._map.close()
+        except BufferError:
+            # Moves of some games are still referenced: the mapping is
+            # closed when they are freed.
+            pass
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> ArchiveGame:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Game index out of range.")
+        data = self._data
+        offset = self._offsets[index]
+        size, result_length, komi, setup_count, move_count = (
+            _GAME.unpack_from(data, offset)
+        )
+        offset += _GAME.size
+        result = None
+        if result_length != 255:
+            end = offset + result_length
+            result = bytes(data[offset:end]).decode()
+            offset += result_length + result_length % 2
+        end = offset + setup_count * 2
+        setup = _uint16(data[offset:end])
+        offset = end
+        end = offset + move_count * 2
+        moves = _uint16(data[offset:end])
+        return ArchiveGame(
+            index=index,
+            size=size,
+            komi=komi // 2 if komi % 2 == 0 else komi / 2,
+            result=result,
+            setup=setup,
+            moves=moves,
+        )
+
+    def __iter__(self) -> Iterator[ArchiveGame]:
+        return (self[index] for index in range(len(self)))
+
+    def records(self) -> Iterator[GameRecord]:
+        return (game.to_record() for game in self)
+
+    def sample_positions(
+        self, count: int, seed: int | None = None
+    ) -> list[tuple[int, int]]:
+        """
+        Picks random positions: pairs of a game and a number of moves.
+
+        Only the headers of the chosen games are read. ``game.board(moves)``
+        of the archive game builds the position.
+        """
+        if not len(self):
+            return []
+        rng = random.Random(seed)
+        data = self._data
+        offsets = self._offsets
+        positions = []
+        for _ in range(count):
+            index = rng.randrange(len(self))
+            move_count = _GAME.unpack_from(data, offsets[index])[4]
+            positions.append((index, rng.randint(0, move_count)))
+        return positions
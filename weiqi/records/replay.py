@@ -0,0 +1,269 @@
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from itertools import islice
+import os
+
+from weiqi.core.base_board import BLACK, EMPTY, WHITE, board_points
+from weiqi.core.figure import Stone
+from weiqi.core.move import Move, MoveHistory
+from weiqi.core.playout import PlayoutBoard
+from weiqi.core.zobrist import zobrist_keys
+from weiqi.records.archive import Archive, _start_board, encode_moves
+from weiqi.records.sgf import GameRecord
+from weiqi.utils.enums import KoRule
+from weiqi.utils.pool import imap_unordered
+
+# Size, komi, setup stones and moves, packed like in archives.
+_Task = tuple[int, float | int, bytes, bytes]
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    """Result of replaying a stored game."""
+
+    index: int
+    moves: int  # Moves replayed before the end or the first illegal move.
+    illegal_move: int | None  # Index of the first illegal move.
+    error: str | None  # Why that move is illegal, as raised by the game.
+    hash: int  # Zobrist hash of the last legal position, like Board.hash.
+    black_score: int
+    white_score: float | int  # With komi.
+
+    @property
+    def legal(self) -> bool:
+        return self.illegal_move is None
+
+
+def replay_game(
+    game: GameRecord | MoveHistory,
+    size: int = 19,
+    komi: float | int = 6.5,
+    ko_rule: KoRule | None = KoRule.POSITIONAL,
+    index: int = 0,
+) -> ReplayResult:
+    """
+    Replays a game without building moves or a game, checking every move.
+
+    Moves are checked like ``WeiqiGame.make_move`` does, except for the
+    turn order, so handicap stones played as moves are accepted. Records
+    carry their own size and komi; for move histories they are given.
+    """
+    size, komi, setup, moves = _task(game, size, komi)
+    return _replay(
+        size, komi, array("H", setup), array("H", moves), ko_rule, index
+    )
+
+
+def replay_games(
+    games: Iterable[GameRecord | MoveHistory],
+    size: int = 19,
+    komi: float | int = 6.5,
+    ko_rule: KoRule | None = KoRule.POSITIONAL,
+    workers: int | None = None,
+    batch_size: int = 256,
+) -> Iterator[ReplayResult]:
+    """
+    Replays games in worker processes, ``batch_size`` games per task.
+
+    Games are packed into move codes before they are sent, and only a few
+    batches per worker are read ahead, so the games can come from a lazy
+    reader like ``read_sgf``. Results are yielded as batches finish; their
+    ``index`` is the position of the game in ``games``.
+    """
+    batches = _batches(games, size, komi, ko_rule, batch_size)
+    return _run(_replay_batch, batches, workers)
+
+
+def replay_archive(
+    path: str | os.PathLike,
+    ko_rule: KoRule | None = KoRule.POSITIONAL,
+    workers: int | None = None,
+    batch_size: int = 1024,
+) -> Iterator[ReplayResult]:
+    """
+    Replays every game of an archive in worker processes.
+
+    Workers map the archive themselves and are only sent ranges of game
+    indices, so no moves go through the pipes.
+    """
+    with Archive(path) as archive:
+        count = len(archive)
+    ranges = (
+        (os.fspath(path), start, min(start + batch_size, count), ko_rule)
+        for start in range(0, count, batch_size)
+    )
+    return _run(_replay_archive_range, ranges, workers)
+
+
+def _run(
+    function: Callable[..., list[ReplayResult]],
+    tasks: Iterable[tuple],
+    workers: int | None,
+) -> Iterator[ReplayResult]:
+    """Runs the function with every task, a few tasks ahead per worker."""
+    for results in imap_unordered(function, tasks, workers, ahead=2):
+        yield from results
+
+
+def _batches(
+    games: Iterable[GameRecord | MoveHistory],
+    size: int,
+    komi: float | int,
+    ko_rule: KoRule | None,
+    batch_size: int,
+) -> Iterator[tuple]:
+    tasks = (_task(game, size, komi) for game in games)
+    start = 0
+    while batch := list(islice(tasks, batch_size)):
+        yield batch, ko_rule, start
+        start += len(batch)
+
+
+def _task(
+    game: GameRecord | MoveHistory, size: int, komi: float | int
+) -> _Task:
+    if not isinstance(game, GameRecord):
+        return size, komi, b"", encode_moves(game, size, False).tobytes()
+    setup = [Move(position, Stone.BLACK) for position in game.black_stones]
+    setup += [Move(position, Stone.WHITE) for position in game.white_stones]
+    return (
+        game.size,
+        game.komi,
+        encode_moves(setup, game.size, False).tobytes(),
+        encode_moves(game.moves, game.size, False).tobytes(),
+    )
+
+
+def _replay_batch(
+    batch: list[_Task], ko_rule: KoRule | None, start: int
+) -> list[ReplayResult]:
+    results = []
+    for index, (size, komi, setup, moves) in enumerate(batch, start):
+        results.append(
+            _replay(
+                size,
+                komi,
+                array("H", setup),
+                array("H", moves),
+                ko_rule,
+                index,
+            )
+        )
+    return results
+
+
+def _replay_archive_range(
+    path: str, start: int, stop: int, ko_rule: KoRule | None
+) -> list[ReplayResult]:
+    with Archive(path) as archive:
+        results = []
+        for index in range(start, stop):
+            game = archive[index]
+            results.append(
+                _replay(
+                    game.size,
+                    game.komi,
+                    game.setup,
+                    game.moves,
+                    ko_rule,
+                    index,
+                )
+            )
+            del game
+        return results
+
+
+def _replay(
+    size: int,
+    komi: float | int,
+    setup: Sequence[int],
+    codes: Sequence[int],
+    ko_rule: KoRule | None,
+    index: int,
+) -> ReplayResult:
+    board = _start_board(size, setup)
+    numbers = board_points(size)
+    limit = size * size
+    points = board._points
+    empties = board._empties
+    play = board.play
+    keys = zobrist_keys(size)
+    stone_keys = {BLACK: keys.black, WHITE: keys.white}
+    # With situational superko, positions with white to move differ.
+    side = keys.side if ko_rule == KoRule.SITUATIONAL else 0
+    position_hash = 0
+    for point, value in enumerate(points):
+        if value == BLACK or value == WHITE:
+            position_hash ^= stone_keys[value][point]
+    first = WHITE if codes and codes[0] & 1 else BLACK
+    seen = {position_hash ^ side if first == WHITE else position_hash}
+
+    illegal_move = None
+    error = None
+    count = 0
+    for code in codes:
+        value = WHITE if code & 1 else BLACK
+        number = code >> 1
+        if not number:
+            board._ko_point = 0
+            seen.add(position_hash ^ side if value == BLACK else position_hash)
+            count += 1
+            continue
+        if number > limit:
+            error = "Position out of bounds."
+            illegal_move = count
+            break
+        point = numbers[number - 1]
+        if points[point] != EMPTY:
+            error = "Intersection occupied by existing stone."
+        else:
+            if ko_rule is None:
+                board._ko_point = 0
+            before = len(empties)
+            if play(point, value):
+                new_hash = position_hash ^ stone_keys[value][point]
+                captured_keys = stone_keys[-value]
+                for captured in empties[before:]:
+                    new_hash ^= captured_keys[captured]
+                del empties[before:]
+                key = new_hash ^ side if value == BLACK else new_hash
+                if ko_rule is None or key not in seen:
+                    seen.add(key)
+                    position_hash = new_hash
+                    count += 1
+                    continue
+                error = "Move repeats a previous position (ko)."
+                # The stone is already placed: go back to the position
+                # before it.
+                board = _start_board(size, setup)
+                _play_legal(board, codes, count)
+            elif point == board._ko_point:
+                error = "Move repeats a previous position (ko)."
+            else:
+                error = "New group has zero liberties (suicide)"
+        illegal_move = count
+        break
+
+    black_score, white_score = board.score()
+    return ReplayResult(
+        index=index,
+        moves=count,
+        illegal_move=illegal_move,
+        error=error,
+        hash=position_hash,
+        black_score=black_score,
+        white_score=white_score + komi,
+    )
+
+
+def _play_legal(
+    board: PlayoutBoard, codes: Sequence[int], count: int
+) -> None:
+    """Plays the first moves again, known to be legal."""
+    numbers = board_points(board.size)
+    for code in islice(codes, count):
+        board._ko_point = 0
+        if code >> 1:
+            value = WHITE if code & 1 else BLACK
+            board.play(numbers[(code >> 1) - 1], value)
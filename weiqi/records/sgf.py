@@ -0,0 +1,374 @@
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import IO
+import io
+import os
+import re
+
+from weiqi.core.board import Board
+from weiqi.core.figure import Stone
+from weiqi.core.game import WeiqiGame
+from weiqi.core.move import Move, MoveHistory
+from weiqi.core.position import Position
+from weiqi.players.bot import BaseBot
+from weiqi.players.player import Player
+from weiqi.utils.enums import Winner
+
+# Characters that change the state of the game tree scanner.
+_SPECIAL = re.compile(r"[()\[\]]")
+_TOKEN = re.compile(
+    r"\s*(?:([()])|(;)|([A-Za-z]+)\s*((?:\[(?:[^\]\\]|\\.)*\]\s*)+))",
+    re.DOTALL,
+)
+_VALUE = re.compile(r"\[((?:[^\]\\]|\\.)*)\]", re.DOTALL)
+_ESCAPE = re.compile(r"\\(\r\n|\n\r|\n|\r|.)", re.DOTALL)
+
+_COLORS = {"B": Stone.BLACK, "W": Stone.WHITE}
+# Root properties read into the record fields, the rest are kept as is.
+_FIELDS = frozenset({"FF", "GM", "SZ", "KM", "RE", "AB", "AW", "B", "W"})
+
+
+@dataclass(frozen=True)
+class GameRecord:
+    """
+    Game read from or written to SGF: setup stones, main line and result.
+
+    Only the main line of the game tree is kept. ``properties`` holds the
+    other root properties, like the player names or the date.
+    """
+
+    size: int = 19
+    komi: float | int = 0
+    moves: tuple[Move, ...] = ()
+    black_stones: tuple[Position, ...] = ()
+    white_stones: tuple[Position, ...] = ()
+    result: str | None = None
+    properties: Mapping[str, tuple[str, ...]] = field(default_factory=dict)
+
+    @classmethod
+    def from_game(cls, game: WeiqiGame, **properties: str) -> "GameRecord":
+        """Record of a game that started on an empty board."""
+        status = game.game_status
+        result = None
+        if status.is_over:
+            result = _format_result(
+                status.winner, status.black_score, status.white_score
+            )
+        return cls(
+            size=game.board.size,
+            komi=game.komi,
+            moves=tuple(game.move_history),
+            result=result,
+            properties={key: (value,) for key, value in properties.items()},
+        )
+
+    def to_board(self) -> Board:
+        """Board with the setup stones, before the first move."""
+        figures: dict[Position, Stone | None] = {
+            Position.of(x, y): None
+            for y in range(self.size)
+            for x in range(self.size)
+        }
+        for stones, stone in (
+            (self.black_stones, Stone.BLACK),
+            (self.white_stones, Stone.WHITE),
+        ):
+            for position in stones:
+                if position not in figures:
+                    raise ValueError("Invalid positions.")
+                figures[position] = stone
+        return Board(figures)
+
+    def move_history(self) -> MoveHistory:
+        return MoveHistory(self.moves)
+
+    def to_game(
+        self,
+        player_black: Player | BaseBot | None = None,
+        player_white: Player | BaseBot | None = None,
+        **kwargs,
+    ) -> WeiqiGame:
+        """
+        Replays the main line in a new game.
+
+        Players default to human players; other arguments are passed to
+        ``WeiqiGame``. Illegal moves raise ValueError like in a live game.
+
+        As in ``replay_game``, the turn order is not checked: a pass of the
+        other color is added before a move out of turn, and moves after
+        two passes go on with the game.
+        """
+        game = WeiqiGame(
+            self.to_board(),
+            player_black or Player(Stone.BLACK),
+            player_white or Player(Stone.WHITE),
+            turn=self.moves[0].figure if self.moves else None,
+            komi=self.komi,
+            **kwargs,
+        )
+        for move in self.moves:
+            if game.game_status.is_over:
+                game.resume()
+            if move.figure != game.turn:
+                game.make_move(
+                    game.get_current_player(), Move(None, game.turn)
+                )
+                if game.game_status.is_over:
+                    game.resume()
+            game.make_move(game.get_current_player(), move)
+        return game
+
+    def to_sgf(self) -> str:
+        root: list[tuple[str, tuple[str, ...]]] = [
+            ("FF", ("4",)),
+            ("GM", ("1",)),
+            ("SZ", (str(self.size),)),
+        ]
+        root.append(("KM", (_format_number(self.komi),)))
+        if self.result is not None:
+            root.append(("RE", (self.result,)))
+        root.extend(
+            (key, tuple(values)) for key, values in self.properties.items()
+        )
+        if self.black_stones:
+            root.append(("AB", tuple(map(_format_point, self.black_stones))))
+        if self.white_stones:
+            root.append(("AW", tuple(map(_format_point, self.white_stones))))
+
+        parts = ["(;"]
+        for key, values in root:
+            parts.append(key)
+            parts.extend(f"[{_escape(value)}]" for value in values)
+        for move in self.moves:
+            color = "B" if move.figure == Stone.BLACK else "W"
+            point = (
+                "" if move.position is None else _format_point(move.position)
+            )
+            parts.append(f";{color}[{point}]")
+        parts.append(")")
+        return "".join(parts)
+
+
+def read_sgf(
+    source: str | os.PathLike | IO[str],
+    chunk_size: int = 1 << 16,
+    encoding: str = "utf-8",
+) -> Iterator[GameRecord]:
+    """
+    Reads the games of an SGF collection one by one.
+
+    The file is read in chunks and every game tree is parsed as soon as it
+    is complete, so only one game is held in memory at a time. ``source``
+    is a path or an open text file.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding=encoding) as file:
+            yield from read_sgf(file, chunk_size)
+        return
+    for tree in _game_trees(source, chunk_size):
+        yield _parse_tree(tree)
+
+
+def parse_sgf(text: str) -> list[GameRecord]:
+    """Parses all the games of an SGF string."""
+    return list(read_sgf(io.StringIO(text)))
+
+
+def write_sgf(
+    records: Iterable[GameRecord],
+    target: str | os.PathLike | IO[str],
+    encoding: str = "utf-8",
+) -> int:
+    """
+    Writes the records as an SGF collection, one game per line.
+
+    Returns:
+        int: The number of games written.
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding=encoding) as file:
+            return write_sgf(records, file)
+    count = 0
+    for record in records:
+        target.write(record.to_sgf())
+        target.write("\n")
+        count += 1
+    return count
+
+
+def _game_trees(file: IO[str], chunk_size: int) -> Iterator[str]:
+    """Splits the text of the file into top-level game trees."""
+    buffer = ""
+    start = 0  # Start of the tree being read in the buffer.
+    depth = 0
+    in_value = False
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        offset = len(buffer)
+        buffer += chunk
+        for match in _SPECIAL.finditer(buffer, offset):
+            char = match.group()
+            index = match.start()
+            if in_value:
+                if char == "]" and not _is_escaped(buffer, index):
+                    in_value = False
+            elif depth == 0:
+                # Text between the game trees is ignored.
+                if char == "(":
+                    start = index
+                    depth = 1
+            elif char == "[":
+                in_value = True
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth == 0:
+                    end = index + 1
+                    yield buffer[start:end]
+        # Keep only the tree being read.
+        buffer = buffer[start:] if depth else ""
+        start = 0
+    if depth:
+        raise ValueError("Invalid SGF data.")
+
+
+def _is_escaped(text: str, index: int) -> bool:
+    """Checks if the character is preceded by an odd number of backslashes."""
+    count = 0
+    index -= 1
+    while index >= 0 and text[index] == "\\":
+        count += 1
+        index -= 1
+    return count % 2 == 1
+
+
+def _parse_tree(tree: str) -> GameRecord:
+    nodes: list[dict[str, list[str]]] = []
+    position = 0
+    while position < len(tree):
+        match = _TOKEN.match(tree, position)
+        if match is None:
+            if tree[position:].strip():
+                raise ValueError("Invalid SGF data.")
+            break
+        position = match.end()
+        paren, node, key, values = match.groups()
+        if paren == ")":
+            # The first variation closed: the main line is complete.
+            break
+        if node:
+            nodes.append({})
+        elif key:
+            if not nodes:
+                raise ValueError("Invalid SGF data.")
+            # Old files mix lowercase letters into the identifiers.
+            if not key.isupper():
+                key = "".join(char for char in key if char.isupper())
+            nodes[-1].setdefault(key, []).extend(
+                _unescape(value) for value in _VALUE.findall(values)
+            )
+    if not nodes:
+        raise ValueError("Invalid SGF data.")
+
+    root = nodes[0]
+    if root.get("GM", ["1"])[0] != "1":
+        raise ValueError("Only Go games are supported.")
+    try:
+        size = int(root.get("SZ", ["19"])[0])
+        komi = _parse_number(root["KM"][0]) if root.get("KM") else 0
+    except ValueError:
+        raise ValueError("Invalid SGF data.") from None
+
+    moves = []
+    for number, node in enumerate(nodes):
+        if number and ("AB" in node or "AW" in node):
+            raise ValueError("Setup stones are only supported in the root.")
+        for color in _COLORS:
+            for value in node.get(color, ()):
+                moves.append(Move(_parse_point(value, size), _COLORS[color]))
+
+    return GameRecord(
+        size=size,
+        komi=komi,
+        moves=tuple(moves),
+        black_stones=_parse_points(root.get("AB", ()), size),
+        white_stones=_parse_points(root.get("AW", ()), size),
+        result=root["RE"][0] if root.get("RE") else None,
+        properties={
+            key: tuple(values)
+            for key, values in root.items()
+            if key not in _FIELDS
+        },
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_point(value: str, size: int) -> Position | None:
+    value = value.strip()
+    # "tt" is the old pass for boards up to 19x19.
+    if not value or (value == "tt" and size <= 19):
+        return None
+    if len(value) != 2 or not value.isalpha() or not value.islower():
+        raise ValueError("Invalid SGF point.")
+    return Position.of(ord(value[0]) - ord("a"), ord(value[1]) - ord("a"))
+
+
+def _parse_points(values: Iterable[str], size: int) -> tuple[Position, ...]:
+    """Parses a list of points, with ``aa:cc`` rectangles expanded."""
+    positions: list[Position] = []
+    for value in values:
+        first, _, last = value.partition(":")
+        start = _parse_point(first, size)
+        end = _parse_point(last, size) if last else start
+        if start is None or end is None:
+            raise ValueError("Invalid SGF point.")
+        positions.extend(
+            Position.of(x, y)
+            for y in range(start.y, end.y + 1)
+            for x in range(start.x, end.x + 1)
+        )
+    return tuple(positions)
+
+
+def _parse_number(value: str) -> float | int:
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def _format_number(value: float | int) -> str:
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+def _format_point(position: Position) -> str:
+    return chr(ord("a") + position.x) + chr(ord("a") + position.y)
+
+
+def _format_result(
+    winner: Winner | None,
+    black_score: int | None,
+    white_score: float | int | None,
+) -> str | None:
+    if winner is None:
+        return None
+    if winner == Winner.DRAW:
+        return "0"
+    color = "B" if winner == Winner.BLACK else "W"
+    if black_score is None or white_score is None:
+        return f"{color}+R"
+    return f"{color}+{_format_number(abs(black_score - white_score))}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("]", "\\]")
+
+
+def _unescape(value: str) -> str:
+    # Escaped line breaks are soft breaks and disappear.
+    return _ESCAPE.sub(
+        lambda match: "" if match.group(1)[0] in "\r\n" else match.group(1),
+        value,
+    )
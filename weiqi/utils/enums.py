@@ -5,3 +5,15 @@ class Winner(Enum):
     BLACK = 1
     WHITE = 2
     DRAW = 3
+
+
+class KoRule(Enum):
+    """
+    Superko rules.
+
+    Positional superko forbids a move that repeats any earlier board
+    position, situational superko only one with the same player to move.
+    """
+
+    POSITIONAL = 1
+    SITUATIONAL = 2
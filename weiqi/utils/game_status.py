@@ -2,6 +2,8 @@ from weiqi.utils.enums import Winner
 
 
 class GameStatus:
+    __slots__ = ("_is_over", "_winner", "_black_score", "_white_score")
+
     def __init__(
         self,
         is_over: bool,
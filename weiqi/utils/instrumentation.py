@@ -0,0 +1,217 @@
+"""
+Opt-in counters and timers for the board, the game and the bots.
+
+Nothing is measured until ``enable`` is called: it wraps the measured
+methods in place, and ``disable`` puts the original methods back, so there
+is no cost at all while instrumentation is off.
+
+Counters are process-wide and safe to update from many threads. ``record``
+measures a block of code, like the handling of one request; work done by
+other threads during the block is counted too, and blocks may overlap.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import wraps
+from typing import Any
+import threading
+import time
+
+from weiqi.core.base_board import BaseBoard
+from weiqi.core.board import Board, BoardSnapshot
+from weiqi.core.game import WeiqiGame
+from weiqi.players.bot import BaseBot
+
+
+@dataclass
+class Counter:
+    calls: int = 0
+    seconds: float = 0.0
+    # Points visited by the call, for searches and floods.
+    nodes: int = 0
+
+
+# Every counter, by the name it is reported under.
+NAMES = (
+    "group_at_position",  # chain_at queries, nodes are the chain stones.
+    "find_territories",  # Territory queries, nodes are the empty points.
+    "territory_floods",  # Region floods of Board, nodes are the points.
+    "play",  # Moves and passes on a Board, nodes are the captured stones.
+    "undo",  # Moves taken back by the game or by a search.
+    "board_copies",  # Point arrays copied away from a snapshot.
+    "game_board",  # Snapshots of the board handed out by WeiqiGame.board.
+    "bot_moves",  # Time bots spent in make_move, thinking included.
+)
+
+_counters = {name: Counter() for name in NAMES}
+_lock = threading.Lock()  # Guards the counters.
+# Attributes replaced by the wrappers: owner, name and original value, None
+# for inherited methods.
+_patched: list[tuple[type, str, Any]] = []
+# Open record blocks, and whether they enabled instrumentation themselves.
+_records = 0
+_records_enabled = False
+_records_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+def snapshot() -> dict[str, dict[str, float]]:
+    """Copy of every counter, as plain dictionaries."""
+    with _lock:
+        return {name: asdict(counter) for name, counter in _counters.items()}
+
+
+def reset():
+    with _lock:
+        for name in NAMES:
+            _counters[name] = Counter()
+
+
+def enable():
+    """Starts measuring; the counters keep their values."""
+    if _patched:
+        return
+    _patch(
+        BaseBoard,
+        "_group_at_position",
+        lambda args, group: len(group.positions),
+    )
+    # Only the final classes are wrapped, so a call going up to the base
+    # class is counted once.
+    for owner in (Board, BoardSnapshot):
+        _patch(
+            owner,
+            "find_territories",
+            lambda args, territories: sum(map(len, territories.values())),
+        )
+    _patch(
+        Board,
+        "_update_territories",
+        lambda args, flooded: flooded,
+        name="territory_floods",
+    )
+    _patch(Board, "play", lambda args, delta: len(delta.captured))
+    _patch(Board, "undo")
+    _patch_before_change()
+    _patch_game_board()
+    for bot_class in _subclasses(BaseBot):
+        if "make_move" in vars(bot_class):
+            _patch(bot_class, "make_move", name="bot_moves")
+
+
+def disable():
+    """Stops measuring and puts the original methods back."""
+    while _patched:
+        owner, name, original = _patched.pop()
+        if original is None:
+            # The method was inherited.
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+
+
+@contextmanager
+def record() -> Iterator[dict[str, dict[str, float]]]:
+    """
+    Measures the block and fills the yielded dictionary with the counters
+    of the work done in it, when the block ends.
+
+    Instrumentation is enabled for the block if it was not already, and
+    disabled again when the last of the overlapping blocks ends.
+    """
+    global _records, _records_enabled
+    with _records_lock:
+        if not _records and not is_enabled():
+            enable()
+            _records_enabled = True
+        _records += 1
+    start = snapshot()
+    result: dict[str, dict[str, float]] = {}
+    try:
+        yield result
+    finally:
+        for name, values in snapshot().items():
+            result[name] = {
+                key: value - start[name][key] for key, value in values.items()
+            }
+        with _records_lock:
+            _records -= 1
+            if not _records and _records_enabled:
+                _records_enabled = False
+                disable()
+
+
+def _subclasses(cls: type) -> Iterator[type]:
+    subclass: type
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def _patch(
+    owner: type,
+    attribute: str,
+    nodes: Callable[[tuple, Any], int] | None = None,
+    name: str | None = None,
+):
+    """Replaces the method with one timing its calls."""
+    function = getattr(owner, attribute)
+    counter_name = name or attribute.lstrip("_")
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except BaseException:
+            _count(counter_name, time.perf_counter() - start)
+            raise
+        seconds = time.perf_counter() - start
+        _count(counter_name, seconds, nodes(args, result) if nodes else 0)
+        return result
+
+    _patched.append((owner, attribute, vars(owner).get(attribute)))
+    setattr(owner, attribute, wrapper)
+
+
+def _count(name: str, seconds: float, nodes: int = 0):
+    """Adds a call to the counter."""
+    with _lock:
+        counter = _counters[name]
+        counter.calls += 1
+        counter.seconds += seconds
+        counter.nodes += nodes
+
+
+def _patch_before_change():
+    function = vars(Board)["_before_change"]
+
+    @wraps(function)
+    def wrapper(self: Board):
+        if self._snapshot is None:
+            return function(self)
+        start = time.perf_counter()
+        function(self)
+        _count("board_copies", time.perf_counter() - start, len(self._points))
+
+    _patched.append((Board, "_before_change", function))
+    setattr(Board, "_before_change", wrapper)
+
+
+def _patch_game_board():
+    board_property = vars(WeiqiGame)["board"]
+    getter = board_property.fget
+
+    @wraps(getter)
+    def wrapper(self: WeiqiGame):
+        start = time.perf_counter()
+        board = getter(self)
+        _count("game_board", time.perf_counter() - start)
+        return board
+
+    _patched.append((WeiqiGame, "board", board_property))
+    setattr(WeiqiGame, "board", property(wrapper, doc=board_property.__doc__))
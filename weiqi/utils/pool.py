@@ -0,0 +1,43 @@
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor
+from concurrent.futures import wait
+from itertools import islice
+from typing import TypeVar
+import os
+
+T = TypeVar("T")
+
+
+def imap_unordered(
+    function: Callable[..., T],
+    tasks: Iterable[tuple],
+    workers: int | None = None,
+    ahead: int = 4,
+) -> Iterator[T]:
+    """
+    Runs the function with every tuple of arguments in a process pool.
+
+    Only ``ahead`` tasks per worker are submitted in advance, so long or
+    endless task streams are fine. Results are yielded as the tasks finish,
+    not in order. With one worker, the tasks run in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for task in tasks:
+            yield function(*task)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending: set[Future[T]] = set()
+        iterator = iter(tasks)
+        while True:
+            for task in islice(iterator, workers * ahead - len(pending)):
+                pending.add(executor.submit(function, *task))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)